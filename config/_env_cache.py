@@ -0,0 +1,13 @@
+"""
+Environment variable cache for Bloomberg RAG System.
+
+Reads the agent-related environment variables once at import time and
+exposes them as typed module-level constants.
+"""
+
+import os
+
+# Model settings (can be overridden via .env)
+MODEL_NAME = os.environ.get("MODEL_NAME", "openai/gpt-4o")
+TEMPERATURE = float(os.environ.get("TEMPERATURE", "0.7"))
+MAX_TOKENS = int(os.environ.get("MAX_TOKENS", "4000"))  # Increased for longer RAG responses
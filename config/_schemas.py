@@ -0,0 +1,221 @@
+"""
+Configuration schemas for Bloomberg RAG System.
+
+Pure dataclass definitions, no instantiation. Imported on demand by
+config.settings the first time a configuration is requested.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config.settings import DATA_DIR, LOGS_DIR, BACKUPS_DIR, _get_openai_key
+
+
+# ============================================================================
+# OUTLOOK CONFIGURATION
+# ============================================================================
+
+@dataclass
+class OutlookConfig:
+    """Outlook email extraction settings."""
+    
+    # Folder paths in Outlook (relative to Inbox or absolute)
+    source_folder: str = "Inbox/Bloomberg"
+    indexed_folder: str = "Inbox/Bloomberg/indexed"
+    stubs_folder: str = "Inbox/Bloomberg/stubs"
+    processed_folder: str = "Inbox/Bloomberg/processed"
+    
+    # Processing limits
+    max_emails_per_sync: int = 100
+    
+    # Date filtering (optional)
+    days_back: Optional[int] = None  # None = no limit
+
+
+# ============================================================================
+# EMBEDDING CONFIGURATION
+# ============================================================================
+
+@dataclass
+class EmbeddingConfig:
+    """Sentence transformer model settings."""
+    
+    # Model name (English-only for best performance)
+    model_name: str = "all-mpnet-base-v2"
+    
+    # Device to use
+    device: str = "cpu"  # or "cuda" if GPU available
+    
+    # Batch size for encoding
+    batch_size: int = 32
+    
+    # Normalize embeddings (required for FAISS)
+    normalize_embeddings: bool = True
+    
+    # Expected embedding dimension
+    embedding_dim: int = 768  # for all-mpnet-base-v2
+
+
+# ============================================================================
+# VECTOR STORE CONFIGURATION
+# ============================================================================
+
+@dataclass
+class VectorStoreConfig:
+    """FAISS vector store settings."""
+    
+    # Index type
+    index_type: str = "IndexFlatL2"  # or "IndexIVFFlat" for larger datasets
+    
+    # Persistence paths
+    index_path: Path = DATA_DIR / "faiss_index.bin"
+    metadata_path: Path = DATA_DIR / "documents_metadata.json"
+    hnsw_index_path: Path = DATA_DIR / "faiss_index_hnsw.bin"
+    bm25_index_path: Path = DATA_DIR / "bm25_index.npz"
+    
+    # Search settings
+    default_top_k: int = 20
+    
+    # HNSW graph for search (built on first use from the flat index)
+    hnsw_min_vectors: int = 50_000  # below this, exact flat search is fast enough
+    hnsw_m: int = 32  # graph degree
+
+
+# ============================================================================
+# RETRIEVAL CONFIGURATION
+# ============================================================================
+
+@dataclass
+class RetrievalConfig:
+    """Hybrid retrieval settings."""
+    
+    # Temporal scoring
+    recency_weight: float = 0.3  # weight for recency (0.0-1.0)
+    temporal_halflife_days: int = 30  # days for score to halve
+    
+    # Score fusion: "weighted" (uses recency_weight) or "rrf" (Reciprocal Rank Fusion)
+    score_fusion: str = "weighted"
+    rrf_k: int = 60  # RRF rank constant
+    
+    # BM25 keyword candidates unioned with FAISS candidates with RRF fusion
+    # (scripts/search.py; the keyword index is saved at sync)
+    enable_bm25: bool = True
+    
+    # Default search params
+    default_top_k: int = 20
+    
+    # Metadata filtering
+    enable_topic_filter: bool = True
+    enable_people_filter: bool = True
+    enable_date_filter: bool = True
+    enable_ticker_filter: bool = True
+    
+    # Resident search daemon (scripts/search_daemon.py), localhost only
+    daemon_host: str = "127.0.0.1"
+    daemon_port: int = 47321
+    daemon_token_path: Path = DATA_DIR / "search_daemon.token"  # readable by the user only
+
+
+# ============================================================================
+# GOOGLE ADK TOOLS CONFIGURATION
+# ============================================================================
+
+@dataclass
+class ToolConfig:
+    """Google ADK Tools configuration."""
+    
+    # Result limits
+    max_articles_per_call: int = 40  # max articles returned by any tool
+    max_snippet_length: int = 200  # max characters for article snippet
+    
+    # Retrieval defaults (before limiting results)
+    default_top_k: int = 20  # retrieve 20, then limit to max_articles_per_call
+    
+    # Response settings
+    include_full_content: bool = True  # if True, include full article body instead of snippet
+    
+    # Caching (optional for MVP)
+    enable_caching: bool = False
+    cache_ttl_seconds: int = 300  # 5 minutes
+    
+    # Timezone for datetime tool
+    timezone: str = "UTC"
+
+
+# ============================================================================
+# GOOGLE ADK AGENT CONFIGURATION
+# ============================================================================
+
+# Default tool set (immutable, shared by all AgentConfig instances).
+# Filter tools (semantic_search, filter_by_date, filter_by_topic,
+# filter_by_people, filter_by_ticker) are disabled as too restrictive.
+DEFAULT_ENABLED_TOOLS: Tuple[str, ...] = (
+    "hybrid_search",
+    "get_current_datetime",
+)
+
+
+@dataclass
+class AgentConfig:
+    """Google ADK Agent configuration."""
+    
+    # Model settings (via LiteLLM)
+    model_name: str = "openai/gpt-4o"  # LiteLLM format
+    
+    # API Keys (from environment)
+    openai_api_key: Optional[str] = field(default_factory=_get_openai_key)
+    
+    # Session settings
+    session_type: str = "memory"  # "memory" or "persistent"
+    
+    # Response settings
+    max_tokens: int = 2000
+    temperature: float = 0.7
+    
+    # Tool settings
+    enable_all_tools: bool = True
+    enabled_tools: Tuple[str, ...] = DEFAULT_ENABLED_TOOLS
+
+
+# ============================================================================
+# PERSISTENCE CONFIGURATION
+# ============================================================================
+
+@dataclass
+class PersistenceConfig:
+    """Data persistence settings."""
+    
+    # File paths
+    emails_pickle: Path = DATA_DIR / "emails.pkl"
+    stub_registry_json: Path = DATA_DIR / "stub_registry.json"
+    last_sync_json: Path = DATA_DIR / "last_sync.json"
+    stub_rebuild_json: Path = DATA_DIR / "stub_rebuild.json"  # folder stamps of last registry rebuild
+    fingerprint_cache_json: Path = DATA_DIR / "fingerprint_cache.json"  # /indexed/ fingerprints by EntryID
+    stats_summary_json: Path = DATA_DIR / "stats_summary.json"  # topic/author counts for status
+    
+    # Backup settings
+    enable_backup: bool = True
+    backup_dir: Path = BACKUPS_DIR
+    max_backups: int = 5
+
+
+# ============================================================================
+# LOGGING CONFIGURATION
+# ============================================================================
+
+@dataclass
+class LoggingConfig:
+    """Logging settings."""
+    
+    # Log file
+    log_file: Path = LOGS_DIR / "bloomberg_rag.log"
+    
+    # Log level
+    log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+    
+    # Format
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    
+    # Console logging
+    console_logging: bool = True
@@ -5,6 +5,9 @@ Replaces problematic Unicode characters in Python source files.
 """
 
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Unicode character replacements
@@ -14,6 +17,41 @@ REPLACEMENTS = {
     '→': 'to',
 }
 
+# Single-pass replacement strategy:
+# - str.translate (C loop) when every key is a single character
+# - a precompiled alternation regex otherwise (multi-character keys);
+#   longest keys first so overlapping patterns match greedily
+if all(len(old_char) == 1 for old_char in REPLACEMENTS):
+    _TRANSLATE_TABLE = str.maketrans(REPLACEMENTS)
+    _PATTERN = None
+else:
+    _TRANSLATE_TABLE = None
+    _PATTERN = re.compile('|'.join(
+        re.escape(old_char) for old_char in sorted(REPLACEMENTS, key=len, reverse=True)
+    ))
+
+
+def replace_all(content: str) -> str:
+    """
+    Apply all REPLACEMENTS to content in a single scan.
+    
+    Args:
+        content: Text to fix
+        
+    Returns:
+        Text with problematic characters replaced
+    """
+    if _TRANSLATE_TABLE is not None:
+        return content.translate(_TRANSLATE_TABLE)
+    return _PATTERN.sub(lambda match: REPLACEMENTS[match.group(0)], content)
+
+# UTF-8 encoded forms, used to skip decoding files without any match
+_UTF8_SEQUENCES = tuple(char.encode('utf-8') for char in REPLACEMENTS)
+
+# Files are processed concurrently; keep per-file output lines intact
+_print_lock = threading.Lock()
+
+
 def fix_file(filepath: Path) -> bool:
     """
     Fix Unicode characters in a single file.
@@ -25,28 +63,32 @@ def fix_file(filepath: Path) -> bool:
         True if file was modified, False otherwise
     """
     try:
-        # Read file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read raw bytes and bail out early if nothing to replace
+        raw = filepath.read_bytes()
+        
+        if not any(seq in raw for seq in _UTF8_SEQUENCES):
+            return False
+        
+        content = raw.decode('utf-8')
         
-        original_content = content
+        with _print_lock:
+            for old_char, new_char in REPLACEMENTS.items():
+                if old_char in content:
+                    print(f"  Replaced '{old_char}' with '{new_char}' in {filepath.name}")
         
-        # Replace problematic characters
-        for old_char, new_char in REPLACEMENTS.items():
-            if old_char in content:
-                content = content.replace(old_char, new_char)
-                print(f"  Replaced '{old_char}' with '{new_char}' in {filepath.name}")
+        # Replace problematic characters in a single pass
+        new_content = replace_all(content)
         
         # Write back if changed
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+        if new_content != content:
+            filepath.write_bytes(new_content.encode('utf-8'))
             return True
         
         return False
         
     except Exception as e:
-        print(f"  ERROR processing {filepath}: {e}")
+        with _print_lock:
+            print(f"  ERROR processing {filepath}: {e}")
         return False
 
 
@@ -66,21 +108,22 @@ def main():
         project_root / 'scripts',
     ]
     
-    files_modified = 0
-    files_scanned = 0
-    
+    # Collect all Python files first
+    py_files = []
     for scan_dir in scan_dirs:
         if not scan_dir.exists():
             continue
         
         print(f"Scanning {scan_dir}...")
-        
-        # Find all Python files
-        for py_file in scan_dir.rglob('*.py'):
-            files_scanned += 1
-            
-            if fix_file(py_file):
-                files_modified += 1
+        py_files.extend(scan_dir.rglob('*.py'))
+    
+    # File processing is I/O-bound and independent per file
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fix_file, py_files))
+    
+    files_scanned = len(py_files)
+    files_modified = sum(results)
     
     print()
     print("="*60)
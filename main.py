@@ -19,15 +19,18 @@ Usage:
 
 import sys
 import argparse
+import importlib
 from pathlib import Path
-import subprocess
 
 PROJECT_ROOT = Path(__file__).parent
 
 
 def run_script(script_name: str, args: list) -> int:
     """
-    Run a script with arguments.
+    Run a script's main() in-process with arguments.
+    
+    The script module is imported on demand, so commands only pay the
+    import cost of the script they actually run.
     
     Args:
         script_name: Name of the script to run
@@ -36,122 +39,129 @@ def run_script(script_name: str, args: list) -> int:
     Returns:
         Exit code
     """
-    script_path = PROJECT_ROOT / 'scripts' / script_name
-    cmd = [sys.executable, str(script_path)] + args
+    module_name = 'scripts.' + Path(script_name).stem
+    script = importlib.import_module(module_name)
     
-    result = subprocess.run(cmd)
-    return result.returncode
+    return script.main(args)
 
 
-def cmd_sync(args) -> int:
-    """Execute sync command."""
-    script_args = []
+# ============================================================================
+# ARGUMENT FORWARDING
+# ============================================================================
+
+# Per-command (namespace attribute, script option, kind) forwarding rules.
+# kind: 'flag' (store_true), 'value' (single value), 'list' (nargs='+')
+_SYNC_ARGS = [
+    ('max_emails', '--max-emails', 'value'),
+    ('verbose', '--verbose', 'flag'),
+]
+
+_STATUS_ARGS = [
+    ('detailed', '--detailed', 'flag'),
+    ('json', '--json', 'flag'),
+]
+
+_SEARCH_ARGS = [
+    ('top_k', '--top-k', 'value'),
+    ('weight', '--weight', 'value'),
+    ('fusion', '--fusion', 'value'),
+    ('exact_rerank_k', '--exact-rerank-k', 'value'),
+    ('start_date', '--start-date', 'value'),
+    ('end_date', '--end-date', 'value'),
+    ('topics', '--topics', 'list'),
+    ('people', '--people', 'list'),
+    ('tickers', '--tickers', 'list'),
+    ('no_daemon', '--no-daemon', 'flag'),
+    ('json', '--json', 'flag'),
+    ('full_body', '--full-body', 'flag'),
+    ('queries_file', '--queries-file', 'value'),
+]
+
+_CLEANUP_ARGS = [
+    ('delete_old_stubs', '--delete-old-stubs', 'value'),
+    ('archive_processed', '--archive-processed', 'value'),
+    ('rebuild_registry', '--rebuild-registry', 'flag'),
+    ('all', '--all', 'flag'),
+    ('dry_run', '--dry-run', 'flag'),
+    ('yes', '--yes', 'flag'),
+    ('verbose', '--verbose', 'flag'),
+]
+
+_RESET_ARGS = [
+    ('force', '--force', 'flag'),
+]
+
+
+def _build_args(args, arg_map: list) -> list:
+    """
+    Build a script argument list from parsed CLI arguments.
     
-    if args.max_emails:
-        script_args.extend(['--max-emails', str(args.max_emails)])
+    Unset (falsy) arguments are not forwarded.
     
-    if args.verbose:
-        script_args.append('--verbose')
+    Args:
+        args: Parsed argparse namespace
+        arg_map: List of (attribute, option, kind) tuples
+        
+    Returns:
+        List of arguments for the script
+    """
+    script_args = []
     
-    return run_script('sync_emails.py', script_args)
+    for attr, option, kind in arg_map:
+        value = getattr(args, attr)
+        if not value:
+            continue
+        
+        if kind == 'flag':
+            script_args.append(option)
+        elif kind == 'list':
+            script_args.append(option)
+            script_args.extend(value)
+        else:
+            script_args.extend([option, str(value)])
+    
+    return script_args
+
+
+def cmd_sync(args) -> int:
+    """Execute sync command."""
+    return run_script('sync_emails.py', _build_args(args, _SYNC_ARGS))
 
 
 def cmd_status(args) -> int:
     """Execute status command."""
-    script_args = []
-    
-    if args.detailed:
-        script_args.append('--detailed')
-    
-    return run_script('status.py', script_args)
+    return run_script('status.py', _build_args(args, _STATUS_ARGS))
 
 
 def cmd_search(args) -> int:
     """Execute search command."""
-    script_args = []
-    
     if args.interactive:
-        script_args.append('--interactive')
+        script_args = ['--interactive']
     elif args.query:
-        script_args.append(args.query)
+        script_args = [args.query]
+    elif args.queries_file:
+        script_args = []
     else:
-        print("Error: Provide --query or use --interactive mode")
+        print("Error: Provide --query, --queries-file or use --interactive mode")
         return 1
     
-    if args.top_k:
-        script_args.extend(['--top-k', str(args.top_k)])
-    
-    if args.weight:
-        script_args.extend(['--weight', str(args.weight)])
-    
-    if args.start_date:
-        script_args.extend(['--start-date', args.start_date])
-    
-    if args.end_date:
-        script_args.extend(['--end-date', args.end_date])
-    
-    if args.topics:
-        script_args.extend(['--topics'] + args.topics)
-    
-    if args.people:
-        script_args.extend(['--people'] + args.people)
-    
-    if args.tickers:
-        script_args.extend(['--tickers'] + args.tickers)
+    script_args.extend(_build_args(args, _SEARCH_ARGS))
     
     return run_script('search.py', script_args)
 
 
 def cmd_cleanup(args) -> int:
     """Execute cleanup command."""
-    script_args = []
-    
-    if args.delete_old_stubs:
-        script_args.extend(['--delete-old-stubs', str(args.delete_old_stubs)])
-    
-    if args.archive_processed:
-        script_args.extend(['--archive-processed', str(args.archive_processed)])
-    
-    if args.rebuild_registry:
-        script_args.append('--rebuild-registry')
-    
-    if args.all:
-        script_args.append('--all')
-    
-    if args.dry_run:
-        script_args.append('--dry-run')
-    
-    return run_script('cleanup.py', script_args)
+    return run_script('cleanup.py', _build_args(args, _CLEANUP_ARGS))
 
 
 def cmd_reset(args) -> int:
     """Execute reset command."""
-    script_args = []
-    
-    if args.force:
-        script_args.append('--force')
-    
-    return run_script('reset_system.py', script_args)
+    return run_script('reset_system.py', _build_args(args, _RESET_ARGS))
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog='main.py',
-        description='Bloomberg RAG - Unified CLI',
-        epilog='Run "main.py <command> --help" for command-specific help'
-    )
-    
-    subparsers = parser.add_subparsers(
-        title='commands',
-        description='Available commands',
-        dest='command',
-        required=True
-    )
-    
-    # ========================================================================
-    # SYNC COMMAND
-    # ========================================================================
+def _add_sync_parser(subparsers) -> None:
+    """Register the sync command."""
     sync_parser = subparsers.add_parser(
         'sync',
         help='Synchronize emails from Outlook',
@@ -168,10 +178,10 @@ def main():
         help='Verbose logging'
     )
     sync_parser.set_defaults(func=cmd_sync)
-    
-    # ========================================================================
-    # STATUS COMMAND
-    # ========================================================================
+
+
+def _add_status_parser(subparsers) -> None:
+    """Register the status command."""
     status_parser = subparsers.add_parser(
         'status',
         help='Show system status',
@@ -182,11 +192,16 @@ def main():
         action='store_true',
         help='Show detailed statistics (top topics, authors)'
     )
+    status_parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Output the status data as JSON'
+    )
     status_parser.set_defaults(func=cmd_status)
-    
-    # ========================================================================
-    # SEARCH COMMAND
-    # ========================================================================
+
+
+def _add_search_parser(subparsers) -> None:
+    """Register the search command."""
     search_parser = subparsers.add_parser(
         'search',
         help='Search indexed emails',
@@ -212,6 +227,16 @@ def main():
         type=float,
         help='Recency weight 0.0-1.0 (default: 0.3)'
     )
+    search_parser.add_argument(
+        '--fusion',
+        choices=['weighted', 'rrf'],
+        help='Score fusion: weighted (uses --weight) or rrf (Reciprocal Rank Fusion)'
+    )
+    search_parser.add_argument(
+        '--exact-rerank-k',
+        type=int,
+        help='HNSW shortlist size re-ranked exactly on large indices (default: 4 x top-k)'
+    )
     search_parser.add_argument(
         '--start-date',
         help='Start date filter (YYYY-MM-DD)'
@@ -235,11 +260,30 @@ def main():
         nargs='+',
         help='Ticker filters'
     )
+    search_parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Search in-process even if scripts/search_daemon.py is running'
+    )
+    search_parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print results as a JSON array'
+    )
+    search_parser.add_argument(
+        '--full-body',
+        action='store_true',
+        help='With --json, include the full body text'
+    )
+    search_parser.add_argument(
+        '--queries-file',
+        help='Run every query in this file (one per line) as one batch'
+    )
     search_parser.set_defaults(func=cmd_search)
-    
-    # ========================================================================
-    # CLEANUP COMMAND
-    # ========================================================================
+
+
+def _add_cleanup_parser(subparsers) -> None:
+    """Register the cleanup command."""
     cleanup_parser = subparsers.add_parser(
         'cleanup',
         help='Maintenance operations',
@@ -260,7 +304,7 @@ def main():
     cleanup_parser.add_argument(
         '--rebuild-registry',
         action='store_true',
-        help='Rebuild stub registry from Outlook folders'
+        help='Rebuild stub registry from Outlook folders (always runs; --all skips it if unchanged)'
     )
     cleanup_parser.add_argument(
         '--all',
@@ -272,11 +316,21 @@ def main():
         action='store_true',
         help='Show what would be done without doing it'
     )
+    cleanup_parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Do not ask for confirmation'
+    )
+    cleanup_parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='List every processed email'
+    )
     cleanup_parser.set_defaults(func=cmd_cleanup)
-    
-    # ========================================================================
-    # RESET COMMAND
-    # ========================================================================
+
+
+def _add_reset_parser(subparsers) -> None:
+    """Register the reset command."""
     reset_parser = subparsers.add_parser(
         'reset',
         help='Reset system to initial state',
@@ -288,6 +342,41 @@ def main():
         help='Skip confirmation prompt'
     )
     reset_parser.set_defaults(func=cmd_reset)
+
+
+# Subparser factories, keyed by command name
+_COMMAND_PARSERS = {
+    'sync': _add_sync_parser,
+    'status': _add_status_parser,
+    'search': _add_search_parser,
+    'cleanup': _add_cleanup_parser,
+    'reset': _add_reset_parser,
+}
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog='main.py',
+        description='Bloomberg RAG - Unified CLI',
+        epilog='Run "main.py <command> --help" for command-specific help'
+    )
+    
+    subparsers = parser.add_subparsers(
+        title='commands',
+        description='Available commands',
+        dest='command',
+        required=True
+    )
+    
+    # Only build the subparser for the selected command; register all of
+    # them for top-level help, missing or unknown commands
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in _COMMAND_PARSERS:
+        _COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
     
     # Parse and execute
     args = parser.parse_args()
@@ -18,6 +18,13 @@ Usage:
     # Select "rag_agent" in the dropdown
 """
 
-from .agent import root_agent
+__all__ = ["root_agent"]
 
-__all__ = ["root_agent"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    """Resolve root_agent lazily so ``import rag_agent`` stays cheap."""
+    if name == "root_agent":
+        from .agent import root_agent
+        return root_agent
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -7,6 +7,10 @@ Google ADK framework with OpenAI GPT-4o via LiteLLM.
 The agent uses hybrid_search to retrieve documents and synthesize answers.
 Filter tools have been removed as they were too restrictive.
 
+The agent (and the heavy google.adk / LiteLLM / tools imports it needs)
+is built lazily on first access to ``root_agent`` (PEP 562), so importing
+this module is cheap.
+
 Usage:
     cd bloomberg-rag
     adk web
@@ -18,68 +22,99 @@ Configuration (via .env):
     TEMPERATURE=0.7
 """
 
-import os
 import sys
+import importlib
 from pathlib import Path
 
-# Add project root to path so we can import from tools/
-PROJECT_ROOT = Path(__file__).parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-# Change working directory to project root for proper imports
-os.chdir(PROJECT_ROOT)
-
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-from google.genai import types
-
-# Import system prompt
-from .prompt import SYSTEM_PROMPT, AGENT_DESCRIPTION, AGENT_NAME
-
-# Import tools from project root tools/ directory
-from tools.hybrid_search import hybrid_search
-from tools.get_current_datetime import get_current_datetime
+# Add project root to path so we can import from tools/ and config/.
+# Data paths are absolute (config.settings), so the working directory
+# does not need to change.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-# Model settings (can be overridden via .env)
-MODEL_NAME = os.getenv("MODEL_NAME", "openai/gpt-4o")
-TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
-MAX_TOKENS = int(os.getenv("MAX_TOKENS", "4000"))  # Increased for longer RAG responses
+# Model settings (can be overridden via .env, read once in config._env_cache)
+from config._env_cache import MODEL_NAME, TEMPERATURE, MAX_TOKENS
+from config.settings import get_agent_config
+
+
+# Tool name -> module in project root tools/ directory
+_TOOL_MODULES = {
+    "hybrid_search": "tools.hybrid_search",
+    "semantic_search": "tools.semantic_search",
+    "filter_by_date": "tools.filter_by_date",
+    "filter_by_topic": "tools.filter_by_topic",
+    "filter_by_people": "tools.filter_by_people",
+    "filter_by_ticker": "tools.filter_by_ticker",
+    "get_current_datetime": "tools.get_current_datetime",
+}
 
 
 # ============================================================================
 # AGENT DEFINITION
 # ============================================================================
 
-root_agent = Agent(
-    # Model configuration: OpenAI GPT-4o via LiteLLM
-    model=LiteLlm(model=MODEL_NAME),
+_root_agent = None
+
+
+def _build_agent():
+    """
+    Build the root agent, importing Google ADK and tools on demand.
+    
+    Returns:
+        Configured google.adk Agent
+    """
+    from google.adk.agents import Agent
+    from google.adk.models.lite_llm import LiteLlm
+    from google.genai import types
+    
+    # Import system prompt
+    from .prompt import AGENT_CONFIG
     
-    # Agent identity
-    name=AGENT_NAME,
-    description=AGENT_DESCRIPTION,
+    # Import only the enabled tools from project root tools/ directory
+    tools = [
+        getattr(importlib.import_module(_TOOL_MODULES[tool_name]), tool_name)
+        for tool_name in get_agent_config().enabled_tools
+        if tool_name in _TOOL_MODULES
+    ]
     
-    # System instructions
-    instruction=SYSTEM_PROMPT,
+    return Agent(
+        # Model configuration: OpenAI GPT-4o via LiteLLM
+        model=LiteLlm(model=MODEL_NAME),
+        
+        # Agent identity
+        name=AGENT_CONFIG["name"],
+        description=AGENT_CONFIG["description"],
+        
+        # System instructions
+        instruction=AGENT_CONFIG["system_prompt"],
+        
+        # Generation settings
+        generate_content_config=types.GenerateContentConfig(
+            temperature=TEMPERATURE,
+            max_output_tokens=MAX_TOKENS,
+        ),
+        
+        # Tools available to the agent (AgentConfig.enabled_tools)
+        tools=tools,
+    )
+
+
+def __getattr__(name: str):
+    """Build root_agent on first access (PEP 562)."""
+    global _root_agent
     
-    # Generation settings
-    generate_content_config=types.GenerateContentConfig(
-        temperature=TEMPERATURE,
-        max_output_tokens=MAX_TOKENS,
-    ),
+    if name == "root_agent":
+        if _root_agent is None:
+            _root_agent = _build_agent()
+        return _root_agent
     
-    # Tools available to the agent
-    # Only hybrid_search - filters removed as too restrictive
-    tools=[
-        hybrid_search,
-        get_current_datetime,
-    ],
-)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -89,9 +124,10 @@ root_agent = Agent(
 __all__ = ["root_agent"]
 
 if __name__ == "__main__":
+    root_agent = __getattr__("root_agent")
     print(f"Agent: {root_agent.name}")
     print(f"Description: {root_agent.description}")
     print(f"Model: {MODEL_NAME} via LiteLLM")
     print(f"Tools: {len(root_agent.tools)}")
     for tool in root_agent.tools:
-        print(f"  - {tool.__name__}")
\ No newline at end of file
+        print(f"  - {tool.__name__}")
@@ -7,6 +7,8 @@ behavior for true RAG (Retrieval-Augmented Generation).
 The agent retrieves documents and SYNTHESIZES answers, not just lists results.
 """
 
+from types import MappingProxyType
+
 SYSTEM_PROMPT = """You are a Bloomberg Financial Research Assistant powered by a database of indexed Bloomberg newsletter emails.
 
 ## Your Role
@@ -77,10 +79,21 @@ In English: "I don't have updated information in my Bloomberg archives to answer
 Do NOT make up information. Do NOT use general knowledge to answer - only use what's in your article database.
 """
 
+# UTF-8 encoded prompt, computed once (for byte-size / token-budget checks)
+SYSTEM_PROMPT_BYTES = SYSTEM_PROMPT.encode("utf-8")
+SYSTEM_PROMPT_LEN = len(SYSTEM_PROMPT_BYTES)
+
 # Agent description for ADK
 AGENT_DESCRIPTION = """Bloomberg Financial Research Assistant that answers questions 
 by analyzing indexed Bloomberg newsletter content. Provides synthesized insights 
 based on article content, not just search results."""
 
 # Agent name
-AGENT_NAME = "bloomberg_rag_agent"
\ No newline at end of file
+AGENT_NAME = "bloomberg_rag_agent"
+
+# Read-only bundle of the agent identity/instructions
+AGENT_CONFIG = MappingProxyType({
+    "name": AGENT_NAME,
+    "description": AGENT_DESCRIPTION,
+    "system_prompt": SYSTEM_PROMPT,
+})
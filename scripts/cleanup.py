@@ -12,31 +12,65 @@ Usage:
     python scripts/cleanup.py --archive-processed 6
     python scripts/cleanup.py --rebuild-registry
     python scripts/cleanup.py --all
+    python scripts/cleanup.py --all --yes  # Unattended, no confirmation
 """
 
 import sys
 import json
+import functools
 from pathlib import Path
 from datetime import datetime, timedelta
-import argparse
+from types import SimpleNamespace
+from typing import Optional, TYPE_CHECKING
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.outlook.extractor import OutlookExtractor
-from src.stub.registry import StubRegistry
 from config.settings import (
     get_outlook_config,
     get_persistence_config
 )
 
+# Outlook (pywin32), registry and numpy imports are deferred to the code
+# paths that use them, so --help and registry-only runs start fast
+if TYPE_CHECKING:
+    from src.outlook.extractor import OutlookExtractor
+    from src.stub.registry import StubRegistry
+    from src.models import StubEntry
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, memoized.
+    
+    Bloomberg emails from the same batch share timestamps, and --all
+    parses the same values across several passes.
+    
+    Args:
+        value: ISO-8601 string
+        
+    Returns:
+        Parsed datetime
+    """
+    return datetime.fromisoformat(value)
+
+
+def _write_lines(lines: list) -> None:
+    """Write buffered per-item output with a single stdout write."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
 
 def delete_old_stubs(
-    outlook_extractor: OutlookExtractor,
-    stub_registry: StubRegistry,
+    outlook_extractor: "OutlookExtractor",
+    stub_registry: "StubRegistry",
     days_old: int,
-    dry_run: bool = False
+    dry_run: bool = False,
+    assume_yes: bool = False,
+    verbose: bool = False
 ) -> int:
     """
     Delete stubs older than N days from /stubs/ folder.
@@ -46,6 +80,8 @@ def delete_old_stubs(
         stub_registry: StubRegistry instance
         days_old: Age threshold in days
         dry_run: If True, only show what would be deleted
+        assume_yes: If True, skip the confirmation prompt
+        verbose: If True, list every processed item (errors are always listed)
         
     Returns:
         Number of stubs deleted
@@ -55,22 +91,10 @@ def delete_old_stubs(
     print("="*60)
     
     cutoff_date = datetime.now() - timedelta(days=days_old)
-    print(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # FIX: Usa stub_registry.stubs invece di get_all_stubs()
-    all_stubs = stub_registry.stubs
-    # FIX: Gli stub sono oggetti StubEntry, quindi usa s.status invece di s['status']
-    pending_stubs = [s for s in all_stubs if s.status == 'pending']
-    
-    # Find old stubs
-    old_stubs = []
-    for stub in pending_stubs:
-        # FIX: received_time è già un datetime object in StubEntry
-        received_time = stub.received_time
-        if isinstance(received_time, str):
-            received_time = datetime.fromisoformat(received_time)
-        if received_time < cutoff_date:
-            old_stubs.append(stub)
+    print(f"Cutoff date: {cutoff_date.isoformat(sep=' ', timespec='seconds')}")
+    
+    # Find old pending stubs (vectorized received time filter in the registry)
+    old_stubs = stub_registry.get_pending_older_than(cutoff_date)
     
     print(f"\nFound {len(old_stubs)} stubs older than {days_old} days")
     
@@ -80,46 +104,52 @@ def delete_old_stubs(
     
     if dry_run:
         print("\nDRY RUN - Would delete:")
-        for stub in old_stubs:
-            # FIX: Usa stub.subject invece di stub['subject']
-            print(f"  - {stub.subject} ({stub.received_time})")
+        # FIX: Usa stub.subject invece di stub['subject']
+        _write_lines([
+            f"  - {stub.subject} ({stub.received_time.isoformat(sep=' ', timespec='seconds')})"
+            for stub in old_stubs
+        ])
         return 0
     
     # Confirm deletion
-    response = input(f"\nDelete {len(old_stubs)} old stubs? (yes/no): ")
-    if response.lower() != 'yes':
+    if not assume_yes and input(f"\nDelete {len(old_stubs)} old stubs? (yes/no): ").lower() != 'yes':
         print("Cancelled")
         return 0
     
-    # Delete stubs
-    deleted_count = 0
+    # Delete stubs from Outlook in one batch
+    # FIX: Usa stub.outlook_entry_id invece di stub['outlook_entry_id']
+    results = outlook_extractor.delete_emails_batch(
+        [stub.outlook_entry_id for stub in old_stubs]
+    )
+    
+    deleted_ids = []
+    log_lines = []
     for stub in old_stubs:
-        try:
-            # FIX: Usa stub.outlook_entry_id invece di stub['outlook_entry_id']
-            outlook_entry_id = stub.outlook_entry_id
-            
-            # Delete from Outlook
-            outlook_extractor.delete_email(outlook_entry_id)
-            
-            # Remove from registry
-            stub_registry.remove_stub(outlook_entry_id)
-            
-            deleted_count += 1
-            # FIX: Usa stub.subject invece di stub['subject']
-            print(f"  OK Deleted: {stub.subject}")
-            
-        except Exception as e:
-            # FIX: Usa stub.subject invece di stub['subject']
-            print(f"  ERROR Failed to delete {stub.subject}: {e}")
+        error = results.get(stub.outlook_entry_id)
+        if error is None:
+            deleted_ids.append(stub.outlook_entry_id)
+            if verbose:
+                log_lines.append(f"  OK Deleted: {stub.subject}")
+        else:
+            log_lines.append(f"  ERROR Failed to delete {stub.subject}: {error}")
+    _write_lines(log_lines)
+    
+    # Remove from registry in memory, then write it once
+    stub_registry.remove_stubs(deleted_ids, persist=False)
+    deleted_count = len(deleted_ids)
+    
+    stub_registry.save()
     
     print(f"\nDeleted {deleted_count} stubs")
     return deleted_count
 
 
 def archive_old_processed(
-    outlook_extractor: OutlookExtractor,
+    outlook_extractor: "OutlookExtractor",
     months_old: int,
-    dry_run: bool = False
+    dry_run: bool = False,
+    assume_yes: bool = False,
+    verbose: bool = False
 ) -> int:
     """
     Archive processed stubs older than N months from /processed/ folder.
@@ -128,6 +158,8 @@ def archive_old_processed(
         outlook_extractor: OutlookExtractor instance
         months_old: Age threshold in months
         dry_run: If True, only show what would be archived
+        assume_yes: If True, skip the confirmation prompt
+        verbose: If True, list every processed item (errors are always listed)
         
     Returns:
         Number of emails archived
@@ -137,138 +169,245 @@ def archive_old_processed(
     print("="*60)
     
     cutoff_date = datetime.now() - timedelta(days=months_old * 30)
-    print(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Cutoff date: {cutoff_date.isoformat(sep=' ', timespec='seconds')}")
     
-    # Get all processed emails
-    processed_emails = outlook_extractor.get_emails_from_processed()
+    import numpy as np
     
-    # Find old emails
-    old_emails = []
-    for email in processed_emails:
-        received_time = email.get('received_time')
-        if isinstance(received_time, str):
-            received_time = datetime.fromisoformat(received_time)
-        
-        if received_time < cutoff_date:
-            old_emails.append(email)
+    # Get all processed emails as columns (entry IDs, subjects, epoch seconds)
+    entry_ids, subjects, received_ts = outlook_extractor.get_emails_from_processed_soa()
     
-    print(f"\nFound {len(old_emails)} processed emails older than {months_old} months")
+    # Find old emails with a single vectorized int64 comparison
+    cutoff_ts = int(cutoff_date.timestamp())
+    old_indices = np.nonzero(np.asarray(received_ts, dtype=np.int64) < cutoff_ts)[0].tolist()
     
-    if not old_emails:
+    print(f"\nFound {len(old_indices)} processed emails older than {months_old} months")
+    
+    if not old_indices:
         print("Nothing to archive")
         return 0
     
     if dry_run:
         print("\nDRY RUN - Would archive:")
-        for email in old_emails:
-            print(f"  - {email['subject']} ({email['received_time']})")
+        _write_lines([
+            f"  - {subjects[i]} ({datetime.fromtimestamp(received_ts[i]).isoformat(sep=' ', timespec='seconds')})"
+            for i in old_indices
+        ])
         return 0
     
     # Confirm archival
-    response = input(f"\nArchive {len(old_emails)} old processed emails? (yes/no): ")
-    if response.lower() != 'yes':
+    if not assume_yes and input(f"\nArchive {len(old_indices)} old processed emails? (yes/no): ").lower() != 'yes':
         print("Cancelled")
         return 0
     
-    # Move to archive folder (or delete)
+    # Delete from /processed/ in one batch (or move to archive folder if exists)
+    results = outlook_extractor.delete_emails_batch([entry_ids[i] for i in old_indices])
+    
     archived_count = 0
-    for email in old_emails:
-        try:
-            outlook_entry_id = email['outlook_entry_id']
-            
-            # Delete from /processed/ (or move to archive folder if exists)
-            outlook_extractor.delete_email(outlook_entry_id)
-            
+    log_lines = []
+    for i in old_indices:
+        error = results.get(entry_ids[i])
+        if error is None:
             archived_count += 1
-            print(f"  OK Archived: {email['subject']}")
-            
-        except Exception as e:
-            print(f"  ERROR Failed to archive {email['subject']}: {e}")
+            if verbose:
+                log_lines.append(f"  OK Archived: {subjects[i]}")
+        else:
+            log_lines.append(f"  ERROR Failed to archive {subjects[i]}: {error}")
+    _write_lines(log_lines)
     
     print(f"\nArchived {archived_count} emails")
     return archived_count
 
 
+def _build_stub_entry(email: dict, status: str) -> "StubEntry":
+    """
+    Build a registry entry from an Outlook email dict.
+    
+    Uses StubRegistry.create_fingerprint() so rebuilt fingerprints match
+    the ones sync and reconcile compute for complete emails.
+    
+    Args:
+        email: Email dict from OutlookExtractor
+        status: "pending" or "completed"
+        
+    Returns:
+        StubEntry
+    """
+    from src.models import StubEntry
+    from src.stub.registry import StubRegistry
+    
+    received_time = email['received_time']
+    if not isinstance(received_time, datetime):
+        received_time = _parse_iso(received_time)
+    
+    return StubEntry(
+        outlook_entry_id=email['outlook_entry_id'],
+        story_id=email.get('story_id'),
+        fingerprint=email.get('fingerprint') or StubRegistry.create_fingerprint(email['subject'], received_time),
+        subject=email['subject'],
+        received_time=received_time,
+        status=status,
+        completed_at=None
+    )
+
+
+def _folder_stamps(outlook_extractor: "OutlookExtractor") -> dict:
+    """
+    Get last modification times of the /stubs/ and /processed/ folders.
+    
+    Args:
+        outlook_extractor: OutlookExtractor instance
+        
+    Returns:
+        Dict folder name -> ISO timestamp (None if not available)
+    """
+    stamps = {}
+    for name, folder_path in (
+        ('stubs', outlook_extractor.stubs_folder_path),
+        ('processed', outlook_extractor.processed_folder_path),
+    ):
+        modified = outlook_extractor.get_folder_last_modified(folder_path)
+        stamps[name] = modified.isoformat() if modified is not None else None
+    return stamps
+
+
+def _load_rebuild_state(state_path: Path) -> dict:
+    """Load folder stamps saved by the last rebuild (empty dict if none)."""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 def rebuild_stub_registry(
-    outlook_extractor: OutlookExtractor,
-    stub_registry: StubRegistry
+    outlook_extractor: "OutlookExtractor",
+    stub_registry: "StubRegistry",
+    state_path: Optional[Path] = None,
+    assume_yes: bool = False,
+    verbose: bool = False,
+    force: bool = False
 ) -> None:
     """
     Rebuild stub_registry.json by scanning Outlook folders.
     
+    If state_path is given, the rebuild is skipped when neither folder
+    was modified since the last rebuild, unless force is set.
+    
     Args:
         outlook_extractor: OutlookExtractor instance
         stub_registry: StubRegistry instance
+        state_path: File with folder stamps of the last rebuild (optional)
+        assume_yes: If True, skip the confirmation prompt
+        verbose: If True, list every processed item (errors are always listed)
+        force: If True, rebuild even if the folders are unchanged (the
+               registry file itself may be wrong, e.g. restored from backup)
     """
     print("\n" + "="*60)
     print("REBUILD STUB REGISTRY")
     print("="*60)
     
+    # Skip the scan if both folders are unchanged since last rebuild
+    stamps = None
+    if state_path is not None:
+        stamps = _folder_stamps(outlook_extractor)
+        state = _load_rebuild_state(state_path)
+        if (
+            not force
+            and None not in stamps.values()
+            and stub_registry.registry_path.exists()
+            and state.get('folders') == stamps
+        ):
+            print(f"\nNo changes since last rebuild ({state.get('last_rebuilt_at')})")
+            return
+    
     # Confirm rebuild
-    response = input("\nThis will replace the current registry. Continue? (yes/no): ")
-    if response.lower() != 'yes':
+    if not assume_yes and input("\nThis will replace the current registry. Continue? (yes/no): ").lower() != 'yes':
         print("Cancelled")
         return
     
     # Clear current registry
     stub_registry.clear()
     
+    entries = []
+    
     # Scan /stubs/ folder
     print("\nScanning /stubs/ folder...")
-    stubs_in_folder = outlook_extractor.get_emails_from_stubs()
-    
-    for stub_email in stubs_in_folder:
+    log_lines = []
+    for stub_email in outlook_extractor.iter_emails_from_stubs():
         try:
-            # Crea StubEntry e registra
-            from models import StubEntry
-            from datetime import datetime
-            
-            stub_entry = StubEntry(
-                outlook_entry_id=stub_email['outlook_entry_id'],
-                story_id=stub_email.get('story_id'),
-                fingerprint=f"{stub_email['subject']}_{stub_email['received_time'].strftime('%Y%m%d')}",
-                subject=stub_email['subject'],
-                received_time=stub_email['received_time'] if isinstance(stub_email['received_time'], datetime) else datetime.fromisoformat(stub_email['received_time']),
-                status='pending',
-                completed_at=None
-            )
-            
-            stub_registry.add_stub(stub_entry)
-            print(f"  OK Registered: {stub_email['subject']}")
+            entries.append(_build_stub_entry(stub_email, 'pending'))
+            if verbose:
+                log_lines.append(f"  OK Registered: {stub_email['subject']}")
             
         except Exception as e:
-            print(f"  ERROR Failed to register {stub_email['subject']}: {e}")
+            log_lines.append(f"  ERROR Failed to register {stub_email['subject']}: {e}")
+    _write_lines(log_lines)
     
     # Scan /processed/ folder
     print("\nScanning /processed/ folder...")
-    processed_in_folder = outlook_extractor.get_emails_from_processed()
-    
-    for processed_email in processed_in_folder:
+    log_lines = []
+    for processed_email in outlook_extractor.iter_emails_from_processed():
         try:
             # Register as completed stub
-            stub_registry.register_stub(
-                outlook_entry_id=processed_email['outlook_entry_id'],
-                story_id=processed_email.get('story_id'),
-                fingerprint=processed_email.get('fingerprint'),
-                subject=processed_email['subject'],
-                received_time=processed_email['received_time'],
-                status='completed'
-            )
-            print(f"  OK Registered: {processed_email['subject']}")
+            entries.append(_build_stub_entry(processed_email, 'completed'))
+            if verbose:
+                log_lines.append(f"  OK Registered: {processed_email['subject']}")
             
         except Exception as e:
-            print(f"  ERROR Failed to register {processed_email['subject']}: {e}")
+            log_lines.append(f"  ERROR Failed to register {processed_email['subject']}: {e}")
+    _write_lines(log_lines)
     
-    # Save registry
-    stub_registry.save()
+    # Register everything and save registry once
+    stub_registry.bulk_register(entries)
+    
+    pending_count = sum(1 for entry in entries if entry.status == 'pending')
+    completed_count = len(entries) - pending_count
     
     print(f"\nRegistry rebuilt:")
-    print(f"  Pending stubs: {len(stubs_in_folder)}")
-    print(f"  Completed stubs: {len(processed_in_folder)}")
+    print(f"  Pending stubs: {pending_count}")
+    print(f"  Completed stubs: {completed_count}")
+    
+    # Remember folder stamps for the next rebuild
+    if stamps is not None and None not in stamps.values():
+        try:
+            with open(state_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'last_rebuilt_at': datetime.now().isoformat(),
+                    'folders': stamps
+                }, f, indent=2)
+        except OSError as e:
+            print(f"  WARNING Could not save rebuild state: {e}")
 
 
-def main():
-    """Main entry point."""
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    
+    The common unattended "--all" invocation skips argparse entirely.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments namespace
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast path: no argparse import/parser construction
+    if argv == ['--all']:
+        return SimpleNamespace(
+            delete_old_stubs=None,
+            archive_processed=None,
+            rebuild_registry=False,
+            all=True,
+            dry_run=False,
+            yes=False,
+            verbose=False
+        )
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Cleanup and maintenance for Bloomberg RAG system'
     )
@@ -287,7 +426,8 @@ def main():
     parser.add_argument(
         '--rebuild-registry',
         action='store_true',
-        help='Rebuild stub_registry.json from Outlook folders'
+        help='Rebuild stub_registry.json from Outlook folders (always runs; '
+             '--all skips it when the folders are unchanged)'
     )
     parser.add_argument(
         '--all',
@@ -299,25 +439,71 @@ def main():
         action='store_true',
         help='Show what would be done without actually doing it'
     )
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Do not ask for confirmation (unattended runs)'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='List every deleted/archived/registered email'
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validate
     if not any([args.delete_old_stubs, args.archive_processed, args.rebuild_registry, args.all]):
         parser.error("Specify at least one operation")
     
+    return args
+
+
+def main(argv=None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code
+    """
+    args = parse_args(argv)
+    
     try:
         # Initialize components
         outlook_config = get_outlook_config()
         persistence_config = get_persistence_config()
         
-        outlook_extractor = OutlookExtractor(
-            outlook_config.source_folder,
-            outlook_config.indexed_folder,
-            outlook_config.stubs_folder,
-            outlook_config.processed_folder
+        # Outlook is only needed to read /processed/ or to change folders;
+        # dry-run stub deletion works on the registry alone
+        needs_outlook = bool(
+            args.all or args.archive_processed
+            or (not args.dry_run and (args.delete_old_stubs or args.rebuild_registry))
+        )
+        needs_registry = bool(
+            args.all or args.delete_old_stubs
+            or (not args.dry_run and args.rebuild_registry)
         )
-        stub_registry = StubRegistry(persistence_config.stub_registry_json)
+        
+        outlook_extractor = None
+        if needs_outlook:
+            from src.outlook.extractor import OutlookExtractor
+            
+            outlook_extractor = OutlookExtractor(
+                outlook_config.source_folder,
+                outlook_config.indexed_folder,
+                outlook_config.stubs_folder,
+                outlook_config.processed_folder
+            )
+            outlook_extractor.connect()
+        
+        stub_registry = None
+        if needs_registry:
+            from src.stub.registry import StubRegistry
+            
+            stub_registry = StubRegistry(persistence_config.stub_registry_json)
         
         print("="*60)
         print("BLOOMBERG RAG - CLEANUP & MAINTENANCE")
@@ -326,25 +512,46 @@ def main():
         if args.dry_run:
             print("\n*** DRY RUN MODE - No changes will be made ***")
         
+        assume_yes = args.yes
+        
         # Execute operations
         if args.all:
+            # One confirmation for the whole batch instead of one per operation
+            if not args.dry_run and not assume_yes:
+                if input("\nRun all cleanup operations (delete, archive, rebuild)? (yes/no): ").lower() != 'yes':
+                    print("Cancelled")
+                    return 0
+                assume_yes = True
+            
             # Run all cleanup operations
-            delete_old_stubs(outlook_extractor, stub_registry, 30, args.dry_run)
-            archive_old_processed(outlook_extractor, 6, args.dry_run)
+            delete_old_stubs(outlook_extractor, stub_registry, 30, args.dry_run, assume_yes, args.verbose)
+            archive_old_processed(outlook_extractor, 6, args.dry_run, assume_yes, args.verbose)
             if not args.dry_run:
-                rebuild_stub_registry(outlook_extractor, stub_registry)
+                rebuild_stub_registry(
+                    outlook_extractor, stub_registry, persistence_config.stub_rebuild_json,
+                    assume_yes, args.verbose
+                )
         else:
             if args.delete_old_stubs:
-                delete_old_stubs(outlook_extractor, stub_registry, args.delete_old_stubs, args.dry_run)
+                delete_old_stubs(
+                    outlook_extractor, stub_registry, args.delete_old_stubs, args.dry_run,
+                    assume_yes, args.verbose
+                )
             
             if args.archive_processed:
-                archive_old_processed(outlook_extractor, args.archive_processed, args.dry_run)
+                archive_old_processed(
+                    outlook_extractor, args.archive_processed, args.dry_run, assume_yes, args.verbose
+                )
             
             if args.rebuild_registry:
                 if args.dry_run:
                     print("\nDRY RUN: Skipping registry rebuild")
                 else:
-                    rebuild_stub_registry(outlook_extractor, stub_registry)
+                    # Explicit recovery command: never skipped as unchanged
+                    rebuild_stub_registry(
+                        outlook_extractor, stub_registry, persistence_config.stub_rebuild_json,
+                        assume_yes, args.verbose, force=True
+                    )
         
         print("\n" + "="*60)
         print("CLEANUP COMPLETED")
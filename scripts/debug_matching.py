@@ -7,16 +7,26 @@ NO Unicode characters - Windows compatible.
 """
 
 import sys
+import hmac
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.stub.registry import StubRegistry
 from src.models import EmailDocument, BloombergMetadata
 from datetime import datetime
 from config.settings import get_persistence_config
 
+
+def same_fingerprint(a, b) -> bool:
+    """Compare two fingerprints in C (encoded, since subjects may be non-ASCII)."""
+    if a is None or b is None:
+        return a is b
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
+
+
 print("="*80)
 print("STUB MATCHING DEBUG - COMPREHENSIVE ANALYSIS")
 print("="*80)
@@ -45,7 +55,7 @@ print(f"Fingerprint in registry: {stub.fingerprint}")
 regenerated_fp = StubRegistry.create_fingerprint(stub.subject, stub.received_time)
 print(f"Fingerprint regenerated: {regenerated_fp}")
 
-if stub.fingerprint != regenerated_fp:
+if not same_fingerprint(stub.fingerprint, regenerated_fp):
     print("WARNING: MISMATCH - Registry fingerprint differs from regenerated!")
 else:
     print("OK: Registry fingerprint matches regenerated")
@@ -67,7 +77,7 @@ print(f"\nMethod 1 - StubRegistry.create_fingerprint():")
 print(f"  Result: {fingerprint_method1}")
 
 # Check if it would match
-if fingerprint_method1 == stub.fingerprint:
+if same_fingerprint(fingerprint_method1, stub.fingerprint):
     print("  OK: WOULD MATCH stub in registry!")
 else:
     print("  ERROR: WOULD NOT MATCH stub in registry")
@@ -98,7 +108,7 @@ email_doc = EmailDocument(
 fingerprint_method2 = email_doc.get_fingerprint()
 print(f"  Result: {fingerprint_method2}")
 
-if fingerprint_method2 == stub.fingerprint:
+if same_fingerprint(fingerprint_method2, stub.fingerprint):
     print("  OK: WOULD MATCH stub in registry!")
 else:
     print("  ERROR: WOULD NOT MATCH stub in registry")
@@ -131,13 +141,13 @@ print(f"\n{'='*80}")
 print("DIAGNOSIS")
 print(f"{'='*80}")
 
-if fingerprint_method1 == fingerprint_method2:
+if same_fingerprint(fingerprint_method1, fingerprint_method2):
     print("OK: Both methods generate the SAME fingerprint")
 else:
     print("ERROR: Methods generate DIFFERENT fingerprints!")
     print("   >>> This is the problem - EmailDocument.get_fingerprint() doesn't use normalization")
 
-if fingerprint_method1 == stub.fingerprint:
+if same_fingerprint(fingerprint_method1, stub.fingerprint):
     print("OK: Matching SHOULD WORK if using StubRegistry.create_fingerprint()")
 else:
     print("ERROR: Even StubRegistry.create_fingerprint() doesn't match registry")
@@ -14,15 +14,24 @@ Usage:
 """
 
 import sys
+import json
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from itertools import chain, islice
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
+
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.outlook.extractor import OutlookExtractor
 from src.processing.cleaner import ContentCleaner
@@ -36,6 +45,13 @@ from config.settings import (
 )
 
 
+# Columns read from /indexed/ through a single Outlook Table
+INDEXED_COLUMNS = ("EntryID", "Subject", "ReceivedTime")
+
+# Stubs / indexed emails shown by --debug
+DEBUG_SAMPLES = 5
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -47,73 +63,173 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def load_fingerprint_cache(cache_path: Path) -> Dict[str, List]:
+    """
+    Load fingerprints computed by previous runs.
+    
+    Args:
+        cache_path: Path to fingerprint_cache.json
+        
+    Returns:
+        Dict EntryID -> [received epoch seconds, fingerprint]
+        (empty if missing or unreadable)
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(cache_path.read_bytes())
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_fingerprint_cache(cache_path: Path, fingerprint_cache: Dict[str, List]) -> None:
+    """
+    Save fingerprint cache to disk.
+    
+    Args:
+        cache_path: Path to fingerprint_cache.json
+        fingerprint_cache: Dict EntryID -> [received epoch seconds, fingerprint]
+    """
+    logger = logging.getLogger(__name__)
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(fingerprint_cache))
+        else:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(fingerprint_cache, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"Failed to save fingerprint cache: {e}")
+
+
 def extract_indexed_emails_metadata(outlook_extractor: OutlookExtractor,
                                     content_cleaner: ContentCleaner,
-                                    metadata_extractor: MetadataExtractor) -> List[Dict]:
+                                    metadata_extractor: MetadataExtractor,
+                                    extract_story_ids: bool = True,
+                                    fingerprint_cache: Optional[Dict[str, List]] = None) -> Iterator[Dict]:
     """
     Extract Story ID and fingerprint from all emails in /indexed/.
     
+    Emails are yielded one at a time so matching can consume them in a
+    single streaming pass without holding the whole folder in memory.
+    Only the first email of each fingerprint (subject + date) is yielded.
+    
     CRITICAL: Uses StubRegistry.create_fingerprint() for consistent
     fingerprint generation that normalizes Bloomberg prefixes.
+    
+    Args:
+        outlook_extractor: Connected OutlookExtractor
+        content_cleaner: ContentCleaner for email bodies
+        metadata_extractor: MetadataExtractor for Story IDs
+        extract_story_ids: If False (no pending stub has a Story ID, so
+            only fingerprints can match), skip body fetch, cleaning and
+            metadata extraction; story_id is then None for every email
+        fingerprint_cache: Fingerprints from previous runs (see
+            load_fingerprint_cache). Reused when EntryID and received time
+            are unchanged; once the scan completes it is updated in place
+            to hold exactly the emails currently in /indexed/
+        
+    Yields:
+        Dicts with 'story_id', 'fingerprint', 'subject',
+        'outlook_entry_id', 'received_date'
     """
     logger = logging.getLogger(__name__)
     logger.info("Scanning /indexed/ folder for complete emails...")
     
     try:
-        indexed_folder = outlook_extractor.get_folder(outlook_extractor.indexed_folder_path)
-        emails = indexed_folder.Items
+        rows = outlook_extractor.iter_table_rows(
+            outlook_extractor.indexed_folder_path,
+            INDEXED_COLUMNS
+        )
         
-        indexed_metadata = []
+        extracted_count = 0
+        duplicate_count = 0
+        seen_fingerprints = {}
+        emitted_fingerprints = set()
         
-        for email in emails:
-            if email.Class != 43:
+        # Rows are mail items only (filtered by the store)
+        for row in rows:
+            # Expected gaps are handled with plain checks; only the COM
+            # body fetch and parsing below can raise
+            subject = row['Subject'] or ''
+            if not subject:
+                logger.debug(f"Skipping indexed email without subject: {row['EntryID']}")
                 continue
             
-            try:
-                subject = email.Subject
-                body = email.Body
-                received_date = outlook_extractor._convert_outlook_date(email.ReceivedTime)
-                outlook_entry_id = email.EntryID
-                
-                # Clean and extract metadata
-                cleaned_body = content_cleaner.clean(body)
-                metadata = metadata_extractor.extract(
-                    subject=subject,
-                    body=cleaned_body,
-                    received_date=received_date
-                )
-                
-                # =============================================================
-                # FIX: Use StubRegistry.create_fingerprint()
-                # This automatically normalizes Bloomberg prefixes!
-                # =============================================================
+            received_date = outlook_extractor._convert_outlook_date(row['ReceivedTime'])
+            outlook_entry_id = row['EntryID']
+            
+            # =================================================================
+            # FIX: Use StubRegistry.create_fingerprint()
+            # This automatically normalizes Bloomberg prefixes!
+            # =================================================================
+            received_ts = int(received_date.timestamp())
+            cached = fingerprint_cache.get(outlook_entry_id) if fingerprint_cache else None
+            
+            if cached and cached[0] == received_ts:
+                fingerprint = cached[1]
+            else:
                 fingerprint = StubRegistry.create_fingerprint(subject, received_date)
-                
-                indexed_metadata.append({
-                    'story_id': metadata.story_id,
-                    'fingerprint': fingerprint,
-                    'subject': subject,
-                    'outlook_entry_id': outlook_entry_id,
-                    'received_date': received_date
-                })
-                
-            except Exception as e:
-                logger.warning(f"Failed to extract metadata from indexed email: {e}")
+            
+            seen_fingerprints[outlook_entry_id] = [received_ts, fingerprint]
+            
+            # Duplicate (same subject + date as an earlier email): nothing new
+            # to match, skip body cleaning and metadata extraction
+            if fingerprint in emitted_fingerprints:
+                duplicate_count += 1
                 continue
+            emitted_fingerprints.add(fingerprint)
+            
+            story_id = None
+            if extract_story_ids:
+                try:
+                    # Body is not a table column: open the item only for it
+                    body = outlook_extractor.get_email_body(outlook_entry_id) or ''
+                    
+                    # Clean and extract metadata
+                    cleaned_body = content_cleaner.clean(body)
+                    metadata = metadata_extractor.extract(
+                        subject=subject,
+                        body=cleaned_body,
+                        received_date=received_date
+                    )
+                    story_id = metadata.story_id
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to extract metadata from indexed email: {e}")
+                    continue
+            
+            extracted_count += 1
+            yield {
+                'story_id': story_id,
+                'fingerprint': fingerprint,
+                'subject': subject,
+                'outlook_entry_id': outlook_entry_id,
+                'received_date': received_date
+            }
         
-        logger.info(f"Extracted metadata from {len(indexed_metadata)} indexed emails")
-        return indexed_metadata
+        logger.info(f"Extracted metadata from {extracted_count} indexed emails "
+                    f"({duplicate_count} duplicates skipped)")
+        
+        # Drop entries of emails no longer in /indexed/
+        if fingerprint_cache is not None:
+            fingerprint_cache.clear()
+            fingerprint_cache.update(seen_fingerprints)
         
     except Exception as e:
         logger.error(f"Failed to scan /indexed/ folder: {e}")
-        return []
 
 
-def print_debug_samples(pending_stubs: List[StubEntry],
-                       indexed_emails: List[Dict],
+def print_debug_samples(pending_stubs: Iterable[StubEntry],
+                       indexed_emails: Iterable[Dict],
                        num_samples: int = 5):
     """
     Print samples of stubs and indexed emails for debugging.
+    
+    Both arguments may be lists or iterators: only the first
+    num_samples items are consumed, without copying.
     """
     print("\n" + "=" * 80)
     print("DEBUG: SAMPLE DATA")
@@ -121,7 +237,7 @@ def print_debug_samples(pending_stubs: List[StubEntry],
     
     print(f"\n📧 First {num_samples} PENDING STUBS:")
     print("-" * 80)
-    for i, stub in enumerate(pending_stubs[:num_samples]):
+    for i, stub in enumerate(islice(pending_stubs, num_samples)):
         print(f"\n[{i+1}] Subject: {stub.subject}")
         print(f"    Story ID: {stub.story_id or '(none)'}")
         print(f"    Fingerprint: {stub.fingerprint}")
@@ -129,43 +245,63 @@ def print_debug_samples(pending_stubs: List[StubEntry],
     
     print(f"\n\n📬 First {num_samples} INDEXED EMAILS:")
     print("-" * 80)
-    for i, email in enumerate(indexed_emails[:num_samples]):
+    for i, email in enumerate(islice(indexed_emails, num_samples)):
         print(f"\n[{i+1}] Subject: {email['subject']}")
         print(f"    Story ID: {email['story_id'] or '(none)'}")
         print(f"    Fingerprint: {email['fingerprint']}")
         print(f"    Date: {email['received_date']}")
     
-    # Count how many have Story IDs
-    stubs_with_story_id = sum(1 for s in pending_stubs if s.story_id)
-    emails_with_story_id = sum(1 for e in indexed_emails if e['story_id'])
-    
+    print("=" * 80 + "\n")
+
+
+def print_debug_statistics(stats: Dict[str, int]):
+    """
+    Print Story ID coverage counted by find_matches() for debugging.
+    """
     print("\n" + "-" * 80)
     print(f"STATISTICS:")
-    print(f"  Stubs with Story ID: {stubs_with_story_id}/{len(pending_stubs)}")
-    print(f"  Indexed with Story ID: {emails_with_story_id}/{len(indexed_emails)}")
+    print(f"  Stubs with Story ID: {stats['stubs_with_story_id']}/{stats['stubs']}")
+    print(f"  Indexed with Story ID: {stats['emails_with_story_id']}/{stats['emails']}")
     print("=" * 80 + "\n")
 
 
+def _discard_fingerprint(fingerprint_map: Dict[str, List[int]], fingerprint: Optional[str],
+                         index: int) -> None:
+    """Remove a stub index from the fingerprint map (dropping empty keys)."""
+    indexes = fingerprint_map.get(fingerprint)
+    if indexes and index in indexes:
+        indexes.remove(index)
+        if not indexes:
+            del fingerprint_map[fingerprint]
+
+
 def find_matches(pending_stubs: List[StubEntry],
-                indexed_emails: List[Dict],
-                debug: bool = False) -> List[Tuple[StubEntry, Dict]]:
+                indexed_emails: Iterable[Dict],
+                debug: bool = False,
+                stats: Optional[Dict[str, int]] = None) -> List[Tuple[StubEntry, Dict]]:
     """
     Find matches between pending stubs and indexed emails.
+    
+    indexed_emails is consumed once, so it can be a generator.
+    If stats is given, it is filled with Story ID coverage counts
+    ('stubs', 'stubs_with_story_id', 'emails', 'emails_with_story_id')
+    gathered during the same pass.
     """
     logger = logging.getLogger(__name__)
     logger.info("Matching pending stubs with indexed emails...")
     
     matches = []
     
-    # Create lookup maps
+    # Create lookup maps over the (smaller) pending stubs set:
+    # key -> indexes of the stubs carrying it
+    # (only non-empty keys are stored, so a None/'' probe simply misses)
     story_id_map = {}
     fingerprint_map = {}
     
-    for email_meta in indexed_emails:
-        if email_meta['story_id']:
-            story_id_map[email_meta['story_id']] = email_meta
-        if email_meta['fingerprint']:
-            fingerprint_map[email_meta['fingerprint']] = email_meta
+    for index, story_id in [(i, s.story_id) for i, s in enumerate(pending_stubs) if s.story_id]:
+        story_id_map.setdefault(story_id, []).append(index)
+    for index, fingerprint in [(i, s.fingerprint) for i, s in enumerate(pending_stubs) if s.fingerprint]:
+        fingerprint_map.setdefault(fingerprint, []).append(index)
     
     if debug:
         print(f"\n[DEBUG] Story ID map has {len(story_id_map)} entries")
@@ -181,48 +317,80 @@ def find_matches(pending_stubs: List[StubEntry],
             for fp in sample_fingerprints:
                 print(f"  - {fp}")
     
-    # Try to match each stub
-    matched_count = 0
-    no_match_count = 0
-    
-    for stub in pending_stubs:
-        matched_email = None
-        match_method = None
-        
-        # Try Story ID match first
-        if stub.story_id:
-            if stub.story_id in story_id_map:
-                matched_email = story_id_map[stub.story_id]
-                match_method = "Story ID"
-                if debug and matched_count < 3:
-                    print(f"\n[DEBUG] ✓ Story ID match: {stub.story_id}")
-                    print(f"  Stub: {stub.subject[:60]}")
-                    print(f"  Email: {matched_email['subject'][:60]}")
-        
-        # Fallback to fingerprint
-        if not matched_email and stub.fingerprint:
-            if stub.fingerprint in fingerprint_map:
-                matched_email = fingerprint_map[stub.fingerprint]
-                match_method = "Fingerprint"
-                if debug and matched_count < 3:
-                    print(f"\n[DEBUG] ✓ Fingerprint match:")
-                    print(f"  Stub fingerprint: {stub.fingerprint}")
-                    print(f"  Stub subject: {stub.subject[:60]}")
-                    print(f"  Email subject: {matched_email['subject'][:60]}")
-        
-        if matched_email:
-            matched_count += 1
-            logger.info(f"  ✓ MATCH ({match_method}): {stub.subject[:50]}...")
-            matches.append((stub, matched_email))
+    # Probe each indexed email against the stub maps
+    # (stub index -> matched email; later emails win, as before)
+    story_id_matches = {}
+    fingerprint_matches = {}
+    
+    email_count = 0
+    emails_with_story_id = 0
+    
+    for email_meta in indexed_emails:
+        if stats is not None:
+            email_count += 1
+            if email_meta['story_id']:
+                emails_with_story_id += 1
+        
+        # Most emails miss: skip the probe entirely when no stub has a Story ID
+        if story_id_map:
+            for index in story_id_map.get(email_meta['story_id'], ()):
+                if index not in story_id_matches:
+                    # Matched by Story ID: the fingerprint fallback is no longer needed
+                    _discard_fingerprint(fingerprint_map, pending_stubs[index].fingerprint, index)
+                    fingerprint_matches.pop(index, None)
+                story_id_matches[index] = email_meta
+        
+        # Only probe fingerprints while some stub still needs the fallback
+        if fingerprint_map:
+            for index in fingerprint_map.get(email_meta['fingerprint'], ()):
+                fingerprint_matches[index] = email_meta
+    
+    # Resolve each stub: Story ID match first, fingerprint as fallback
+    # Debug details are printed for the first 3 matches / misses only
+    match_debug_budget = 3 if debug else 0
+    miss_debug_budget = 3 if debug else 0
+    log_matches = logger.isEnabledFor(logging.INFO)
+    
+    for index, stub in enumerate(pending_stubs):
+        if index in story_id_matches:
+            matched_email = story_id_matches[index]
+            match_method = "Story ID"
+            if match_debug_budget:
+                print(f"\n[DEBUG] ✓ Story ID match: {stub.story_id}")
+                print(f"  Stub: {stub.subject[:60]}")
+                print(f"  Email: {matched_email['subject'][:60]}")
+        
+        elif index in fingerprint_matches:
+            matched_email = fingerprint_matches[index]
+            match_method = "Fingerprint"
+            if match_debug_budget:
+                print(f"\n[DEBUG] ✓ Fingerprint match:")
+                print(f"  Stub fingerprint: {stub.fingerprint}")
+                print(f"  Stub subject: {stub.subject[:60]}")
+                print(f"  Email subject: {matched_email['subject'][:60]}")
+        
         else:
-            no_match_count += 1
-            if debug and no_match_count <= 3:
+            if miss_debug_budget:
+                miss_debug_budget -= 1
                 print(f"\n[DEBUG] ✗ No match for stub:")
                 print(f"  Subject: {stub.subject[:60]}")
                 print(f"  Story ID: {stub.story_id or '(none)'}")
                 print(f"  Fingerprint: {stub.fingerprint}")
+            continue
+        
+        if match_debug_budget:
+            match_debug_budget -= 1
+        if log_matches:
+            logger.info("  ✓ MATCH (%s): %s...", match_method, stub.subject[:50])
+        matches.append((stub, matched_email))
+    
+    if stats is not None:
+        stats['stubs'] = len(pending_stubs)
+        stats['stubs_with_story_id'] = sum(len(indexes) for indexes in story_id_map.values())
+        stats['emails'] = email_count
+        stats['emails_with_story_id'] = emails_with_story_id
     
-    logger.info(f"Found {len(matches)} matches out of {len(pending_stubs)} pending stubs")
+    logger.info("Found %d matches out of %d pending stubs", len(matches), len(pending_stubs))
     return matches
 
 
@@ -247,6 +415,12 @@ def reconcile_stubs(matches: List[Tuple[StubEntry, Dict]],
     
     logger.info(f"Reconciling {len(matches)} orphaned stubs...")
     
+    # Move all matched stubs in one batch (single /processed/ lookup,
+    # single registry save)
+    results = {}
+    if not dry_run:
+        results = stub_matcher.complete_stubs([stub for stub, _ in matches], outlook_extractor)
+    
     for stub, matched_email in matches:
         logger.info(f"\nProcessing stub: {stub.subject}")
         logger.info(f"  Matched with: {matched_email['subject']}")
@@ -256,25 +430,26 @@ def reconcile_stubs(matches: List[Tuple[StubEntry, Dict]],
             stats['completed'] += 1
             continue
         
-        try:
-            success = stub_matcher.complete_stub(stub, outlook_extractor)
-            
-            if success:
-                stats['completed'] += 1
-                logger.info(f"  ✓ Successfully reconciled stub")
-            else:
-                stats['failed'] += 1
-                logger.error(f"  ✗ Failed to reconcile stub")
-                
-        except Exception as e:
+        if results.get(stub.outlook_entry_id):
+            stats['completed'] += 1
+            logger.info(f"  ✓ Successfully reconciled stub")
+        else:
             stats['failed'] += 1
-            logger.error(f"  ✗ Error reconciling stub: {e}")
+            logger.error(f"  ✗ Failed to reconcile stub")
     
     return stats
 
 
-def main():
-    """Main entry point."""
+def main(argv=None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code
+    """
     parser = argparse.ArgumentParser(
         description='Reconcile orphaned stubs with indexed emails'
     )
@@ -295,7 +470,7 @@ def main():
         help='Enable verbose logging'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Setup logging
     setup_logging(args.verbose or args.debug)
@@ -338,32 +513,49 @@ def main():
         outlook_extractor.connect()
         logger.info("Connected successfully")
         
-        # Step 1: Extract metadata from /indexed/ emails
+        # Step 1: Get pending stubs
+        pending_stubs = stub_registry.get_all_pending()
+        
+        if not pending_stubs:
+            print("\nNo pending stubs in registry")
+            return 0
+        
+        logger.info(f"Found {len(pending_stubs)} pending stubs in registry")
+        
+        # Step 2: Extract metadata from /indexed/ emails
+        # (Story IDs are only worth extracting if some stub can match on them)
+        fingerprint_cache = load_fingerprint_cache(persistence_config.fingerprint_cache_json)
         indexed_emails = extract_indexed_emails_metadata(
             outlook_extractor,
             content_cleaner,
-            metadata_extractor
+            metadata_extractor,
+            extract_story_ids=any(stub.story_id for stub in pending_stubs),
+            fingerprint_cache=fingerprint_cache
         )
         
-        if not indexed_emails:
+        first_email = next(indexed_emails, None)
+        if first_email is None:
             print("\nNo emails found in /indexed/ folder")
             return 0
+        indexed_emails = chain((first_email,), indexed_emails)
         
-        # Step 2: Get pending stubs
-        pending_stubs = stub_registry.get_all_pending()
-        
-        if not pending_stubs:
-            print("\nNo pending stubs in registry")
-            return 0
+        # Show debug samples if requested (only the first emails are taken,
+        # the rest keeps streaming into find_matches)
+        debug_stats = None
+        if args.debug:
+            sample_emails = list(islice(indexed_emails, DEBUG_SAMPLES))
+            indexed_emails = chain(sample_emails, indexed_emails)
+            print_debug_samples(pending_stubs, sample_emails, DEBUG_SAMPLES)
+            debug_stats = {}
         
-        logger.info(f"Found {len(pending_stubs)} pending stubs in registry")
+        # Step 3: Find matches
+        matches = find_matches(pending_stubs, indexed_emails, debug=args.debug, stats=debug_stats)
         
-        # Show debug samples if requested
         if args.debug:
-            print_debug_samples(pending_stubs, indexed_emails)
+            print_debug_statistics(debug_stats)
         
-        # Step 3: Find matches
-        matches = find_matches(pending_stubs, indexed_emails, debug=args.debug)
+        # The scan is complete: persist fingerprints for the next run
+        save_fingerprint_cache(persistence_config.fingerprint_cache_json, fingerprint_cache)
         
         if not matches:
             print("\n" + "=" * 60)
@@ -7,6 +7,7 @@ This script resets the system to initial state by deleting:
 - Stub registry
 - Saved documents
 - Last sync statistics
+- Topic/author summary
 - Temporary files
 
 IMPORTANT: This does NOT affect emails in Outlook folders.
@@ -17,56 +18,149 @@ Usage:
     python scripts/reset_system.py --force  # Skip confirmation
 """
 
+import os
 import sys
 import json
 from pathlib import Path
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from config.settings import get_persistence_config, get_vectorstore_config
 
 
+def _directory_listing(directory: Path, listings: dict) -> dict:
+    """
+    List a directory once with os.scandir (memoized in listings).
+    
+    Args:
+        directory: Directory to list
+        listings: Cache dict directory -> {name: os.DirEntry}
+        
+    Returns:
+        Dict entry name -> os.DirEntry (empty if directory is missing)
+    """
+    if directory not in listings:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name: entry for entry in entries}
+        except OSError:
+            listings[directory] = {}
+    return listings[directory]
+
+
+def _tree_size(directory) -> int:
+    """
+    Total size of files under a directory (iterative os.scandir walk).
+    
+    DirEntry caches file type and, on Windows, stat info, so no extra
+    stat call per file is needed.
+    
+    Args:
+        directory: Directory to measure
+        
+    Returns:
+        Size in bytes
+    """
+    total = 0
+    stack = [directory]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    
+    return total
+
+
+def _directory_size(directory: Path) -> int:
+    """
+    Total size of files under a directory.
+    
+    Top-level subdirectories are measured concurrently: stat calls are
+    I/O-bound, which matters on network shares.
+    
+    Args:
+        directory: Directory to measure
+        
+    Returns:
+        Size in bytes
+    """
+    total = 0
+    subdirs = []
+    
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return total
+    
+    if subdirs:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            total += sum(executor.map(_tree_size, subdirs))
+    
+    return total
+
+
 def get_files_to_delete() -> list:
     """
     Get list of files and directories to delete.
     
+    Each parent directory is listed once with os.scandir instead of
+    one exists() call per candidate path.
+    
     Returns:
         List of (Path, description) tuples
     """
     persistence_config = get_persistence_config()
     vectorstore_config = get_vectorstore_config()
     
-    files = []
-    
-    # FAISS index
-    if vectorstore_config.index_path.exists():
-        files.append((vectorstore_config.index_path, "FAISS vector store"))
-    
-    # Stub registry
-    if persistence_config.stub_registry_json.exists():
-        files.append((persistence_config.stub_registry_json, "Stub registry"))
-    
-    # Documents pickle
-    if persistence_config.emails_pickle.exists():
-        files.append((persistence_config.emails_pickle, "Saved documents"))
+    data_dir = PROJECT_ROOT / "data"
     
-    # Last sync stats
-    if persistence_config.last_sync_json.exists():
-        files.append((persistence_config.last_sync_json, "Last sync statistics"))
+    candidates = [
+        (vectorstore_config.index_path, "FAISS vector store"),
+        # Sidecar of FAISSVectorStore.save (see FAISSVectorStore.meta_path)
+        (vectorstore_config.index_path.with_suffix('.meta.json'), "FAISS index size/dimension"),
+        (vectorstore_config.hnsw_index_path, "FAISS HNSW index"),
+        (vectorstore_config.bm25_index_path, "BM25 keyword index"),
+        (persistence_config.stub_registry_json, "Stub registry"),
+        (persistence_config.stub_rebuild_json, "Stub registry rebuild state"),
+        (persistence_config.fingerprint_cache_json, "Fingerprint cache"),
+        (persistence_config.emails_pickle, "Saved documents"),
+        (persistence_config.last_sync_json, "Last sync statistics"),
+        (persistence_config.stats_summary_json, "Topic/author summary"),
+        (persistence_config.backup_dir, "Backup directory"),
+        (data_dir / "temp", "Temporary files"),
+    ]
     
-    # Backup directory
-    if persistence_config.backup_dir.exists():
-        files.append((persistence_config.backup_dir, "Backup directory"))
+    listings = {}
+    files = []
     
-    # Temp directory (if exists)
-    data_dir = PROJECT_ROOT / "data"
-    temp_dir = data_dir / "temp"
-    if temp_dir.exists():
-        files.append((temp_dir, "Temporary files"))
+    for path, description in candidates:
+        if path.name not in _directory_listing(path.parent, listings):
+            continue
+        
+        # Backup directory is always created by config, so only count it if non-empty
+        if path == persistence_config.backup_dir and not _directory_listing(path, listings):
+            continue
+        
+        files.append((path, description))
     
     return files
 
@@ -88,7 +182,7 @@ def display_files_to_delete(files: list):
     
     for path, description in files:
         if path.is_dir():
-            size = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+            size = _directory_size(path)
             size_str = f"{size / 1024:.1f} KB"
             item_type = "DIR"
         else:
@@ -130,6 +224,40 @@ def confirm_reset() -> bool:
             print("Please enter Y or N")
 
 
+def _remove_tree(directory: Path) -> None:
+    """
+    Delete a directory tree, unlinking files concurrently.
+    
+    Files are collected with os.scandir and unlinked in a thread pool,
+    then the (now empty) directories are removed deepest first.
+    shutil.rmtree finishes the job if anything is left over.
+    
+    Args:
+        directory: Directory to delete
+    """
+    files = []
+    dirs = [str(directory)]
+    stack = [str(directory)]
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    
+    if files:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(os.unlink, files))
+    
+    # Children were appended after their parents
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
 def delete_files(files: list):
     """
     Delete files and directories.
@@ -147,7 +275,11 @@ def delete_files(files: list):
     for path, description in files:
         try:
             if path.is_dir():
-                shutil.rmtree(path)
+                try:
+                    _remove_tree(path)
+                except OSError:
+                    # Leftovers (e.g. read-only files): let rmtree report them
+                    shutil.rmtree(path)
                 print(f"OK Deleted {description} (directory)")
             else:
                 path.unlink()
@@ -165,8 +297,16 @@ def delete_files(files: list):
         print(f"Errors: {error_count} items")
 
 
-def main():
-    """Main entry point."""
+def main(argv=None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code
+    """
     parser = argparse.ArgumentParser(
         description='Reset Bloomberg RAG system to initial state'
     )
@@ -176,7 +316,7 @@ def main():
         help='Skip confirmation prompt'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     print("="*60)
     print("BLOOMBERG RAG - SYSTEM RESET")
@@ -14,20 +14,31 @@ Usage:
     python scripts/search.py "Federal Reserve interest rates"
     python scripts/search.py --interactive
     python scripts/search.py --query "Tesla" --topics Technology --top-k 5
+    python scripts/search.py "Tesla" --json  # machine-readable output
+    python scripts/search.py --queries-file queries.txt  # one query per line
 """
 
 import sys
+import atexit
 from pathlib import Path
 from datetime import datetime
-import argparse
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Iterator, Optional
+from contextlib import redirect_stdout
+
+try:
+    import orjson
+except ImportError:  # Optional: faster --json output
+    orjson = None
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.embedding.generator import EmbeddingGenerator
-from src.vectorstore.faiss_store import FAISSVectorStore
-from src.retrieval.hybrid_retriever import HybridRetriever
+# NOTE: retrieval components (torch, sentence-transformers, faiss) are
+# imported inside main(), so --help and argument errors return immediately
 from config.settings import (
     get_embedding_config,
     get_vectorstore_config,
@@ -35,122 +46,560 @@ from config.settings import (
 )
 
 
-def format_article(article: dict, rank: int) -> str:
+# ============================================================================
+# DISPLAY FORMATTING
+# ============================================================================
+
+SEPARATOR = '=' * 80
+PREVIEW_LENGTH = 200  # Body characters shown per result
+
+DAEMON_CONNECT_TIMEOUT = 0.5  # seconds (localhost refuses at once if not running)
+DAEMON_REPLY_TIMEOUT = 30.0  # seconds for the whole reply, then search in-process
+
+
+@lru_cache(maxsize=128)
+def _embed_query(embedding_generator, normalized_query: str):
+    """Embed a normalized query once; repeated queries reuse the vector."""
+    embedding = embedding_generator.generate_single_embedding(normalized_query)
+    embedding.flags.writeable = False  # Shared between calls
+    return embedding
+
+
+def get_query_embedding(retriever, query: str):
     """
-    Format article for display.
+    Get the (cached) embedding of a query.
+    
+    Queries differing only in whitespace share the same cache entry,
+    so re-running a query after 'set top_k' / 'set weight' skips the
+    embedding model entirely.
+    
+    Args:
+        retriever: HybridRetriever instance
+        query: Search query string
+        
+    Returns:
+        Query embedding (read-only numpy array)
+    """
+    embedding_generator = retriever.semantic_retriever.embedding_generator
+    return _embed_query(embedding_generator, ' '.join(query.split()))
+
+
+def make_preview(body: str) -> str:
+    """
+    Build the one-line body preview (first PREVIEW_LENGTH chars).
+    
+    Args:
+        body: Full body text
+        
+    Returns:
+        Preview text, with "..." if the body was truncated
+    """
+    preview = body[:PREVIEW_LENGTH].replace('\n', ' ').strip()
+    return f"{preview}..." if len(body) > PREVIEW_LENGTH else preview
+
+
+def _to_article(result, full_body: bool = False) -> dict:
+    """
+    Flatten a HybridSearchResult into the dict shown by format_article.
+    
+    The body is cut to its preview here, so only PREVIEW_LENGTH chars
+    per result are carried into formatting / JSON output.
+    
+    Args:
+        result: HybridSearchResult instance
+        full_body: Also include the full body text
+        
+    Returns:
+        Article dictionary
+    """
+    document = result.document
+    preview = result.metadata_preview
+    
+    if isinstance(document, dict):
+        get = document.get
+        subject = get('subject', 'Unknown')
+        body = get('body') or ''
+        date = (get('bloomberg_metadata') or {}).get('article_date') or get('received_date')
+        if isinstance(date, str):
+            date = date[:10]
+    else:
+        subject = document.subject
+        body = document.body or ''
+        bloomberg_metadata = document.bloomberg_metadata
+        date = (bloomberg_metadata and bloomberg_metadata.article_date) or document.received_date
+    
+    author, topics, people, tickers = map(preview.get, ('author', 'topics', 'people', 'tickers'))
+    
+    article = {
+        'subject': subject,
+        'combined_score': result.combined_score,
+        'semantic_score': result.score,
+        'temporal_score': result.recency_score,
+        'topics': topics,
+        'people': people,
+        'tickers': tickers,
+        'preview': make_preview(body)
+    }
+    if full_body:
+        article['body'] = body
+    if date:
+        article['date'] = date
+    if author:
+        article['author'] = author
+    
+    return article
+
+
+def iter_format_article(article: dict, rank: int) -> Iterator[str]:
+    """
+    Format article for display, one block at a time.
     
     Args:
         article: Article dictionary with metadata
         rank: Result rank number
         
-    Returns:
-        Formatted string
+    Yields:
+        Display blocks of one or more lines (without trailing newline)
     """
-    lines = []
-    lines.append(f"\n{'='*80}")
-    lines.append(f"RESULT #{rank}")
-    lines.append(f"{'='*80}")
+    get = article.get
     
-    # Title
-    if 'subject' in article:
-        lines.append(f"📰 {article['subject']}")
+    # Header and title
+    subject = get('subject')
+    if subject is not None:
+        yield f"\n{SEPARATOR}\nRESULT #{rank}\n{SEPARATOR}\n📰 {subject}"
+    else:
+        yield f"\n{SEPARATOR}\nRESULT #{rank}\n{SEPARATOR}"
     
     # Date and Author
-    metadata_line = []
-    if 'date' in article:
-        date_str = article['date'].strftime('%Y-%m-%d') if hasattr(article['date'], 'strftime') else str(article['date'])
-        metadata_line.append(f"📅 {date_str}")
-    if 'author' in article:
-        metadata_line.append(f"✍️ {article['author']}")
-    if metadata_line:
-        lines.append(" | ".join(metadata_line))
+    date = get('date')
+    author = get('author')
+    if date is not None:
+        date_str = date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
+        yield f"📅 {date_str} | ✍️ {author}" if author is not None else f"📅 {date_str}"
+    elif author is not None:
+        yield f"✍️ {author}"
     
     # Scores
-    if 'combined_score' in article:
-        lines.append(f"\n🎯 Combined Score: {article['combined_score']:.4f}")
-        if 'semantic_score' in article:
-            lines.append(f"   └─ Semantic: {article['semantic_score']:.4f}")
-        if 'temporal_score' in article:
-            lines.append(f"   └─ Temporal: {article['temporal_score']:.4f}")
-    
-    # Topics
-    if 'topics' in article and article['topics']:
-        topics = ', '.join(article['topics'][:5])  # Show first 5
-        lines.append(f"\n🏷️  Topics: {topics}")
-    
-    # People
-    if 'people' in article and article['people']:
-        people = ', '.join(article['people'][:5])  # Show first 5
-        lines.append(f"👤 People: {people}")
-    
-    # Tickers
-    if 'tickers' in article and article['tickers']:
-        tickers = ', '.join(article['tickers'][:10])  # Show first 10
-        lines.append(f"💹 Tickers: {tickers}")
-    
-    # Preview (first 200 chars of body)
-    if 'body' in article:
-        preview = article['body'][:200].replace('\n', ' ').strip()
-        if len(article['body']) > 200:
-            preview += "..."
-        lines.append(f"\n📝 Preview: {preview}")
-    
-    return '\n'.join(lines)
+    combined_score = get('combined_score')
+    if combined_score is not None:
+        semantic_score = get('semantic_score')
+        temporal_score = get('temporal_score')
+        yield (
+            f"\n🎯 Combined Score: {combined_score:.4f}"
+            + (f"\n   └─ Semantic: {semantic_score:.4f}" if semantic_score is not None else '')
+            + (f"\n   └─ Temporal: {temporal_score:.4f}" if temporal_score is not None else '')
+        )
+    
+    # Topics / People / Tickers (first 5 / 5 / 10)
+    topics = get('topics')
+    if topics:
+        yield f"\n🏷️  Topics: {', '.join(topics[:5])}"
+    people = get('people')
+    if people:
+        yield f"👤 People: {', '.join(people[:5])}"
+    tickers = get('tickers')
+    if tickers:
+        yield f"💹 Tickers: {', '.join(tickers[:10])}"
+    
+    # Preview (first PREVIEW_LENGTH chars of body)
+    preview = get('preview')
+    if preview is None:
+        body = get('body')
+        preview = make_preview(body) if body is not None else None
+    if preview is not None:
+        yield f"\n📝 Preview: {preview}"
 
 
-def search(retriever, query: str, top_k: int = 10, recency_weight: float = 0.3, 
-          start_date: str = None, end_date: str = None, topics: list = None,
-          people: list = None, tickers: list = None):
+def format_article(article: dict, rank: int) -> str:
     """
-    Execute search and display results.
+    Format article for display.
     
     Args:
-        retriever: HybridRetriever instance
-        query: Search query string
-        top_k: Number of results to return
-        recency_weight: Weight for temporal scoring (0.0-1.0)
-        start_date: Start date filter (YYYY-MM-DD)
-        end_date: End date filter (YYYY-MM-DD)
+        article: Article dictionary with metadata
+        rank: Result rank number
+        
+    Returns:
+        Formatted string
+    """
+    return '\n'.join(iter_format_article(article, rank))
+
+
+def build_filters(start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                  topics: list = None, people: list = None, tickers: list = None) -> dict:
+    """
+    Build the metadata filters dict (MetadataFilter format).
+    
+    Args:
+        start_date: Start date filter (already parsed)
+        end_date: End date filter (already parsed)
         topics: List of topics to filter by
         people: List of people to filter by
         tickers: List of tickers to filter by
+        
+    Returns:
+        Filters dictionary (empty if no filter is set)
     """
-    print(f"\n🔍 Searching for: \"{query}\"")
-    print(f"   Settings: top_k={top_k}, recency_weight={recency_weight}")
-    
-    # Build filters
     filters = {}
-    if start_date:
-        filters['start_date'] = datetime.strptime(start_date, '%Y-%m-%d')
-    if end_date:
-        filters['end_date'] = datetime.strptime(end_date, '%Y-%m-%d')
+    if start_date or end_date:
+        filters['date_range'] = (start_date, end_date)
     if topics:
         filters['topics'] = topics
     if people:
         filters['people'] = people
     if tickers:
         filters['tickers'] = tickers
+    return filters
+
+
+def _print_search_header(query: str, top_k: int, recency_weight: float, fusion: str, filters: dict):
+    """Print the query and its settings/filters."""
+    print(f"\n🔍 Searching for: \"{query}\"")
+    if fusion == 'rrf':
+        print(f"   Settings: top_k={top_k}, fusion=rrf")
+    else:
+        print(f"   Settings: top_k={top_k}, recency_weight={recency_weight}")
     
     if filters:
         print(f"   Filters: {filters}")
+
+
+def _to_json_articles(results, full_body: bool = False) -> list:
+    """Flatten results for JSON output (article dicts with their rank)."""
+    articles = []
+    for rank, result in enumerate(results, 1):
+        article = _to_article(result, full_body=full_body)
+        article['rank'] = rank
+        articles.append(article)
+    return articles
+
+
+def display_results(results):
+    """
+    Print formatted results.
+    
+    Args:
+        results: List of HybridSearchResult objects
+    """
+    print(f"\n✅ Found {len(results)} results\n")
+    
+    stdout = sys.stdout
+    if stdout.isatty():
+        # Terminal: show each article as soon as it is formatted
+        # (one write + flush per article)
+        for i, result in enumerate(results, 1):
+            stdout.write(format_article(_to_article(result), i) + '\n')
+            stdout.flush()
+        stdout.write(f"\n{SEPARATOR}\n\n")
+    else:
+        # Piped/redirected: a single write for the whole result set
+        articles = [format_article(_to_article(result), i) for i, result in enumerate(results, 1)]
+        articles.append(f"\n{SEPARATOR}\n\n")
+        stdout.write('\n'.join(articles))
+    stdout.flush()
+
+
+def search(retriever, query: str, top_k: int = 10, recency_weight: float = 0.3, 
+          start_date: Optional[datetime] = None, end_date: Optional[datetime] = None, topics: list = None,
+          people: list = None, tickers: list = None, query_embedding=None,
+          fusion: Optional[str] = None, json_output: bool = False,
+          full_body: bool = False):
+    """
+    Execute search and display results.
     
-    print("\nSearching...")
+    Args:
+        retriever: HybridRetriever instance
+        query: Search query string
+        top_k: Number of results to return
+        recency_weight: Weight for temporal scoring (0.0-1.0)
+        start_date: Start date filter (already parsed)
+        end_date: End date filter (already parsed)
+        topics: List of topics to filter by
+        people: List of people to filter by
+        tickers: List of tickers to filter by
+        query_embedding: Optional precomputed query embedding
+        fusion: Score fusion, 'weighted' or 'rrf' (default: retriever setting)
+        json_output: Write only a JSON array of articles (no banners/formatting)
+        full_body: Include the full body in JSON output (default: preview only)
+    """
+    fusion = fusion or retriever.fusion
+    filters = build_filters(start_date, end_date, topics, people, tickers)
+    
+    if not json_output:
+        _print_search_header(query, top_k, recency_weight, fusion, filters)
+        print("\nSearching...")
     
     # Execute search
     results = retriever.search(
         query=query,
         top_k=top_k,
+        filters=filters or None,
         recency_weight=recency_weight,
-        **filters
+        query_embedding=query_embedding,
+        fusion=fusion
     )
     
-    # Display results
-    print(f"\n✅ Found {len(results)} results\n")
+    if json_output:
+        write_json(_to_json_articles(results, full_body))
+    else:
+        display_results(results)
+
+
+def search_many(retriever, queries: list, top_k: int = 10, recency_weight: float = 0.3,
+                start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                topics: list = None, people: list = None, tickers: list = None,
+                fusion: Optional[str] = None, json_output: bool = False,
+                full_body: bool = False):
+    """
+    Execute several searches with shared settings and display results.
+    
+    Queries are embedded in one batch and searched with a single FAISS
+    call (HybridRetriever.search_batch), then shown one after another.
+    
+    Args:
+        retriever: HybridRetriever instance
+        queries: Search query strings
+        top_k .. full_body: Same as search()
+    """
+    fusion = fusion or retriever.fusion
+    filters = build_filters(start_date, end_date, topics, people, tickers)
+    
+    if not json_output:
+        print(f"\nSearching {len(queries)} queries...")
+    
+    results_per_query = retriever.search_batch(
+        queries,
+        top_k=top_k,
+        filters=filters or None,
+        recency_weight=recency_weight,
+        fusion=fusion
+    )
+    
+    if json_output:
+        write_json([
+            {'query': query, 'results': _to_json_articles(results, full_body)}
+            for query, results in zip(queries, results_per_query)
+        ])
+        return
+    
+    for query, results in zip(queries, results_per_query):
+        _print_search_header(query, top_k, recency_weight, fusion, filters)
+        display_results(results)
+
+
+def read_queries_file(path: str) -> list:
+    """
+    Read one query per line (blank lines and # comments are skipped).
+    
+    Args:
+        path: Path of the queries file
+        
+    Returns:
+        List of query strings
+    """
+    with open(path, encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith('#')]
+
+
+def _json_default(obj):
+    """Serialize dates as ISO strings (anything else via str)."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(articles: list):
+    """
+    Write articles to stdout as one JSON array (orjson if available).
+    
+    Args:
+        articles: Article dictionaries (see _to_article)
+    """
+    stdout = sys.stdout
+    
+    if orjson is not None:
+        data = orjson.dumps(articles, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is not None:
+            # Write the UTF-8 bytes as-is (no decode/re-encode)
+            stdout.flush()
+            buffer.write(data)
+            buffer.flush()
+            return
+        stdout.write(data.decode('utf-8'))  # e.g. captured by the search daemon
+    else:
+        import json
+        stdout.write(json.dumps(articles, default=_json_default, ensure_ascii=False) + '\n')
+    stdout.flush()
+
+
+def _fast_date(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date filter.
+    
+    Slices the fixed-width fields and calls datetime() directly, skipping
+    the locale/regex machinery of datetime.strptime.
+    
+    Args:
+        value: Date string (YYYY-MM-DD)
+        
+    Returns:
+        datetime at midnight
+        
+    Raises:
+        ValueError: If value is not a valid YYYY-MM-DD date
+    """
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    if len(value) != 10 or value[4] != '-' or value[7] != '-' or not (year + month + day).isdigit():
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d'")
+    return datetime(int(year), int(month), int(day))
+
+
+# ============================================================================
+# INTERACTIVE PROMPT
+# ============================================================================
+
+HISTORY_PATH = Path.home() / '.bloomberg_rag_history'
+
+COMMAND_WORDS = [
+    'set', 'top_k', 'weight', 'fusion', 'weighted', 'rrf', 'filter', 'topics', 'people', 'tickers',
+    'date', 'clear', 'filters', 'quit', 'exit'
+]
+
+
+def _save_readline_history(readline):
+    """Write readline history on exit (best effort)."""
+    try:
+        readline.write_history_file(str(HISTORY_PATH))
+    except OSError:
+        pass
+
+
+def _build_prompt():
+    """
+    Build the line reader for interactive mode.
+    
+    Uses prompt_toolkit (history + tab completion) when installed,
+    falls back to readline (line editing + history) and finally to
+    plain input(). History is persisted to ~/.bloomberg_rag_history.
+    
+    Returns:
+        Callable taking the prompt string and returning the typed line
+    """
+    if not sys.stdin.isatty():
+        # Piped input: no editing needed
+        return input
+    
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        pass
+    else:
+        session = PromptSession(
+            history=FileHistory(str(HISTORY_PATH)),
+            completer=WordCompleter(COMMAND_WORDS)
+        )
+        return session.prompt
+    
+    try:
+        import readline
+    except ImportError:
+        # e.g. Windows without pyreadline3
+        return input
     
-    for i, article in enumerate(results, 1):
-        print(format_article(article, i))
+    try:
+        readline.read_history_file(str(HISTORY_PATH))
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(_save_readline_history, readline)
+    
+    def complete(text, state):
+        matches = [word for word in COMMAND_WORDS if word.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    readline.set_completer(complete)
+    readline.parse_and_bind('tab: complete')
     
-    print(f"\n{'='*80}\n")
+    return input
+
+
+def _command_set(retriever, state, args: str) -> bool:
+    """Handle 'set <setting> <value>'."""
+    parts = args.split()
+    if len(parts) >= 2:
+        setting = parts[0]
+        value = parts[1]
+        
+        if setting == 'top_k':
+            state.top_k = int(value)
+            print(f"✓ Set top_k = {state.top_k}")
+        elif setting == 'weight':
+            state.recency_weight = float(value)
+            print(f"✓ Set recency_weight = {state.recency_weight}")
+        elif setting == 'fusion':
+            if value in retriever.FUSION_METHODS:
+                state.fusion = value
+                print(f"✓ Set fusion = {state.fusion}")
+            else:
+                print(f"❌ Unknown fusion: {value} (use weighted or rrf)")
+        else:
+            print(f"❌ Unknown setting: {setting}")
+    else:
+        print("❌ Usage: set <setting> <value>")
+    return True
+
+
+def _command_filter(retriever, state, args: str) -> bool:
+    """Handle 'filter <type> <value1> [value2] ...'."""
+    parts = args.split()
+    if len(parts) >= 2:
+        filter_type = parts[0]
+        filter_values = parts[1:]
+        filters = state.filters
+        
+        if filter_type == 'topics':
+            filters['topics'] = filter_values
+            print(f"✓ Filtering by topics: {filter_values}")
+        elif filter_type == 'people':
+            filters['people'] = filter_values
+            print(f"✓ Filtering by people: {filter_values}")
+        elif filter_type == 'tickers':
+            filters['tickers'] = filter_values
+            print(f"✓ Filtering by tickers: {filter_values}")
+        elif filter_type == 'date':
+            if len(filter_values) == 2:
+                filters['start_date'] = _fast_date(filter_values[0])
+                filters['end_date'] = _fast_date(filter_values[1])
+                print(f"✓ Filtering by date: {filter_values[0]} to {filter_values[1]}")
+            else:
+                print("❌ Usage: filter date <start> <end> (YYYY-MM-DD)")
+        else:
+            print(f"❌ Unknown filter type: {filter_type}")
+    else:
+        print("❌ Usage: filter <type> <value1> [value2] ...")
+    return True
+
+
+def _command_clear(retriever, state, args: str) -> bool:
+    """Handle 'clear filters' (any other 'clear ...' is a query)."""
+    if args != 'filters':
+        return False
+    state.filters = {}
+    print("✓ Cleared all filters")
+    return True
+
+
+# First word -> handler(retriever, state, args); a handler returning
+# False lets the input through as a search query
+COMMANDS = {
+    'set': _command_set,
+    'filter': _command_filter,
+    'clear': _command_clear,
+}
+QUIT_COMMANDS = frozenset(('quit', 'exit', 'q'))
 
 
 def interactive_mode(retriever):
@@ -160,114 +609,87 @@ def interactive_mode(retriever):
     Args:
         retriever: HybridRetriever instance
     """
-    print("\n" + "="*80)
+    print("\n" + SEPARATOR)
     print("BLOOMBERG RAG - INTERACTIVE SEARCH")
-    print("="*80)
+    print(SEPARATOR)
     print("\nCommands:")
     print("  <query>                    - Search for query")
     print("  set top_k <n>             - Set number of results")
     print("  set weight <w>            - Set recency weight (0.0-1.0)")
+    print("  set fusion <f>            - Score fusion: weighted | rrf")
     print("  filter topics <t1> <t2>   - Filter by topics")
     print("  filter people <p1> <p2>   - Filter by people")
     print("  filter tickers <t1> <t2>  - Filter by tickers")
     print("  filter date <start> <end> - Filter by date range (YYYY-MM-DD)")
     print("  clear filters             - Clear all filters")
     print("  quit / exit               - Exit interactive mode")
-    print("="*80 + "\n")
+    print(SEPARATOR + "\n")
     
-    # Default settings
-    top_k = 10
-    recency_weight = 0.3
-    filters = {}
+    # Default settings (updated by the command handlers)
+    state = SimpleNamespace(
+        top_k=10,
+        recency_weight=0.3,
+        fusion=retriever.fusion,
+        filters={}
+    )
+    
+    read_line = _build_prompt()
     
     while True:
         try:
-            user_input = input("search> ").strip()
+            user_input = read_line("search> ").strip()
             
             if not user_input:
                 continue
             
             # Exit commands
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if user_input.lower() in QUIT_COMMANDS:
                 print("\nGoodbye!")
                 break
             
-            # Settings commands
-            if user_input.startswith('set '):
-                parts = user_input.split()
-                if len(parts) >= 3:
-                    setting = parts[1]
-                    value = parts[2]
-                    
-                    if setting == 'top_k':
-                        top_k = int(value)
-                        print(f"✓ Set top_k = {top_k}")
-                    elif setting == 'weight':
-                        recency_weight = float(value)
-                        print(f"✓ Set recency_weight = {recency_weight}")
-                    else:
-                        print(f"❌ Unknown setting: {setting}")
-                else:
-                    print("❌ Usage: set <setting> <value>")
-                continue
-            
-            # Filter commands
-            if user_input.startswith('filter '):
-                parts = user_input.split()
-                if len(parts) >= 3:
-                    filter_type = parts[1]
-                    filter_values = parts[2:]
-                    
-                    if filter_type == 'topics':
-                        filters['topics'] = filter_values
-                        print(f"✓ Filtering by topics: {filter_values}")
-                    elif filter_type == 'people':
-                        filters['people'] = filter_values
-                        print(f"✓ Filtering by people: {filter_values}")
-                    elif filter_type == 'tickers':
-                        filters['tickers'] = filter_values
-                        print(f"✓ Filtering by tickers: {filter_values}")
-                    elif filter_type == 'date':
-                        if len(filter_values) == 2:
-                            filters['start_date'] = datetime.strptime(filter_values[0], '%Y-%m-%d')
-                            filters['end_date'] = datetime.strptime(filter_values[1], '%Y-%m-%d')
-                            print(f"✓ Filtering by date: {filter_values[0]} to {filter_values[1]}")
-                        else:
-                            print("❌ Usage: filter date <start> <end> (YYYY-MM-DD)")
-                    else:
-                        print(f"❌ Unknown filter type: {filter_type}")
-                else:
-                    print("❌ Usage: filter <type> <value1> [value2] ...")
-                continue
-            
-            # Clear filters
-            if user_input == 'clear filters':
-                filters = {}
-                print("✓ Cleared all filters")
+            # Commands: one dict lookup on the first word
+            parts = user_input.split(None, 1)
+            handler = COMMANDS.get(parts[0])
+            if handler is not None and len(parts) == 2 and handler(retriever, state, parts[1]):
                 continue
             
             # Otherwise treat as search query
             query = user_input
+            filters = state.filters
             search(
                 retriever=retriever,
                 query=query,
-                top_k=top_k,
-                recency_weight=recency_weight,
-                start_date=filters.get('start_date').strftime('%Y-%m-%d') if filters.get('start_date') else None,
-                end_date=filters.get('end_date').strftime('%Y-%m-%d') if filters.get('end_date') else None,
+                top_k=state.top_k,
+                recency_weight=state.recency_weight,
+                start_date=filters.get('start_date'),
+                end_date=filters.get('end_date'),
                 topics=filters.get('topics'),
                 people=filters.get('people'),
-                tickers=filters.get('tickers')
+                tickers=filters.get('tickers'),
+                query_embedding=get_query_embedding(retriever, query),
+                fusion=state.fusion
             )
             
+        except EOFError:
+            # Ctrl-D / end of piped input
+            print("\nGoodbye!")
+            break
         except KeyboardInterrupt:
             print("\n\nInterrupted. Type 'quit' to exit.")
         except Exception as e:
             print(f"\n❌ Error: {e}")
 
 
-def main():
-    """Main entry point."""
+@lru_cache(maxsize=None)
+def _build_parser():
+    """
+    Build the argument parser (once; later calls reuse it).
+    
+    Returns:
+        argparse.ArgumentParser for the search script
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Search Bloomberg emails'
     )
@@ -294,6 +716,18 @@ def main():
         default=0.3,
         help='Recency weight 0.0-1.0 (default: 0.3)'
     )
+    parser.add_argument(
+        '--fusion',
+        choices=['weighted', 'rrf'],
+        help='Score fusion: weighted (uses --weight) or rrf (Reciprocal Rank Fusion) '
+             '(default: RetrievalConfig.score_fusion)'
+    )
+    parser.add_argument(
+        '--exact-rerank-k',
+        type=int,
+        default=None,
+        help='HNSW shortlist size re-ranked exactly on large indices (default: 4 x top-k)'
+    )
     parser.add_argument(
         '--start-date',
         help='Start date filter (YYYY-MM-DD)'
@@ -317,46 +751,307 @@ def main():
         nargs='+',
         help='Ticker filters'
     )
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Search in-process even if scripts/search_daemon.py is running'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print results as a JSON array (one-shot queries only)'
+    )
+    parser.add_argument(
+        '--full-body',
+        action='store_true',
+        help='With --json, include the full body text (default: preview only)'
+    )
+    parser.add_argument(
+        '--queries-file',
+        help='Run every query in this file (one per line) as one batch'
+    )
+    
+    return parser
+
+
+def parse_args(argv=None):
+    """
+    Parse and validate command-line arguments.
+    
+    The common single-query invocation (search.py "query") skips
+    argparse entirely. Date filters are returned as datetime objects.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments namespace
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast path: one non-blank positional query with all defaults (blank
+    # queries fall through to the parser's validation)
+    if len(argv) == 1 and argv[0].strip() and not argv[0].startswith('-'):
+        return SimpleNamespace(
+            query=argv[0],
+            interactive=False,
+            top_k=10,
+            weight=0.3,
+            exact_rerank_k=None,
+            fusion=None,
+            start_date=None,
+            end_date=None,
+            topics=None,
+            people=None,
+            tickers=None,
+            no_daemon=False,
+            json=False,
+            full_body=False,
+            queries_file=None
+        )
     
-    args = parser.parse_args()
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     # Validate
-    if not args.interactive and not args.query:
-        parser.error("Either provide a query or use --interactive mode")
+    has_query = bool(args.query and args.query.strip())
+    if not args.interactive and not has_query and not args.queries_file:
+        parser.error("Either provide a query, a --queries-file or use --interactive mode")
     
+    # Parse date filters once: search() takes datetime objects
     try:
-        # Initialize components
-        print("Loading vector store and retriever...")
-        
-        embedding_config = get_embedding_config()
-        vectorstore_config = get_vectorstore_config()
-        retrieval_config = get_retrieval_config()
-        
-        # Check if index exists
-        if not vectorstore_config.index_path.exists():
-            print(f"\nError: Vector store not found at {vectorstore_config.index_path}")
-            print("Run 'python scripts/sync_emails.py' first to index emails")
-            return 1
+        args.start_date = _fast_date(args.start_date) if args.start_date else None
+        args.end_date = _fast_date(args.end_date) if args.end_date else None
+    except ValueError as e:
+        parser.error(f"Invalid date filter (expected YYYY-MM-DD): {e}")
+    
+    return args
+
+
+def load_retriever(exact_rerank_k: Optional[int] = None):
+    """
+    Load embedding model, vector store and metadata into a HybridRetriever.
+    
+    Args:
+        exact_rerank_k: HNSW shortlist size (large indices only, default: 4 x top_k)
         
-        # Load components
-        # FIX: Pass model_name string instead of config object
-        embedding_generator = EmbeddingGenerator(embedding_config.model_name)
+    Returns:
+        HybridRetriever instance, or None if the vector store does not exist
+    """
+    from src.embedding.generator import EmbeddingGenerator
+    from src.vectorstore.faiss_store import FAISSVectorStore
+    from src.vectorstore.metadata_mapper import MetadataMapper
+    from src.retrieval.semantic_retriever import SemanticRetriever
+    from src.retrieval.temporal_scorer import TemporalScorer
+    from src.retrieval.metadata_filter import MetadataFilter
+    from src.retrieval.hybrid_retriever import HybridRetriever
+    from src.retrieval.sparse_retriever import BM25Retriever
+    
+    embedding_config = get_embedding_config()
+    vectorstore_config = get_vectorstore_config()
+    retrieval_config = get_retrieval_config()
+    
+    # Check if index exists
+    if not vectorstore_config.index_path.exists():
+        print(f"\nError: Vector store not found at {vectorstore_config.index_path}")
+        print("Run 'python scripts/sync_emails.py' first to index emails")
+        return None
+    
+    # Load components
+    # FIX: Pass model_name string instead of config object
+    embedding_generator = EmbeddingGenerator(embedding_config.model_name)
+    
+    # Read-only use: memory-map the index (shared page cache across runs)
+    vector_store = FAISSVectorStore.load(
+        str(vectorstore_config.index_path),
+        embedding_config.embedding_dim,
+        mmap=True
+    )
+    metadata_mapper = MetadataMapper.load(str(vectorstore_config.metadata_path))
+    
+    # Large indices: search through the HNSW graph saved at sync; without
+    # an up-to-date one, keep the exact flat search
+    if vector_store.get_index_size() >= vectorstore_config.hnsw_min_vectors:
+        try:
+            vector_store.enable_hnsw(
+                str(vectorstore_config.hnsw_index_path),
+                m=vectorstore_config.hnsw_m,
+                candidates=exact_rerank_k,
+                build=False
+            )
+        except RuntimeError as e:
+            print(f"Warning: {e}; using exact search "
+                  "(run 'python scripts/sync_emails.py' to rebuild it)", file=sys.stderr)
+    
+    semantic_retriever = SemanticRetriever(
+        embedding_generator=embedding_generator,
+        vector_store=vector_store,
+        metadata_mapper=metadata_mapper
+    )
+    retriever = HybridRetriever(
+        semantic_retriever=semantic_retriever,
+        temporal_scorer=TemporalScorer(halflife_days=retrieval_config.temporal_halflife_days),
+        metadata_filter=MetadataFilter(),
+        default_recency_weight=retrieval_config.recency_weight,
+        fusion=retrieval_config.score_fusion,
+        rrf_k=retrieval_config.rrf_k,
+        sparse_retriever=BM25Retriever(
+            metadata_mapper,
+            index_path=str(vectorstore_config.bm25_index_path),
+            source_path=str(vectorstore_config.metadata_path)
+        ) if retrieval_config.enable_bm25 else None
+    )
+    
+    print(f"✓ Loaded {vector_store.get_index_size()} documents\n")
+    
+    return retriever
+
+
+# ============================================================================
+# SEARCH DAEMON CLIENT
+# ============================================================================
+
+def build_daemon_request(args, token: str) -> dict:
+    """
+    Build the JSON request sent to scripts/search_daemon.py.
+    
+    Args:
+        args: Parsed arguments namespace
+        token: Daemon token (from RetrievalConfig.daemon_token_path)
         
-        vector_store = FAISSVectorStore.load(
-            str(vectorstore_config.index_path),
-            embedding_config.embedding_dim
-        )
+    Returns:
+        JSON-serializable request dictionary
+    """
+    return {
+        'token': token,
+        'query': args.query,
+        'top_k': args.top_k,
+        'weight': args.weight,
+        'exact_rerank_k': args.exact_rerank_k,
+        'fusion': args.fusion,
+        'start_date': args.start_date.strftime('%Y-%m-%d') if args.start_date else None,
+        'end_date': args.end_date.strftime('%Y-%m-%d') if args.end_date else None,
+        'topics': args.topics,
+        'people': args.people,
+        'tickers': args.tickers,
+        'json': args.json,
+        'full_body': args.full_body
+    }
+
+
+def query_daemon(args) -> Optional[str]:
+    """
+    Forward a one-shot search to the resident search daemon, if running.
+    
+    The daemon must echo the token it wrote for this user; any other
+    reply (e.g. another program listening on the port) is discarded, as
+    is a reply not complete within DAEMON_REPLY_TIMEOUT.
+    
+    Args:
+        args: Parsed arguments namespace
         
-        retriever = HybridRetriever(
-            vector_store=vector_store,
-            embedding_generator=embedding_generator
-        )
+    Returns:
+        Formatted search output, or None if no (genuine, responsive) daemon
+        is listening
+    """
+    import json
+    import hmac
+    import time
+    import socket
+    
+    retrieval_config = get_retrieval_config()
+    
+    try:
+        token = retrieval_config.daemon_token_path.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None  # no daemon running for this user
+    
+    request = json.dumps(build_daemon_request(args, token)).encode('utf-8') + b'\n'
+    
+    try:
+        with socket.create_connection(
+            (retrieval_config.daemon_host, retrieval_config.daemon_port),
+            timeout=DAEMON_CONNECT_TIMEOUT
+        ) as conn:
+            deadline = time.monotonic() + DAEMON_REPLY_TIMEOUT
+            conn.settimeout(DAEMON_REPLY_TIMEOUT)
+            conn.sendall(request)
+            conn.shutdown(socket.SHUT_WR)
+            
+            chunks = []
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                conn.settimeout(remaining)
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    
+    reply_token, _, output = b''.join(chunks).partition(b'\n')
+    if not hmac.compare_digest(reply_token, token.encode('utf-8')):
+        return None
+    
+    return output.decode('utf-8')
+
+
+def main(argv=None):
+    """
+    Main entry point.
+    
+    One-shot queries are answered by scripts/search_daemon.py when it is
+    running (unless --no-daemon); otherwise everything is loaded in-process.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
         
-        print(f"✓ Loaded {vector_store.get_index_size()} documents\n")
+    Returns:
+        Exit code
+    """
+    args = parse_args(argv)
+    
+    if not args.interactive and not args.queries_file and not args.no_daemon:
+        output = query_daemon(args)
+        if output is not None:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            return 0
+    
+    try:
+        # Initialize components (progress goes to stderr with --json,
+        # so stdout carries only the JSON document)
+        with redirect_stdout(sys.stderr if args.json else sys.stdout):
+            print("Loading vector store and retriever...")
+            retriever = load_retriever(args.exact_rerank_k)
+        if retriever is None:
+            return 1
         
         # Execute
         if args.interactive:
             interactive_mode(retriever)
+        elif args.queries_file:
+            queries = read_queries_file(args.queries_file)
+            if not queries:
+                print(f"\n❌ No queries found in {args.queries_file}")
+                return 1
+            search_many(
+                retriever=retriever,
+                queries=queries,
+                top_k=args.top_k,
+                recency_weight=args.weight,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                topics=args.topics,
+                people=args.people,
+                tickers=args.tickers,
+                fusion=args.fusion,
+                json_output=args.json,
+                full_body=args.full_body
+            )
         else:
             search(
                 retriever=retriever,
@@ -367,7 +1062,10 @@ def main():
                 end_date=args.end_date,
                 topics=args.topics,
                 people=args.people,
-                tickers=args.tickers
+                tickers=args.tickers,
+                fusion=args.fusion,
+                json_output=args.json,
+                full_body=args.full_body
             )
         
         return 0
@@ -380,4 +1078,4 @@ def main():
 
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
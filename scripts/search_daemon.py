@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Search Daemon for Bloomberg RAG System.
+
+Keeps the embedding model, FAISS index and retriever loaded in a single
+resident process and answers one-shot searches from scripts/search.py
+over a localhost socket, so each query skips the model/index load.
+
+- Listens on RetrievalConfig.daemon_host:daemon_port (127.0.0.1 only)
+- One JSON request per connection, formatted search output as reply
+- Requests must carry the random token written at start to
+  RetrievalConfig.daemon_token_path (a file only the user can read),
+  so other local users cannot query the mailbox; the reply echoes it
+- Reloads the index when a sync has rewritten it since it was loaded
+
+Usage:
+    python scripts/search_daemon.py
+    python scripts/search.py "Federal Reserve"              # answered by the daemon
+    python scripts/search.py "Federal Reserve" --no-daemon  # always in-process
+"""
+
+import os
+import sys
+import io
+import json
+import hmac
+import secrets
+import socketserver
+from pathlib import Path
+from contextlib import redirect_stdout
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.search import load_retriever, search, _fast_date
+from config.settings import get_retrieval_config, get_vectorstore_config
+
+# A request is one short JSON line; anything longer is not from search.py
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+def write_private_file(path: Path, text: str) -> None:
+    """
+    Write text to a file that only the current user can read.
+    
+    POSIX: created with mode 0600. Windows: the file gets a protected
+    DACL (no inherited entries) granting access to the current user only,
+    set before the text is written.
+    
+    Args:
+        path: File to (re)create
+        text: Content
+        
+    Raises:
+        OSError: If the file cannot be created or restricted
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    
+    try:
+        if sys.platform == 'win32':
+            import win32api
+            import win32security
+            import ntsecuritycon
+            
+            token = win32security.OpenProcessToken(
+                win32api.GetCurrentProcess(), win32security.TOKEN_QUERY
+            )
+            user_sid = win32security.GetTokenInformation(token, win32security.TokenUser)[0]
+            
+            dacl = win32security.ACL()
+            dacl.AddAccessAllowedAce(win32security.ACL_REVISION, ntsecuritycon.FILE_ALL_ACCESS, user_sid)
+            win32security.SetNamedSecurityInfo(
+                str(path),
+                win32security.SE_FILE_OBJECT,
+                win32security.DACL_SECURITY_INFORMATION
+                | win32security.PROTECTED_DACL_SECURITY_INFORMATION,
+                None, None, dacl, None
+            )
+        
+        os.write(fd, text.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+class SearchRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle a single search request.
+    
+    Request: one JSON line (see scripts/search.py build_daemon_request).
+    Reply: the token line, then the same text search() prints; requests
+    without the right token get an empty reply.
+    
+    Requests are served one at a time, so a client that connects and
+    stalls is dropped after `timeout` seconds instead of blocking the daemon.
+    """
+    
+    timeout = 5  # seconds per socket read/write
+    
+    def handle(self):
+        try:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line.endswith(b'\n'):
+                return  # oversized, or the client closed/stalled mid-line
+            request = json.loads(line)
+        except Exception:
+            return
+        
+        if not isinstance(request, dict) or not self.server.check_token(request.get('token')):
+            return
+        
+        # Outside the redirect: reload messages go to the daemon console
+        self.server.reload_if_stale()
+        
+        output = io.StringIO()
+        
+        with redirect_stdout(output):
+            try:
+                self.server.run_search(request)
+            except Exception as e:
+                print(f"\n❌ Error: {e}")
+        
+        self.wfile.write(f"{self.server.token}\n{output.getvalue()}".encode('utf-8'))
+
+
+class SearchDaemon(socketserver.TCPServer):
+    """
+    Single-threaded TCP server holding a loaded HybridRetriever.
+    
+    Requests are served one at a time, so the retriever (and the FAISS
+    index behind it) is never used concurrently.
+    
+    Attributes:
+        retriever: HybridRetriever instance
+        token: Random token clients must send (see write_private_file)
+    """
+    
+    # SO_REUSEADDR on Windows would let a second daemon bind the same port
+    allow_reuse_address = sys.platform != 'win32'
+    
+    def __init__(self, address, retriever, loaded_stamp: tuple):
+        """
+        Initialize and bind the daemon.
+        
+        Args:
+            address: (host, port) tuple to listen on
+            retriever: Loaded HybridRetriever
+            loaded_stamp: index_files_stamp() taken before retriever was loaded
+        """
+        super().__init__(address, SearchRequestHandler)
+        self.retriever = retriever
+        self.token = secrets.token_hex(32)
+        self._loaded_stamp = loaded_stamp
+    
+    def check_token(self, token) -> bool:
+        """Constant-time comparison of a request token with ours."""
+        return isinstance(token, str) and hmac.compare_digest(
+            token.encode('utf-8'), self.token.encode('utf-8')
+        )
+    
+    def reload_if_stale(self):
+        """
+        Reload the retriever if a sync rewrote the index or metadata.
+        
+        On failure (e.g. a sync still writing) the loaded retriever is kept
+        and the reload is retried on the next request.
+        """
+        stamp = index_files_stamp()
+        if stamp == self._loaded_stamp:
+            return
+        
+        print("Index changed on disk, reloading...")
+        try:
+            retriever = load_retriever()
+        except Exception as e:
+            print(f"❌ Reload failed, serving the previous index: {e}")
+            return
+        
+        if retriever is not None:
+            self.retriever = retriever
+            self._loaded_stamp = stamp
+    
+    def run_search(self, request: dict):
+        """
+        Run search() for a decoded request, printing its output.
+        
+        Args:
+            request: Request dictionary from the client
+        """
+        vector_store = self.retriever.semantic_retriever.vector_store
+        if vector_store.hnsw_index is not None:
+            vector_store.hnsw_candidates = request.get('exact_rerank_k')
+        
+        start_date = request.get('start_date')
+        end_date = request.get('end_date')
+        
+        search(
+            retriever=self.retriever,
+            query=request['query'],
+            top_k=request.get('top_k', 10),
+            recency_weight=request.get('weight', 0.3),
+            start_date=_fast_date(start_date) if start_date else None,
+            end_date=_fast_date(end_date) if end_date else None,
+            topics=request.get('topics'),
+            people=request.get('people'),
+            tickers=request.get('tickers'),
+            fusion=request.get('fusion'),
+            json_output=request.get('json', False),
+            full_body=request.get('full_body', False)
+        )
+
+
+def index_files_stamp() -> tuple:
+    """
+    Modification times of the FAISS index and metadata files.
+    
+    Returns:
+        Tuple of st_mtime_ns (None for a missing file)
+    """
+    vectorstore_config = get_vectorstore_config()
+    stamp = []
+    
+    for path in (vectorstore_config.index_path, vectorstore_config.metadata_path):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    
+    return tuple(stamp)
+
+
+def main(argv=None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command-line arguments (unused)
+        
+    Returns:
+        Exit code
+    """
+    retrieval_config = get_retrieval_config()
+    address = (retrieval_config.daemon_host, retrieval_config.daemon_port)
+    
+    print("Loading vector store and retriever...")
+    loaded_stamp = index_files_stamp()
+    retriever = load_retriever()
+    if retriever is None:
+        return 1
+    
+    try:
+        server = SearchDaemon(address, retriever, loaded_stamp)
+    except OSError as e:
+        print(f"\n❌ Cannot listen on {address[0]}:{address[1]}: {e}")
+        return 1
+    
+    token_path = retrieval_config.daemon_token_path
+    
+    with server:
+        # Written only once bound, so a daemon that failed to start never
+        # replaces the token of the one already running
+        try:
+            write_private_file(token_path, server.token)
+        except Exception as e:
+            print(f"\n❌ Cannot write daemon token to {token_path}: {e}")
+            return 1
+        
+        print(f"Search daemon listening on {address[0]}:{address[1]} (Ctrl+C to stop)")
+        
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nSearch daemon stopped")
+        finally:
+            try:
+                token_path.unlink()
+            except OSError:
+                pass
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,7 @@ This script displays the current status of the system:
 Usage:
     python scripts/status.py
     python scripts/status.py --detailed
+    python scripts/status.py --detailed --json
 """
 
 import sys
@@ -19,14 +20,20 @@ import json
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, TYPE_CHECKING
+
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.outlook.extractor import OutlookExtractor
-from src.stub.registry import StubRegistry
-from src.vectorstore.faiss_store import FAISSVectorStore 
 from config.settings import (
     get_outlook_config,
     get_vectorstore_config,
@@ -34,61 +41,108 @@ from config.settings import (
     get_embedding_config
 )
 
+# Outlook (pywin32), registry and FAISS imports are deferred to the code
+# paths that use them, so --help starts fast and the FAISS module is
+# only loaded when the index sidecar is missing
+if TYPE_CHECKING:
+    from src.stub.registry import StubRegistry
+
 
-def count_outlook_folders(outlook_extractor: OutlookExtractor) -> dict:
+def count_outlook_folders(outlook_config) -> dict:
     """
     Count emails in each Outlook folder.
     
+    Meant to run in a worker thread (see print_status): COM is
+    initialized for the calling thread, and the Outlook connection is
+    opened and closed on it.
+    
     Args:
-        outlook_extractor: OutlookExtractor instance
+        outlook_config: OutlookConfig instance
         
     Returns:
         Dictionary with folder counts
+        
+    Raises:
+        Exception: If Outlook cannot be accessed
     """
+    import pythoncom
+    from src.outlook.extractor import OutlookExtractor
+    
+    pythoncom.CoInitialize()
+    outlook_extractor = OutlookExtractor(
+        outlook_config.source_folder,
+        outlook_config.indexed_folder,
+        outlook_config.stubs_folder,
+        outlook_config.processed_folder
+    )
+    
     try:
         outlook_extractor.connect()
-        counts = outlook_extractor.get_folder_counts()
-        return counts
-    except Exception as e:
-        print(f"Warning: Could not access Outlook folders - {e}")
-        return {'source': 0, 'indexed': 0, 'stubs': 0, 'processed': 0}
+        return outlook_extractor.get_folder_counts()
+    finally:
+        try:
+            outlook_extractor.close()
+        except:
+            pass
+        pythoncom.CoUninitialize()
 
 
-def get_vector_store_stats(vector_store: FAISSVectorStore) -> dict:
+def get_vector_store_stats(vectorstore_config, embedding_config) -> dict:
     """
     Get vector store statistics.
     
+    Read from the sidecar written by FAISSVectorStore.save(); the index
+    itself is only opened (memory-mapped) when the sidecar is missing
+    or stale.
+    
     Args:
-        vector_store: FAISSVectorStore instance
+        vectorstore_config: VectorStoreConfig instance
+        embedding_config: EmbeddingConfig instance
         
     Returns:
         Dictionary with vector store stats
     """
+    index_path = vectorstore_config.index_path
+    
+    if not index_path.exists():
+        return {'size': 0, 'dimension': embedding_config.embedding_dim}
+    
+    from src.vectorstore.faiss_store import FAISSVectorStore
+    
+    meta = FAISSVectorStore.read_meta(str(index_path))
+    if meta is not None:
+        return meta
+    
+    vector_store = FAISSVectorStore.load(
+        str(index_path),
+        embedding_config.embedding_dim,
+        mmap=True
+    )
     return {
-        'size': vector_store.index.ntotal if hasattr(vector_store, 'index') and vector_store.index else 0,
-        'dimension': vector_store.dimension if hasattr(vector_store, 'dimension') else 0
+        'size': vector_store.get_index_size(),
+        'dimension': vector_store.dimension
     }
 
 
-def get_stub_stats(stub_registry: StubRegistry) -> dict:
+def get_stub_stats(stub_registry: 'StubRegistry') -> dict:
     """
     Get stub statistics.
     
+    Statuses are counted in one pass over the (slotted) StubEntry list,
+    without building pending/completed lists.
+    
     Args:
         stub_registry: StubRegistry instance
         
     Returns:
         Dictionary with stub stats
     """
-    all_stubs = stub_registry.stubs
-    
-    pending = [s for s in all_stubs if s.status == 'pending']
-    completed = [s for s in all_stubs if s.status == 'completed']
+    status_counts = Counter(stub.status for stub in stub_registry.stubs)
     
     return {
-        'total': len(all_stubs),
-        'pending': len(pending),
-        'completed': len(completed)
+        'total': len(stub_registry.stubs),
+        'pending': status_counts['pending'],
+        'completed': status_counts['completed']
     }
 
 
@@ -106,97 +160,144 @@ def get_last_sync_stats(persistence_config) -> dict:
         if not persistence_config.last_sync_json.exists():
             return None
         
+        if orjson is not None:
+            return orjson.loads(persistence_config.last_sync_json.read_bytes())
+        
         with open(persistence_config.last_sync_json, 'r') as f:
             return json.load(f)
     except Exception:
         return None
 
 
-def get_top_topics(vector_store: FAISSVectorStore, top_n: int = 10) -> list:
+def get_summary_entities(persistence_config, vectorstore_config, top_n: int = 10):
     """
-    Get most common topics in indexed documents.
+    Get top topics and authors from the summary saved by sync.
+    
+    The summary is only used when it is at least as recent as the
+    metadata mapper file (i.e. written by the sync that saved the index).
     
     Args:
-        vector_store: FAISSVectorStore instance
-        top_n: Number of top topics to return
+        persistence_config: PersistenceConfig instance
+        vectorstore_config: VectorStoreConfig instance
+        top_n: Number of top topics / authors to return
         
     Returns:
-        List of (topic, count) tuples
+        Tuple of (top_topics, top_authors), or None if no usable summary exists
     """
     try:
-        if not hasattr(vector_store, 'index') or vector_store.index.ntotal == 0:
-            return []
-            
-        # Check if vector_store has get_all_documents method
-        if not hasattr(vector_store, 'get_all_documents'):
-            return []
-            
-        all_docs = vector_store.get_all_documents()
-        all_topics = []
+        summary_path = persistence_config.stats_summary_json
+        metadata_path = vectorstore_config.metadata_path
+        if not summary_path.exists() or not metadata_path.exists():
+            return None
+        if summary_path.stat().st_mtime < metadata_path.stat().st_mtime:
+            return None
         
-        for doc in all_docs:
-            metadata = doc.get('metadata', {})
-            bloomberg_meta = metadata.get('bloomberg_metadata', {})
-            topics = bloomberg_meta.get('topics', [])
-            all_topics.extend(topics)
+        if orjson is not None:
+            summary = orjson.loads(summary_path.read_bytes())
+        else:
+            with open(summary_path, 'r', encoding='utf-8') as f:
+                summary = json.load(f)
         
-        topic_counts = Counter(all_topics)
-        return topic_counts.most_common(top_n)
+        return (
+            Counter(summary['topic_counts']).most_common(top_n),
+            Counter(summary['author_counts']).most_common(top_n)
+        )
+    except Exception:
+        return None
+
+
+def iter_indexed_metadata(vectorstore_config) -> Iterator[tuple]:
+    """
+    Stream (topics, author) of each indexed document.
+    
+    Only these two Bloomberg metadata fields are projected from the
+    metadata mapper JSON (no MetadataMapper / document objects are built).
+    
+    Args:
+        vectorstore_config: VectorStoreConfig instance
         
-    except Exception as e:
-        print(f"Warning: Could not analyze topics - {e}")
-        return []
+    Yields:
+        (topics, author) tuples (nothing if no index exists)
+    """
+    if not vectorstore_config.metadata_path.exists():
+        return
+    
+    from src.vectorstore.metadata_mapper import MetadataMapper
+    
+    yield from MetadataMapper.iter_bloomberg_metadata(
+        str(vectorstore_config.metadata_path),
+        fields=('topics', 'author')
+    )
 
 
-def get_top_authors(vector_store: FAISSVectorStore, top_n: int = 10) -> list:
+def get_top_entities(metadata_rows: Iterable[tuple], top_n: int = 10) -> tuple:
     """
-    Get most common authors in indexed documents.
+    Get most common topics and authors in indexed documents (one pass).
     
     Args:
-        vector_store: FAISSVectorStore instance
-        top_n: Number of top authors to return
+        metadata_rows: (topics, author) per document (see iter_indexed_metadata)
+        top_n: Number of top topics / authors to return
         
     Returns:
-        List of (author, count) tuples
+        Tuple of (top_topics, top_authors), each a list of (name, count) tuples
     """
     try:
-        if not hasattr(vector_store, 'index') or vector_store.index.ntotal == 0:
-            return []
+        topic_counts = Counter()
+        author_counts = Counter()
+        update_topics = topic_counts.update
         
-        # Check if vector_store has get_all_documents method
-        if not hasattr(vector_store, 'get_all_documents'):
-            return []
-            
-        all_docs = vector_store.get_all_documents()
-        all_authors = []
-        
-        for doc in all_docs:
-            metadata = doc.get('metadata', {})
-            bloomberg_meta = metadata.get('bloomberg_metadata', {})
-            author = bloomberg_meta.get('author')
+        for topics, author in metadata_rows:
+            if topics:
+                update_topics(topics)
             if author:
-                all_authors.append(author)
+                author_counts[author] += 1
         
-        author_counts = Counter(all_authors)
-        return author_counts.most_common(top_n)
+        return topic_counts.most_common(top_n), author_counts.most_common(top_n)
         
     except Exception as e:
-        print(f"Warning: Could not analyze authors - {e}")
-        return []
+        print(f"Warning: Could not analyze topics/authors - {e}")
+        return [], []
 
 
-def print_status(detailed: bool = False) -> None:
+def get_indexed_entities(persistence_config, vectorstore_config, top_n: int = 10) -> tuple:
     """
-    Print system status.
+    Get most common topics and authors in indexed documents.
+    
+    Uses the summary precomputed by sync when it is current, otherwise
+    counts both tables in one pass over the projected metadata.
     
     Args:
-        detailed: If True, show detailed statistics
+        persistence_config: PersistenceConfig instance
+        vectorstore_config: VectorStoreConfig instance
+        top_n: Number of top topics / authors to return
+        
+    Returns:
+        Tuple of (top_topics, top_authors), each a list of (name, count) tuples
+    """
+    entities = get_summary_entities(persistence_config, vectorstore_config, top_n=top_n)
+    if entities is None:
+        entities = get_top_entities(iter_indexed_metadata(vectorstore_config), top_n=top_n)
+    return entities
+
+
+def collect_status(detailed: bool = False) -> dict:
+    """
+    Gather all status sections.
+    
+    The sections are independent and I/O-bound (Outlook COM calls can
+    take seconds), so they are gathered concurrently.
+    
+    Args:
+        detailed: If True, also gather top topics and authors
+        
+    Returns:
+        Dictionary with timestamp, folder_counts, outlook_error, vs_stats,
+        index_file, stub_stats, last_sync (and top_topics, top_authors
+        if detailed)
     """
-    print("="*60)
-    print("BLOOMBERG RAG - SYSTEM STATUS")
-    print("="*60)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    from src.stub.registry import StubRegistry
+    
+    status = {'timestamp': datetime.now()}
     
     # Initialize components
     outlook_config = get_outlook_config()
@@ -204,103 +305,183 @@ def print_status(detailed: bool = False) -> None:
     persistence_config = get_persistence_config()
     embedding_config = get_embedding_config()
     
-    outlook_extractor = OutlookExtractor(
-        outlook_config.source_folder,
-        outlook_config.indexed_folder,
-        outlook_config.stubs_folder,
-        outlook_config.processed_folder
-    )
-    stub_registry = StubRegistry(persistence_config.stub_registry_json)
-    
-    # =============================================================
-    # FIX: Use class method FAISSVectorStore.load() correctly
-    # =============================================================
-    if vectorstore_config.index_path.exists():
-        vector_store = FAISSVectorStore.load(
-            str(vectorstore_config.index_path),
-            embedding_config.embedding_dim
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        folder_counts_future = executor.submit(count_outlook_folders, outlook_config)
+        vs_stats_future = executor.submit(
+            get_vector_store_stats, vectorstore_config, embedding_config
+        )
+        stub_stats_future = executor.submit(
+            lambda: get_stub_stats(StubRegistry(persistence_config.stub_registry_json))
         )
+        last_sync_future = executor.submit(get_last_sync_stats, persistence_config)
+        if detailed:
+            entities_future = executor.submit(
+                get_indexed_entities, persistence_config, vectorstore_config, 10
+            )
+    
+    try:
+        status['folder_counts'] = folder_counts_future.result()
+        status['outlook_error'] = None
+    except Exception as e:
+        status['folder_counts'] = {'source': 0, 'indexed': 0, 'stubs': 0, 'processed': 0}
+        status['outlook_error'] = str(e)
+    
+    status['vs_stats'] = vs_stats_future.result()
+    status['index_file'] = str(vectorstore_config.index_path)
+    status['stub_stats'] = stub_stats_future.result()
+    status['last_sync'] = last_sync_future.result()
+    
+    if detailed:
+        status['top_topics'], status['top_authors'] = entities_future.result()
+    
+    return status
+
+
+def write_status_json(status: dict) -> None:
+    """
+    Write gathered status to stdout as one JSON object (orjson if available).
+    
+    Args:
+        status: Status dictionary (see collect_status)
+    """
+    status = dict(status, timestamp=status['timestamp'].isoformat())
+    
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(status, option=orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
     else:
-        vector_store = FAISSVectorStore(embedding_config.embedding_dim)
+        sys.stdout.write(json.dumps(status, ensure_ascii=False) + '\n')
+
+
+def print_status(detailed: bool = False, json_output: bool = False) -> None:
+    """
+    Print system status.
+    
+    Args:
+        detailed: If True, show detailed statistics
+        json_output: If True, write the gathered data as JSON instead
+                     of the formatted report
+    """
+    status = collect_status(detailed)
+    
+    if json_output:
+        write_status_json(status)
+        return
+    
+    # Sections are buffered and written with a single stdout write
+    lines = [
+        "="*60,
+        "BLOOMBERG RAG - SYSTEM STATUS",
+        "="*60,
+        f"Timestamp: {status['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}",
+        ""
+    ]
     
     # 1. Outlook Folder Counts
-    print("📁 OUTLOOK FOLDERS")
-    print("-"*60)
-    folder_counts = count_outlook_folders(outlook_extractor)
-    print(f"  Source folder:     {folder_counts['source']:>5} emails")
-    print(f"  Indexed:           {folder_counts['indexed']:>5} emails")
-    print(f"  Stubs (pending):   {folder_counts['stubs']:>5} emails")
-    print(f"  Processed (done):  {folder_counts['processed']:>5} emails")
-    print()
+    lines.extend([
+        "📁 OUTLOOK FOLDERS",
+        "-"*60
+    ])
+    if status['outlook_error'] is not None:
+        lines.append(f"Warning: Could not access Outlook folders - {status['outlook_error']}")
+    folder_counts = status['folder_counts']
+    lines.extend([
+        f"  Source folder:     {folder_counts['source']:>5} emails",
+        f"  Indexed:           {folder_counts['indexed']:>5} emails",
+        f"  Stubs (pending):   {folder_counts['stubs']:>5} emails",
+        f"  Processed (done):  {folder_counts['processed']:>5} emails",
+        ""
+    ])
     
     # 2. Vector Store
-    print("🗄️  VECTOR STORE")
-    print("-"*60)
-    vs_stats = get_vector_store_stats(vector_store)
-    print(f"  Documents indexed: {vs_stats['size']:>5}")
-    print(f"  Embedding dimension: {vs_stats['dimension']}")
-    print(f"  Index file: {vectorstore_config.index_path}")
-    print()
+    vs_stats = status['vs_stats']
+    lines.extend([
+        "🗄️  VECTOR STORE",
+        "-"*60,
+        f"  Documents indexed: {vs_stats['size']:>5}",
+        f"  Embedding dimension: {vs_stats['dimension']}",
+        f"  Index file: {status['index_file']}",
+        ""
+    ])
     
     # 3. Stub Statistics
-    print("📋 STUB STATISTICS")
-    print("-"*60)
-    stub_stats = get_stub_stats(stub_registry)
-    print(f"  Total stubs:       {stub_stats['total']:>5}")
-    print(f"  Pending:           {stub_stats['pending']:>5}")
-    print(f"  Completed:         {stub_stats['completed']:>5}")
-    print()
+    stub_stats = status['stub_stats']
+    lines.extend([
+        "📋 STUB STATISTICS",
+        "-"*60,
+        f"  Total stubs:       {stub_stats['total']:>5}",
+        f"  Pending:           {stub_stats['pending']:>5}",
+        f"  Completed:         {stub_stats['completed']:>5}",
+        ""
+    ])
     
     # 4. Last Sync
-    print("🔄 LAST SYNC")
-    print("-"*60)
-    last_sync = get_last_sync_stats(persistence_config)
+    lines.extend([
+        "🔄 LAST SYNC",
+        "-"*60
+    ])
+    last_sync = status['last_sync']
     if last_sync:
         sync_time = datetime.fromisoformat(last_sync['timestamp'])
-        print(f"  Date: {sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"  Emails processed:  {last_sync['total_emails_processed']}")
-        print(f"  to Indexed:         {last_sync['complete_indexed']}")
-        print(f"  to Stubs created:   {last_sync['stubs_created']}")
-        print(f"  to Stubs completed: {last_sync['stubs_completed']}")
-        print(f"  Errors:            {last_sync['errors']}")
-        print(f"  Duration:          {last_sync['duration_seconds']:.2f}s")
+        lines.extend([
+            f"  Date: {sync_time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"  Emails processed:  {last_sync['total_emails_processed']}",
+            f"  to Indexed:         {last_sync['complete_indexed']}",
+            f"  to Stubs created:   {last_sync['stubs_created']}",
+            f"  to Stubs completed: {last_sync['stubs_completed']}",
+            f"  Errors:            {last_sync['errors']}",
+            f"  Duration:          {last_sync['duration_seconds']:.2f}s"
+        ])
     else:
-        print("  No sync performed yet")
-    print()
+        lines.append("  No sync performed yet")
+    lines.append("")
     
     # 5. Detailed stats (if requested)
     if detailed:
-        print("📊 TOP TOPICS")
-        print("-"*60)
-        top_topics = get_top_topics(vector_store, top_n=10)
+        top_topics, top_authors = status['top_topics'], status['top_authors']
+        
+        lines.extend([
+            "📊 TOP TOPICS",
+            "-"*60
+        ])
         if top_topics:
-            for i, (topic, count) in enumerate(top_topics, 1):
-                print(f"  {i:>2}. {topic:<30} {count:>4} articles")
+            lines.extend(
+                f"  {i:>2}. {topic:<30} {count:>4} articles"
+                for i, (topic, count) in enumerate(top_topics, 1)
+            )
         else:
-            print("  No topics data available")
-        print()
+            lines.append("  No topics data available")
+        lines.append("")
         
-        print("✍️  TOP AUTHORS")
-        print("-"*60)
-        top_authors = get_top_authors(vector_store, top_n=10)
+        lines.extend([
+            "✍️  TOP AUTHORS",
+            "-"*60
+        ])
         if top_authors:
-            for i, (author, count) in enumerate(top_authors, 1):
-                print(f"  {i:>2}. {author:<30} {count:>4} articles")
+            lines.extend(
+                f"  {i:>2}. {author:<30} {count:>4} articles"
+                for i, (author, count) in enumerate(top_authors, 1)
+            )
         else:
-            print("  No author data available")
-        print()
+            lines.append("  No author data available")
+        lines.append("")
     
-    # Close Outlook connection
-    try:
-        outlook_extractor.close()
-    except:
-        pass
+    lines.append("="*60)
     
-    print("="*60)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def main():
-    """Main entry point."""
+def main(argv=None):
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code
+    """
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -312,11 +493,16 @@ def main():
         action='store_true',
         help='Show detailed statistics (top topics, authors)'
     )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Output the status data as JSON (for scripts/dashboards)'
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
-        print_status(detailed=args.detailed)
+        print_status(detailed=args.detailed, json_output=args.json)
         return 0
         
     except Exception as e:
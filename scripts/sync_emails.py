@@ -23,31 +23,32 @@ import argparse
 import json
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
+from collections import Counter
+
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.orchestration.ingestion_pipeline import IngestionPipeline
-from src.outlook.extractor import OutlookExtractor
-from src.processing.cleaner import ContentCleaner
-from src.processing.metadata_extractor import MetadataExtractor
-from src.processing.document_builder import DocumentBuilder
-from src.stub.detector import StubDetector
-from src.stub.registry import StubRegistry
-from src.stub.manager import StubManager
-from src.stub.matcher import StubMatcher
-from src.stub.reporter import StubReporter
-from src.embedding.generator import EmbeddingGenerator
-from src.vectorstore.faiss_store import FAISSVectorStore
-from src.vectorstore.metadata_mapper import MetadataMapper
 from config.settings import (
     get_outlook_config,
     get_embedding_config,
     get_vectorstore_config,
+    get_retrieval_config,
     get_persistence_config
 )
 
+# Pipeline, Outlook (pywin32), embedding model and FAISS imports are
+# deferred to the code paths that use them, so --help and argument
+# errors exit without loading them
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration."""
@@ -76,6 +77,18 @@ def initialize_components(max_emails: int = None):
     Returns:
         Tuple of initialized components
     """
+    from src.outlook.extractor import OutlookExtractor
+    from src.processing.cleaner import ContentCleaner
+    from src.processing.metadata_extractor import MetadataExtractor
+    from src.processing.document_builder import DocumentBuilder
+    from src.stub.detector import StubDetector
+    from src.stub.registry import StubRegistry
+    from src.stub.manager import StubManager
+    from src.stub.matcher import StubMatcher
+    from src.embedding.generator import EmbeddingGenerator
+    from src.vectorstore.faiss_store import FAISSVectorStore
+    from src.vectorstore.metadata_mapper import MetadataMapper
+    
     logger = logging.getLogger(__name__)
     logger.info("Initializing components...")
     
@@ -178,6 +191,8 @@ def generate_stub_report(stub_registry, stats=None) -> None:
         stub_registry: StubRegistry instance
         stats: Optional IngestionStats instance
     """
+    from src.stub.reporter import StubReporter
+    
     # StubReporter() takes NO arguments in __init__
     reporter = StubReporter()
     
@@ -214,12 +229,142 @@ def save_sync_stats(stats) -> None:
         'duration_seconds': stats.duration_seconds()
     }
     
-    with open(stats_path, 'w') as f:
-        json.dump(stats_dict, f, indent=2)
+    if orjson is not None:
+        stats_path.write_bytes(orjson.dumps(stats_dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(stats_path, 'w') as f:
+            json.dump(stats_dict, f, indent=2)
+
+
+def _document_topics_author(doc):
+    """Get (topics, author) of a document (handles both dict and EmailDocument)."""
+    if isinstance(doc, dict):
+        bloomberg_metadata = doc.get('bloomberg_metadata') or {}
+        return bloomberg_metadata.get('topics'), bloomberg_metadata.get('author')
+    bloomberg_metadata = getattr(doc, 'bloomberg_metadata', None)
+    if bloomberg_metadata is None:
+        return None, None
+    return bloomberg_metadata.topics, bloomberg_metadata.author
+
+
+def save_stats_summary(metadata_mapper, previous_count: int) -> None:
+    """
+    Update the topic/author counts read by 'status --detailed'.
+    
+    Only the documents added by this sync (inserted after the first
+    previous_count) are counted on top of the saved totals. The totals
+    are rebuilt from the whole mapper when the saved file is missing or
+    does not match previous_count (e.g. after a reset).
+    
+    Args:
+        metadata_mapper: MetadataMapper after the sync
+        previous_count: Number of documents in the mapper before the sync
+    """
+    summary_path = get_persistence_config().stats_summary_json
+    documents = metadata_mapper.id_to_document.values()
+    
+    summary = None
+    if summary_path.exists():
+        try:
+            if orjson is not None:
+                summary = orjson.loads(summary_path.read_bytes())
+            else:
+                with open(summary_path, 'r', encoding='utf-8') as f:
+                    summary = json.load(f)
+        except Exception:
+            summary = None
+    
+    if summary is not None and summary.get('document_count') == previous_count:
+        topic_counts = Counter(summary.get('topic_counts', {}))
+        author_counts = Counter(summary.get('author_counts', {}))
+        new_documents = islice(documents, previous_count, None)
+    else:
+        topic_counts = Counter()
+        author_counts = Counter()
+        new_documents = documents
+    
+    for doc in new_documents:
+        topics, author = _document_topics_author(doc)
+        if topics:
+            topic_counts.update(topics)
+        if author:
+            author_counts[author] += 1
+    
+    summary = {
+        'updated_at': datetime.now().isoformat(),
+        'document_count': metadata_mapper.size(),
+        'topic_counts': topic_counts,
+        'author_counts': author_counts
+    }
+    
+    summary_path.parent.mkdir(exist_ok=True)
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(summary))
+    else:
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
+
+
+def save_bm25_index(metadata_mapper, vectorstore_config) -> None:
+    """
+    Rebuild and save the BM25 keyword index used by search.py.
+    
+    Saved right after the metadata mapper, so searches only load it
+    instead of tokenizing the whole corpus on their first query.
+    
+    Args:
+        metadata_mapper: MetadataMapper after the sync
+        vectorstore_config: VectorStoreConfig instance
+    """
+    if not get_retrieval_config().enable_bm25:
+        return
+    
+    from src.retrieval.sparse_retriever import BM25Retriever
+    
+    BM25Retriever(
+        metadata_mapper,
+        index_path=str(vectorstore_config.bm25_index_path),
+        source_path=str(vectorstore_config.metadata_path)
+    ).build_index()
+
+
+def save_hnsw_index(vector_store, vectorstore_config) -> None:
+    """
+    Rebuild and save the HNSW graph searched by search.py on large indices.
+    
+    Saved right after the vector store: searches only load the graph and
+    fall back to exact search when it is missing or out of date.
+    
+    Args:
+        vector_store: FAISSVectorStore after the sync
+        vectorstore_config: VectorStoreConfig instance
+    """
+    hnsw_path = vectorstore_config.hnsw_index_path
+    
+    # Never reuse a graph from before this sync, even with the same size
+    hnsw_path.unlink(missing_ok=True)
+    if vector_store.get_index_size() < vectorstore_config.hnsw_min_vectors:
+        return  # small index: searched exactly
+    
+    print("Saving HNSW index...")
+    try:
+        vector_store.enable_hnsw(str(hnsw_path), m=vectorstore_config.hnsw_m)
+    except RuntimeError as e:
+        logging.getLogger(__name__).warning(
+            f"HNSW index not saved, searches will use exact search: {e}"
+        )
 
 
-def main():
-    """Main entry point for email sync."""
+def main(argv=None):
+    """
+    Main entry point for email sync.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code
+    """
     parser = argparse.ArgumentParser(
         description='Sync Bloomberg emails from Outlook to vector store'
     )
@@ -241,7 +386,7 @@ def main():
         help='Reset FAISS index and metadata mapper before sync (full rebuild)'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Setup logging
     setup_logging(args.verbose)
@@ -269,8 +414,16 @@ def main():
             metadata_path.unlink()
             print(f"   Deleted: {metadata_path}")
         
+        # Delete topic/author summary
+        summary_path = get_persistence_config().stats_summary_json
+        if summary_path.exists():
+            summary_path.unlink()
+            print(f"   Deleted: {summary_path}")
+        
         print()
     
+    from src.orchestration.ingestion_pipeline import IngestionPipeline
+    
     outlook_extractor = None
     
     try:
@@ -292,6 +445,7 @@ def main():
         
         # Run pipeline
         logger.info("Starting ingestion pipeline...")
+        previous_count = metadata_mapper.size()
         stats = pipeline.run()
         
         # Generate stub report (with stats)
@@ -300,14 +454,19 @@ def main():
         # Save vector store
         print("\nSaving vector store...")
         vector_store.save(str(vectorstore_config.index_path))
+        save_hnsw_index(vector_store, vectorstore_config)
 
         # Save metadata mapper
         print("Saving metadata mapper...")
         metadata_path = vectorstore_config.index_path.parent / "documents_metadata.json"
         metadata_mapper.save(str(metadata_path))
         
+        print("Saving keyword index...")
+        save_bm25_index(metadata_mapper, vectorstore_config)
+        
         # Save stats
         save_sync_stats(stats)
+        save_stats_summary(metadata_mapper, previous_count)
         
         # Print final summary
         print("\n" + "="*60)
@@ -3,12 +3,17 @@ Data models for Bloomberg RAG system.
 Defines EmailDocument and BloombergMetadata dataclasses.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 import numpy as np
 
 
+# dataclass(slots=True) needs Python 3.10+; plain dataclass otherwise
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 @dataclass
 class BloombergMetadata:
     """
@@ -246,7 +251,7 @@ class SearchResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StubEntry:
     """
     Represents a stub email in the registry.
@@ -260,6 +265,7 @@ class StubEntry:
         received_time: When stub was received
         status: "pending" or "completed"
         completed_at: When matching complete email was found
+        received_ts: received_time as epoch seconds (derived, not persisted)
     """
     
     outlook_entry_id: str
@@ -269,6 +275,14 @@ class StubEntry:
     received_time: Optional[datetime]
     status: str = "pending"  # "pending" or "completed"
     completed_at: Optional[datetime] = None
+    received_ts: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Derive integer epoch seconds for cheap age comparisons."""
+        if isinstance(self.received_time, str):
+            self.received_time = datetime.fromisoformat(self.received_time)
+        if self.received_time is not None:
+            self.received_ts = int(self.received_time.timestamp())
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
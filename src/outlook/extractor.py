@@ -4,11 +4,22 @@ Handles connection, navigation, extraction, and moving emails between folders.
 """
 
 import win32com.client
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 from datetime import datetime
 import logging
 
 
+# MAPI property tag (PT_SYSTIME) read through Folder.PropertyAccessor
+PR_LAST_MODIFICATION_TIME = "http://schemas.microsoft.com/mapi/proptag/0x30080040"
+
+# Properties cached by Items.SetColumns for metadata-only scans
+METADATA_COLUMNS = "EntryID, Subject, ReceivedTime"
+
+# DASL filter on PR_MESSAGE_CLASS selecting mail items only (IPM.Note and
+# variants such as IPM.Note.SMIME), evaluated by the store, not in Python
+MAIL_ITEMS_FILTER = '@SQL="http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note%\''
+
+
 class OutlookExtractor:
     """
     Extracts emails from Outlook and manages folder operations.
@@ -94,6 +105,44 @@ class OutlookExtractor:
             self.logger.error(f"ERROR Folder not found: {folder_path}. Error: {e}")
             raise Exception(f"Folder '{folder_path}' not found. Please check the path. Error: {e}")
     
+    def _get_folders(self, folder_paths) -> Dict[str, Any]:
+        """
+        Navigate to several folders in a single traversal.
+        
+        The store root is looked up once and every intermediate folder
+        shared by several paths (e.g. "Inbox/Bloomberg subs" for its
+        subfolders) is resolved once, so each COM round trip is paid once.
+        
+        Args:
+            folder_paths: Iterable of folder paths (e.g., "Inbox/Bloomberg subs/indexed")
+            
+        Returns:
+            Dict folder path -> Outlook folder object (paths not found are left out)
+            
+        Raises:
+            Exception: If not connected to Outlook
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        # Root folder store (parent of the inbox, 6 = olFolderInbox)
+        resolved = {(): self.namespace.GetDefaultFolder(6).Parent}
+        folders = {}
+        
+        for folder_path in folder_paths:
+            names = tuple(folder_path.split("/"))
+            
+            try:
+                for depth in range(1, len(names) + 1):
+                    prefix = names[:depth]
+                    if prefix not in resolved:
+                        resolved[prefix] = resolved[prefix[:-1]].Folders[prefix[-1]]
+                folders[folder_path] = resolved[names]
+            except Exception as e:
+                self.logger.error(f"ERROR Folder not found: {folder_path}. Error: {e}")
+        
+        return folders
+    
     def extract_emails(self, max_count: Optional[int] = None, 
                       sort_by_date_desc: bool = True) -> List[Dict[str, Any]]:
         """
@@ -195,6 +244,220 @@ class OutlookExtractor:
         """Move email to processed folder (completed stubs archive)."""
         return self.move_email(outlook_entry_id, self.processed_folder_path)
     
+    def iter_email_metadata(self, folder_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream email metadata from a folder, one item at a time.
+        
+        Only EntryID, Subject and ReceivedTime are requested from MAPI
+        (Items.SetColumns), so bodies and other properties are never
+        loaded. Items are fetched with GetFirst()/GetNext() as the caller
+        consumes them instead of materializing the whole folder.
+        
+        Args:
+            folder_path: Outlook folder path
+            
+        Yields:
+            Dicts with 'outlook_entry_id', 'subject', 'received_time'
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        # Only mail items (no meeting requests, etc.) are returned
+        items = self.get_folder(folder_path).Items.Restrict(MAIL_ITEMS_FILTER)
+        items.SetColumns(METADATA_COLUMNS)
+        
+        email = items.GetFirst()
+        while email is not None:
+            yield {
+                'outlook_entry_id': email.EntryID,
+                'subject': email.Subject,
+                'received_time': self._convert_outlook_date(email.ReceivedTime)
+            }
+            email = items.GetNext()
+    
+    def iter_table_rows(self, folder_path: str, columns: Tuple[str, ...],
+                        table_filter: str = MAIL_ITEMS_FILTER) -> Iterator[Dict[str, Any]]:
+        """
+        Stream selected properties of folder items via Folder.GetTable().
+        
+        The Table returns only the requested columns, one row per item,
+        with all values fetched by a single Row.GetValues() call instead
+        of one COM roundtrip per property (and no MailItem is opened).
+        
+        Args:
+            folder_path: Outlook folder path
+            columns: Outlook property names (e.g. "EntryID", "Subject")
+            table_filter: Filter applied by the store (default: mail items only)
+            
+        Yields:
+            Dicts mapping each column name to its value
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        table = self.get_folder(folder_path).GetTable(table_filter)
+        table.Columns.RemoveAll()
+        for column in columns:
+            table.Columns.Add(column)
+        
+        while not table.EndOfTable:
+            row = table.GetNextRow()
+            yield dict(zip(columns, row.GetValues()))
+    
+    def get_email_body(self, outlook_entry_id: str) -> str:
+        """
+        Open a single email by EntryID and return its body.
+        
+        Args:
+            outlook_entry_id: Outlook EntryID
+            
+        Returns:
+            Plain text body
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        return self.namespace.GetItemFromID(outlook_entry_id).Body
+    
+    def iter_emails_from_stubs(self) -> Iterator[Dict[str, Any]]:
+        """Stream emails from stubs folder (see iter_email_metadata)."""
+        return self.iter_email_metadata(self.stubs_folder_path)
+    
+    def iter_emails_from_processed(self) -> Iterator[Dict[str, Any]]:
+        """Stream emails from processed folder (see iter_email_metadata)."""
+        return self.iter_email_metadata(self.processed_folder_path)
+    
+    def get_emails_from_stubs(self) -> List[Dict[str, Any]]:
+        """Get all emails from stubs folder."""
+        return list(self.iter_emails_from_stubs())
+    
+    def get_emails_from_processed(self) -> List[Dict[str, Any]]:
+        """Get all emails from processed folder."""
+        return list(self.iter_emails_from_processed())
+    
+    def get_emails_from_processed_soa(self) -> Tuple[List[str], List[str], List[int]]:
+        """
+        Get processed folder emails as parallel columns.
+        
+        Column layout avoids a dict per email and lets callers filter
+        on received time with a single vectorized comparison.
+        
+        Returns:
+            Tuple (entry_ids, subjects, received_ts) where received_ts are
+            epoch seconds
+        """
+        entry_ids = []
+        subjects = []
+        received_ts = []
+        
+        for email in self.iter_emails_from_processed():
+            entry_ids.append(email['outlook_entry_id'])
+            subjects.append(email['subject'])
+            received_ts.append(int(email['received_time'].timestamp()))
+        
+        return entry_ids, subjects, received_ts
+    
+    def delete_email(self, outlook_entry_id: str) -> bool:
+        """
+        Delete a single email (moves it to Deleted Items).
+        
+        Args:
+            outlook_entry_id: Outlook EntryID of the email
+            
+        Returns:
+            True if deleted, False otherwise
+        """
+        return self.delete_emails_batch([outlook_entry_id])[outlook_entry_id] is None
+    
+    def move_emails_batch(self, entry_ids: List[str],
+                          target_folder_path: str) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Move several emails to the same folder in one pass.
+        
+        The target folder is resolved once for the whole batch instead of
+        once per email (see move_email).
+        
+        Args:
+            entry_ids: Outlook EntryIDs of the emails to move
+            target_folder_path: Destination folder path
+            
+        Returns:
+            Dict mapping each EntryID to (success, new_entry_id)
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        target_folder = self.get_folder(target_folder_path)
+        results = {}
+        
+        for entry_id in entry_ids:
+            try:
+                moved_email = self.namespace.GetItemFromID(entry_id).Move(target_folder)
+                results[entry_id] = (True, moved_email.EntryID)  # EntryID changes after move
+            except Exception as e:
+                self.logger.error(f"Failed to move email: {e}")
+                results[entry_id] = (False, None)
+        
+        self.logger.info(f"Moved {sum(1 for ok, _ in results.values() if ok)}/{len(entry_ids)} emails")
+        return results
+    
+    def delete_emails_batch(self, entry_ids: List[str]) -> Dict[str, Optional[Exception]]:
+        """
+        Delete several emails in one pass over the current MAPI session.
+        
+        The Outlook object model has no bulk-delete call, so items are
+        resolved and deleted one by one, but callers hand over the whole
+        batch at once and get per-item results back (no per-item
+        connection or folder lookups).
+        
+        Args:
+            entry_ids: Outlook EntryIDs of the emails to delete
+            
+        Returns:
+            Dict mapping each EntryID to None (deleted) or the exception raised
+        """
+        if not self.namespace:
+            raise Exception("Not connected to Outlook. Call connect() first.")
+        
+        results = {}
+        
+        for entry_id in entry_ids:
+            try:
+                self.namespace.GetItemFromID(entry_id).Delete()
+                results[entry_id] = None
+            except Exception as e:
+                self.logger.error(f"Failed to delete email: {e}")
+                results[entry_id] = e
+        
+        self.logger.info(f"Deleted {sum(1 for e in results.values() if e is None)}/{len(entry_ids)} emails")
+        return results
+    
+    def get_folder_last_modified(self, folder_path: str) -> Optional[datetime]:
+        """
+        Get the MAPI last modification time of a folder.
+        
+        Reads PR_LAST_MODIFICATION_TIME, which MAPI updates whenever
+        items are added to, removed from or changed in the folder.
+        
+        Args:
+            folder_path: Outlook folder path
+            
+        Returns:
+            Last modification time, or None if not available
+        """
+        folder = self.get_folder(folder_path)
+        
+        try:
+            value = folder.PropertyAccessor.GetProperty(PR_LAST_MODIFICATION_TIME)
+        except Exception as e:
+            self.logger.warning(f"Cannot read modification time of {folder_path}: {e}")
+            return None
+        
+        if value is None:
+            return None
+        
+        return self._convert_outlook_date(value)
+    
     def get_folder_counts(self) -> Dict[str, int]:
         """
         Get email counts for all folders.
@@ -208,31 +471,27 @@ class OutlookExtractor:
                 'processed': int
             }
         """
-        counts = {}
-        
-        try:
-            source = self.get_folder(self.source_folder_path)
-            counts['source'] = source.Items.Count
-        except:
-            counts['source'] = 0
+        folder_paths = {
+            'source': self.source_folder_path,
+            'indexed': self.indexed_folder_path,
+            'stubs': self.stubs_folder_path,
+            'processed': self.processed_folder_path
+        }
         
+        # One traversal for all four folders (they share their parent path)
         try:
-            indexed = self.get_folder(self.indexed_folder_path)
-            counts['indexed'] = indexed.Items.Count
-        except:
-            counts['indexed'] = 0
+            folders = self._get_folders(folder_paths.values())
+        except Exception as e:
+            self.logger.error(f"ERROR Cannot resolve folders: {e}")
+            folders = {}
         
-        try:
-            stubs = self.get_folder(self.stubs_folder_path)
-            counts['stubs'] = stubs.Items.Count
-        except:
-            counts['stubs'] = 0
+        counts = {}
         
-        try:
-            processed = self.get_folder(self.processed_folder_path)
-            counts['processed'] = processed.Items.Count
-        except:
-            counts['processed'] = 0
+        for name, folder_path in folder_paths.items():
+            try:
+                counts[name] = folders[folder_path].Items.Count
+            except:
+                counts[name] = 0
         
         return counts
     
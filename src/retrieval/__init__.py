@@ -1,13 +1,14 @@
 """
 Retrieval module for Bloomberg RAG system.
 
-Provides semantic search, temporal scoring, metadata filtering,
-and hybrid retrieval functionality.
+Provides semantic search, BM25 keyword search, temporal scoring,
+metadata filtering, and hybrid retrieval functionality.
 """
 
 from .semantic_retriever import SemanticRetriever, SearchResult
 from .temporal_scorer import TemporalScorer
 from .metadata_filter import MetadataFilter
+from .sparse_retriever import BM25Retriever
 from .hybrid_retriever import HybridRetriever, HybridSearchResult
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     'SearchResult',
     'TemporalScorer',
     'MetadataFilter',
+    'BM25Retriever',
     'HybridRetriever',
     'HybridSearchResult'
 ]
\ No newline at end of file
@@ -6,12 +6,14 @@ for comprehensive document retrieval.
 """
 
 import logging
+import numpy as np
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
 from src.retrieval.semantic_retriever import SemanticRetriever, SearchResult
 from src.retrieval.temporal_scorer import TemporalScorer
 from src.retrieval.metadata_filter import MetadataFilter
+from src.retrieval.sparse_retriever import BM25Retriever
 
 logger = logging.getLogger(__name__)
 
@@ -116,10 +118,16 @@ class HybridRetriever:
     Hybrid retrieval combining semantic, temporal, and metadata filtering.
     
     Pipeline:
-    1. Semantic search (get top-K candidates)
+    1. Semantic search (get top-K candidates), unioned with the BM25
+       top-K when a sparse retriever is set and fusion is 'rrf'
+       (BM25-only candidates are scored against the query embedding too)
     2. Apply metadata filters (optional)
     3. Calculate recency scores
-    4. Combine scores: final = (semantic * (1-w)) + (recency * w)
+    4. Combine scores:
+       - 'weighted': final = (semantic * (1-w)) + (recency * w)
+       - 'rrf': final = 1/(k + semantic_rank) + 1/(k + recency_rank)
+         [+ 1/(k + bm25_rank) for BM25 hits]
+         (Reciprocal Rank Fusion: scale-free, recency_weight is ignored)
     5. Re-rank by combined score
     
     Attributes:
@@ -127,14 +135,22 @@ class HybridRetriever:
         temporal_scorer: TemporalScorer instance
         metadata_filter: MetadataFilter instance
         default_recency_weight: Default weight for recency (0-1)
+        fusion: Default score fusion method ('weighted' or 'rrf')
+        rrf_k: RRF rank constant
+        sparse_retriever: Optional BM25Retriever for keyword candidates ('rrf' only)
     """
     
+    FUSION_METHODS = ('weighted', 'rrf')
+    
     def __init__(
         self,
         semantic_retriever: SemanticRetriever,
         temporal_scorer: Optional[TemporalScorer] = None,
         metadata_filter: Optional[MetadataFilter] = None,
-        default_recency_weight: float = 0.3
+        default_recency_weight: float = 0.3,
+        fusion: str = 'weighted',
+        rrf_k: int = 60,
+        sparse_retriever: Optional[BM25Retriever] = None
     ):
         """
         Initialize hybrid retriever.
@@ -144,10 +160,14 @@ class HybridRetriever:
             temporal_scorer: Optional TemporalScorer (default: 30-day halflife)
             metadata_filter: Optional MetadataFilter (default: new instance)
             default_recency_weight: Default weight for recency (default: 0.3)
+            fusion: Default score fusion, 'weighted' or 'rrf' (default: 'weighted')
+            rrf_k: RRF rank constant (default: 60)
+            sparse_retriever: Optional BM25Retriever, used with 'rrf' fusion
+                              (default: dense only)
             
         Raises:
             TypeError: If semantic_retriever has wrong type
-            ValueError: If default_recency_weight not in [0, 1]
+            ValueError: If default_recency_weight not in [0, 1] or fusion is unknown
         """
         if not isinstance(semantic_retriever, SemanticRetriever):
             raise TypeError("semantic_retriever must be SemanticRetriever instance")
@@ -157,6 +177,9 @@ class HybridRetriever:
                 f"default_recency_weight must be in [0, 1], got {default_recency_weight}"
             )
         
+        if fusion not in self.FUSION_METHODS:
+            raise ValueError(f"fusion must be one of {self.FUSION_METHODS}, got {fusion!r}")
+        
         self.semantic_retriever = semantic_retriever
         
         # Use provided or create default components
@@ -164,10 +187,13 @@ class HybridRetriever:
         self.metadata_filter = metadata_filter or MetadataFilter()
         
         self.default_recency_weight = default_recency_weight
+        self.fusion = fusion
+        self.rrf_k = rrf_k
+        self.sparse_retriever = sparse_retriever
         
         logger.info(
             f"HybridRetriever initialized: "
-            f"recency_weight={default_recency_weight}, "
+            f"recency_weight={default_recency_weight}, fusion={fusion}, "
             f"halflife={self.temporal_scorer.halflife_days} days"
         )
     
@@ -176,7 +202,9 @@ class HybridRetriever:
         query: str,
         top_k: int = 5,
         filters: Optional[Dict[str, Any]] = None,
-        recency_weight: Optional[float] = None
+        recency_weight: Optional[float] = None,
+        query_embedding: Optional[np.ndarray] = None,
+        fusion: Optional[str] = None
     ) -> List[HybridSearchResult]:
         """
         Perform hybrid search with semantic, temporal, and metadata components.
@@ -191,6 +219,9 @@ class HybridRetriever:
                 - 'tickers': list of tickers
             recency_weight: Weight for recency score (default: use default_recency_weight)
                            0.0 = pure semantic, 1.0 = pure recency
+            query_embedding: Optional precomputed embedding of query
+                            (passed through to the semantic retriever)
+            fusion: Score fusion method (default: self.fusion)
             
         Returns:
             List of HybridSearchResult objects, ordered by combined score
@@ -202,15 +233,7 @@ class HybridRetriever:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
         
-        if top_k <= 0:
-            raise ValueError(f"top_k must be positive, got {top_k}")
-        
-        # Use default recency weight if not specified
-        if recency_weight is None:
-            recency_weight = self.default_recency_weight
-        
-        if not 0 <= recency_weight <= 1:
-            raise ValueError(f"recency_weight must be in [0, 1], got {recency_weight}")
+        recency_weight, fusion = self._resolve_options(top_k, recency_weight, fusion)
         
         logger.info(
             f"Hybrid search: query='{query}', top_k={top_k}, "
@@ -222,82 +245,321 @@ class HybridRetriever:
             # Request 2x top_k to have buffer after filtering
             search_k = top_k * 2 if filters else top_k
             
-            semantic_results = self.semantic_retriever.search(
+            # The embedding is reused to score BM25-only candidates
+            if self._uses_sparse(fusion) and query_embedding is None:
+                query_embedding = self.semantic_retriever.embedding_generator.generate_single_embedding(query)
+            
+            # Candidates are kept as aligned columns; result objects are
+            # only built for the top_k that survive re-ranking
+            candidates = self.semantic_retriever.search_candidates(
                 query=query,
-                top_k=search_k
+                top_k=search_k,
+                query_embedding=query_embedding
             )
             
-            logger.debug(f"Semantic search returned {len(semantic_results)} results")
+            return self._rank_candidates(
+                query, query_embedding, candidates, top_k, search_k,
+                filters, recency_weight, fusion
+            )
             
-            if not semantic_results:
-                logger.warning("No semantic results found")
-                return []
+        except Exception as e:
+            logger.error(f"Hybrid search failed: {e}")
+            raise RuntimeError(f"Hybrid search failed: {e}")
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        recency_weight: Optional[float] = None,
+        fusion: Optional[str] = None
+    ) -> List[List[HybridSearchResult]]:
+        """
+        Perform hybrid search for several queries with shared settings.
+        
+        All queries are embedded in one batch and searched with a single
+        FAISS call; filtering and re-ranking then run per query as in search().
+        
+        Args:
+            queries: Search query strings
+            top_k: Number of results per query (default: 5)
+            filters: Optional metadata filters dict (see search())
+            recency_weight: Weight for recency score (default: use default_recency_weight)
+            fusion: Score fusion method (default: self.fusion)
             
-            # Step 2: Apply metadata filters (if specified)
-            if filters:
-                documents = [r.document for r in semantic_results]
-                matching_indices = self.metadata_filter.apply_filters(documents, filters)
-                
-                # Filter semantic results
-                semantic_results = [
-                    semantic_results[i] for i in matching_indices
-                ]
-                
-                logger.debug(
-                    f"After filtering: {len(semantic_results)} results remain"
-                )
-                
-                if not semantic_results:
-                    logger.warning("No results after filtering")
-                    return []
+        Returns:
+            One list of HybridSearchResult objects per query, in queries order
             
-            # Step 3: Calculate recency scores
-            documents = [r.document for r in semantic_results]
-            recency_scores = self.temporal_scorer.calculate_scores(documents)
+        Raises:
+            ValueError: If a query is empty or parameters are invalid
+            RuntimeError: If search fails
+        """
+        if not queries:
+            return []
+        
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+        
+        recency_weight, fusion = self._resolve_options(top_k, recency_weight, fusion)
+        
+        logger.info(
+            f"Hybrid batch search: {len(queries)} queries, top_k={top_k}, "
+            f"recency_weight={recency_weight}, filters={bool(filters)}"
+        )
+        
+        try:
+            search_k = top_k * 2 if filters else top_k
             
-            # Step 4: Combine scores
-            hybrid_results = []
+            query_embeddings = self.semantic_retriever.embedding_generator.generate_embeddings(
+                queries,
+                batch_size=64,
+                show_progress=False
+            )
+            all_candidates = self.semantic_retriever.search_candidates_batch(
+                queries,
+                top_k=search_k,
+                query_embeddings=query_embeddings
+            )
             
-            for semantic_result, recency_score in zip(semantic_results, recency_scores):
-                # Combined score = (semantic * (1-w)) + (recency * w)
-                semantic_score = semantic_result.score
-                combined_score = (
-                    semantic_score * (1.0 - recency_weight) +
-                    recency_score * recency_weight
+            return [
+                self._rank_candidates(
+                    query, query_embedding, candidates, top_k, search_k,
+                    filters, recency_weight, fusion
                 )
-                
-                # Create HybridSearchResult
-                hybrid_result = HybridSearchResult(
-                    document=semantic_result.document,
-                    score=semantic_score,
-                    distance=semantic_result.distance,
-                    rank=0,  # Will be set after re-ranking
-                    metadata_preview=semantic_result.metadata_preview,
-                    recency_score=recency_score,
-                    combined_score=combined_score,
-                    recency_weight=recency_weight
-                )
-                
-                hybrid_results.append(hybrid_result)
+                for query, query_embedding, candidates in zip(queries, query_embeddings, all_candidates)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Hybrid batch search failed: {e}")
+            raise RuntimeError(f"Hybrid batch search failed: {e}")
+    
+    def _resolve_options(
+        self,
+        top_k: int,
+        recency_weight: Optional[float],
+        fusion: Optional[str]
+    ):
+        """
+        Validate search options and fill in the defaults.
+        
+        Args:
+            top_k: Number of results to return
+            recency_weight: Recency weight or None (use default_recency_weight)
+            fusion: Fusion method or None (use self.fusion)
+            
+        Returns:
+            Tuple of (recency_weight, fusion)
+            
+        Raises:
+            ValueError: If any option is invalid
+        """
+        if top_k <= 0:
+            raise ValueError(f"top_k must be positive, got {top_k}")
+        
+        # Use default recency weight if not specified
+        if recency_weight is None:
+            recency_weight = self.default_recency_weight
+        
+        if not 0 <= recency_weight <= 1:
+            raise ValueError(f"recency_weight must be in [0, 1], got {recency_weight}")
+        
+        if fusion is None:
+            fusion = self.fusion
+        elif fusion not in self.FUSION_METHODS:
+            raise ValueError(f"fusion must be one of {self.FUSION_METHODS}, got {fusion!r}")
+        
+        return recency_weight, fusion
+    
+    def _rank_candidates(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray],
+        candidates: tuple,
+        top_k: int,
+        search_k: int,
+        filters: Optional[Dict[str, Any]],
+        recency_weight: float,
+        fusion: str
+    ) -> List[HybridSearchResult]:
+        """
+        Run steps 2-5 of the pipeline over one query's semantic candidates.
+        
+        Args:
+            query: Search query string
+            query_embedding: Query embedding (required with a sparse retriever)
+            candidates: (vector_ids, documents, distances, scores) from
+                        SemanticRetriever.search_candidates
+            top_k: Number of results to return
+            search_k: Number of candidates fetched per retriever
+            filters: Optional metadata filters dict
+            recency_weight: Weight for recency score
+            fusion: Score fusion method
+            
+        Returns:
+            List of HybridSearchResult objects, ordered by combined score
+        """
+        logger.debug(f"Semantic search returned {len(candidates[0])} results")
+        
+        # BM25 score per candidate (NaN = not a BM25 hit); only RRF ranks
+        # them, so weighted fusion keeps the pure semantic candidates
+        sparse_scores = None
+        if self._uses_sparse(fusion):
+            candidates, sparse_scores = self._add_sparse_candidates(
+                query, query_embedding, candidates, search_k
+            )
+        
+        vector_ids, documents, distances, semantic_scores = candidates
+        
+        if not documents:
+            logger.warning("No semantic results found")
+            return []
+        
+        # Step 2: Apply metadata filters (if specified)
+        if filters:
+            matching_indices = self.metadata_filter.apply_filters(documents, filters)
             
-            # Step 5: Re-rank by combined score
-            hybrid_results.sort(key=lambda x: x.combined_score, reverse=True)
+            # Filter candidates
+            vector_ids = [vector_ids[i] for i in matching_indices]
+            documents = [documents[i] for i in matching_indices]
+            distances = distances[matching_indices]
+            semantic_scores = semantic_scores[matching_indices]
+            if sparse_scores is not None:
+                sparse_scores = sparse_scores[matching_indices]
             
-            # Limit to top_k and update ranks
-            hybrid_results = hybrid_results[:top_k]
-            for rank, result in enumerate(hybrid_results, 1):
-                result.rank = rank
+            logger.debug(
+                f"After filtering: {len(documents)} results remain"
+            )
             
-            logger.info(
-                f"Hybrid search complete: {len(hybrid_results)} results "
-                f"(mean_combined={sum(r.combined_score for r in hybrid_results)/len(hybrid_results):.3f})"
+            if not documents:
+                logger.warning("No results after filtering")
+                return []
+        
+        # Step 3: Calculate recency scores (one vector op over all candidates)
+        recency_scores = self.temporal_scorer.calculate_scores_array(documents)
+        
+        # Step 4: Combine scores
+        semantic_scores = semantic_scores.astype(np.float64)
+        if fusion == 'rrf':
+            rankings = [semantic_scores, recency_scores]
+            if sparse_scores is not None:
+                rankings.append(sparse_scores)
+            combined_scores = self._rrf_scores(*rankings)
+        else:
+            # Combined score = (semantic * (1-w)) + (recency * w)
+            combined_scores = (
+                semantic_scores * (1.0 - recency_weight) +
+                recency_scores * recency_weight
             )
+        
+        # Step 5: Re-rank by combined score and keep top_k
+        # (stable, so ties keep semantic order as before; candidates are
+        # at most 2*top_k, so a full argsort is as cheap as argpartition)
+        top_indices = np.argsort(-combined_scores, kind='stable')[:top_k].tolist()
+        
+        # Create HybridSearchResult objects for the kept results only
+        get_metadata_preview = self.semantic_retriever._get_metadata_preview
+        hybrid_results = []
+        
+        for rank, i in enumerate(top_indices, 1):
+            document = documents[i]
+            hybrid_results.append(HybridSearchResult(
+                document=document,
+                score=float(semantic_scores[i]),
+                distance=float(distances[i]),
+                rank=rank,
+                metadata_preview=get_metadata_preview(document),
+                vector_id=vector_ids[i],
+                recency_score=float(recency_scores[i]),
+                combined_score=float(combined_scores[i]),
+                recency_weight=recency_weight
+            ))
+        
+        logger.info(
+            f"Hybrid search complete: {len(hybrid_results)} results "
+            f"(mean_combined={sum(r.combined_score for r in hybrid_results)/len(hybrid_results):.3f})"
+        )
+        
+        return hybrid_results
+    
+    def _uses_sparse(self, fusion: str) -> bool:
+        """Check whether BM25 candidates are added for this fusion method."""
+        return self.sparse_retriever is not None and fusion == 'rrf'
+    
+    def _add_sparse_candidates(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        candidates: tuple,
+        top_k: int
+    ):
+        """
+        Union the semantic candidates with the BM25 top_k.
+        
+        BM25-only documents are appended after the semantic hits, scored
+        against the query embedding so every candidate has a semantic score.
+        
+        Args:
+            query: Search query string
+            query_embedding: Query embedding
+            candidates: (vector_ids, documents, distances, scores) from
+                        SemanticRetriever.search_candidates
+            top_k: Number of BM25 candidates to fetch
             
-            return hybrid_results
+        Returns:
+            Tuple of (candidates, bm25_scores), bm25_scores aligned with
+            candidates and NaN where a candidate is not a BM25 hit
+        """
+        sparse_hits = dict(self.sparse_retriever.search(query, top_k=top_k))
+        
+        vector_ids, documents, distances, scores = candidates
+        seen = set(vector_ids)
+        extra_ids = [vector_id for vector_id in sparse_hits if vector_id not in seen]
+        if extra_ids:
+            extra_vector_ids, extra_documents, extra_distances, extra_scores = (
+                self.semantic_retriever.score_vector_ids(query_embedding, extra_ids)
+            )
+            vector_ids = vector_ids + extra_vector_ids
+            documents = documents + extra_documents
+            distances = np.concatenate([distances, extra_distances])
+            scores = np.concatenate([scores, extra_scores])
+        
+        logger.debug(
+            f"BM25 returned {len(sparse_hits)} results ({len(extra_ids)} not in semantic top-{top_k})"
+        )
+        
+        sparse_scores = np.fromiter(
+            (sparse_hits.get(vector_id, np.nan) for vector_id in vector_ids),
+            dtype=np.float64,
+            count=len(vector_ids)
+        )
+        
+        return (vector_ids, documents, distances, scores), sparse_scores
+    
+    def _rrf_scores(self, *rankings: np.ndarray) -> np.ndarray:
+        """
+        Reciprocal Rank Fusion of several rankings of the same candidates.
+        
+        Each ranking is a score array (higher is better); NaN entries are
+        left out of that ranking and contribute nothing. Ties keep
+        candidate order, so semantic ties keep the FAISS order.
+        
+        Args:
+            *rankings: Score arrays aligned with the candidates
             
-        except Exception as e:
-            logger.error(f"Hybrid search failed: {e}")
-            raise RuntimeError(f"Hybrid search failed: {e}")
+        Returns:
+            Array of RRF scores: sum over rankings of 1/(k + rank)
+        """
+        n = len(rankings[0])
+        positions = np.arange(1, n + 1, dtype=np.float64)
+        fused = np.zeros(n, dtype=np.float64)
+        
+        for scores in rankings:
+            ranked = ~np.isnan(scores)
+            ranks = np.empty(n, dtype=np.float64)
+            ranks[np.argsort(-np.where(ranked, scores, -np.inf), kind='stable')] = positions
+            fused += np.where(ranked, 1.0 / (self.rrf_k + ranks), 0.0)
+        
+        return fused
     
     def search_with_breakdown(
         self,
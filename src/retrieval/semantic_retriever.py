@@ -7,7 +7,7 @@ Handles query embedding, similarity search, score normalization, and result form
 
 import logging
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -29,12 +29,14 @@ class SearchResult:
         distance: Raw L2 distance from FAISS
         rank: Position in results (1-indexed)
         metadata_preview: Quick access to key metadata
+        vector_id: FAISS vector ID of the document (None if unknown)
     """
     document: Any  # EmailDocument or dict
     score: float
     distance: float
     rank: int
     metadata_preview: Dict[str, Any]
+    vector_id: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (excluding full document for brevity)."""
@@ -208,32 +210,35 @@ class SemanticRetriever:
         if isinstance(document, dict):
             bloomberg_metadata = document.get('bloomberg_metadata', {})
             if isinstance(bloomberg_metadata, dict):
+                get = bloomberg_metadata.get  # Bound once for the six lookups
                 return {
-                    'author': bloomberg_metadata.get('author'),
-                    'category': bloomberg_metadata.get('category'),
-                    'topics': bloomberg_metadata.get('topics', []),
-                    'people': bloomberg_metadata.get('people', []),
-                    'tickers': bloomberg_metadata.get('tickers', []),
-                    'story_id': bloomberg_metadata.get('story_id')
+                    'author': get('author'),
+                    'category': get('category'),
+                    'topics': get('topics', []),
+                    'people': get('people', []),
+                    'tickers': get('tickers', []),
+                    'story_id': get('story_id')
                 }
             return {}
         else:
             # EmailDocument object
-            if document.bloomberg_metadata:
+            bloomberg_metadata = document.bloomberg_metadata
+            if bloomberg_metadata:
                 return {
-                    'author': document.bloomberg_metadata.author,
-                    'category': document.bloomberg_metadata.category,
-                    'topics': document.bloomberg_metadata.topics or [],
-                    'people': document.bloomberg_metadata.people or [],
-                    'tickers': document.bloomberg_metadata.tickers or [],
-                    'story_id': document.bloomberg_metadata.story_id
+                    'author': bloomberg_metadata.author,
+                    'category': bloomberg_metadata.category,
+                    'topics': bloomberg_metadata.topics or [],
+                    'people': bloomberg_metadata.people or [],
+                    'tickers': bloomberg_metadata.tickers or [],
+                    'story_id': bloomberg_metadata.story_id
                 }
             return {}
     
     def search(
         self,
         query: str,
-        top_k: int = 5
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[SearchResult]:
         """
         Perform semantic search.
@@ -241,6 +246,8 @@ class SemanticRetriever:
         Args:
             query: Search query string
             top_k: Number of results to return (default: 5)
+            query_embedding: Optional precomputed embedding of query
+                            (skips the model forward pass when given)
             
         Returns:
             List of SearchResult objects sorted by score (highest first)
@@ -254,6 +261,50 @@ class SemanticRetriever:
             >>> for result in results:
             ...     print(f"{result.document.subject} (score: {result.score:.3f})")
         """
+        vector_ids, documents, distances, scores = self.search_candidates(
+            query, top_k=top_k, query_embedding=query_embedding
+        )
+        
+        return [
+            SearchResult(
+                document=document,
+                score=score,
+                distance=distance,
+                rank=rank,
+                metadata_preview=self._get_metadata_preview(document),
+                vector_id=vector_id
+            )
+            for rank, (vector_id, document, score, distance) in enumerate(
+                zip(vector_ids, documents, scores.tolist(), distances.tolist()), 1
+            )
+        ]
+    
+    def search_candidates(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Tuple[List[int], List[Any], np.ndarray, np.ndarray]:
+        """
+        Perform semantic search, returning columns instead of SearchResult objects.
+        
+        Used by HybridRetriever, which re-ranks the candidates and only
+        builds result objects (and metadata previews) for the ones it keeps.
+        
+        Args:
+            query: Search query string
+            top_k: Number of candidates to return (default: 5)
+            query_embedding: Optional precomputed embedding of query
+            
+        Returns:
+            Tuple of aligned (vector_ids, documents, distances, scores),
+            sorted by score (highest first); vector IDs without a document
+            in the metadata mapper are dropped
+            
+        Raises:
+            ValueError: If query is empty or top_k <= 0
+            RuntimeError: If search fails
+        """
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
         
@@ -263,48 +314,127 @@ class SemanticRetriever:
         logger.info(f"Searching for: '{query}' (top_k={top_k})")
         
         try:
-            # Step 1: Generate query embedding
-            query_embedding = self.embedding_generator.generate_single_embedding(query)
+            # Step 1: Generate query embedding (unless provided by the caller)
+            if query_embedding is None:
+                query_embedding = self.embedding_generator.generate_single_embedding(query)
             logger.debug(f"Generated query embedding: shape={query_embedding.shape}")
             
             # Step 2: Search FAISS
             distances, indices = self.vector_store.search(query_embedding, k=top_k)
             logger.debug(f"FAISS search returned {len(indices)} results")
             
-            # Step 3: Normalize distances to scores
-            scores = self._normalize_distances(distances)
-            
-            # Step 4: Retrieve documents and format results
-            results = []
-            for rank, (idx, score, distance) in enumerate(zip(indices, scores, distances), 1):
-                # Get document from metadata mapper
-                document = self.metadata_mapper.get_document(int(idx))
-                
-                if document is None:
-                    logger.warning(f"No document found for vector ID {idx}, skipping")
-                    continue
-                
-                # Create metadata preview
-                metadata_preview = self._get_metadata_preview(document)
-                
-                # Create SearchResult
-                result = SearchResult(
-                    document=document,
-                    score=float(score),
-                    distance=float(distance),
-                    rank=rank,
-                    metadata_preview=metadata_preview
-                )
-                
-                results.append(result)
+            # Step 3: Retrieve documents from the metadata mapper
+            candidates = self._collect_documents(indices.tolist(), distances)
             
-            logger.info(f"Search complete: returned {len(results)} results")
-            return results
+            logger.info(f"Search complete: returned {len(candidates[0])} results")
+            return candidates
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise RuntimeError(f"Semantic search failed: {e}")
     
+    def search_candidates_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        query_embeddings: Optional[np.ndarray] = None
+    ) -> List[Tuple[List[int], List[Any], np.ndarray, np.ndarray]]:
+        """
+        Semantic search for several queries: one embedding batch, one FAISS call.
+        
+        Args:
+            queries: Search query strings
+            top_k: Number of candidates per query (default: 5)
+            query_embeddings: Optional precomputed embeddings, shape (len(queries), dimension)
+            
+        Returns:
+            One search_candidates() tuple per query, in queries order
+            
+        Raises:
+            ValueError: If a query is empty or top_k <= 0
+            RuntimeError: If search fails
+        """
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+        
+        if top_k <= 0:
+            raise ValueError(f"top_k must be positive, got {top_k}")
+        
+        logger.info(f"Searching for {len(queries)} queries (top_k={top_k})")
+        
+        try:
+            if query_embeddings is None:
+                query_embeddings = self.embedding_generator.generate_embeddings(
+                    queries,
+                    batch_size=64,
+                    show_progress=False
+                )
+            
+            rows = self.vector_store.search_batch(query_embeddings, k=top_k)
+            
+            return [
+                self._collect_documents(indices.tolist(), distances)
+                for distances, indices in rows
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            raise RuntimeError(f"Semantic batch search failed: {e}")
+    
+    def score_vector_ids(
+        self,
+        query_embedding: np.ndarray,
+        vector_ids: List[int]
+    ) -> Tuple[List[int], List[Any], np.ndarray, np.ndarray]:
+        """
+        Score given documents against a query embedding.
+        
+        Used for candidates found by another retriever (e.g. BM25), so they
+        get the same L2 distance and normalized score as FAISS hits.
+        
+        Args:
+            query_embedding: Query embedding of shape (dimension,)
+            vector_ids: Vector IDs to score
+            
+        Returns:
+            Tuple of aligned (vector_ids, documents, distances, scores) in
+            vector_ids order, same columns as search_candidates()
+        """
+        vectors = self.vector_store.reconstruct(vector_ids)
+        distances = ((vectors - query_embedding.reshape(1, -1)) ** 2).sum(axis=1)
+        
+        return self._collect_documents(vector_ids, distances)
+    
+    def _collect_documents(
+        self,
+        vector_ids: List[int],
+        distances: np.ndarray
+    ) -> Tuple[List[int], List[Any], np.ndarray, np.ndarray]:
+        """
+        Look up documents for vector IDs and normalize their distances.
+        
+        Args:
+            vector_ids: Vector IDs (Python ints)
+            distances: L2 distances aligned with vector_ids
+            
+        Returns:
+            Tuple of aligned (vector_ids, documents, distances, scores),
+            without the IDs that have no document
+        """
+        get_document = self.metadata_mapper.get_document
+        documents = [get_document(idx) for idx in vector_ids]
+        
+        if None in documents:
+            keep = [i for i, document in enumerate(documents) if document is not None]
+            for i, idx in enumerate(vector_ids):
+                if documents[i] is None:
+                    logger.warning(f"No document found for vector ID {idx}, skipping")
+            vector_ids = [vector_ids[i] for i in keep]
+            documents = [documents[i] for i in keep]
+            distances = distances[keep]
+        
+        return vector_ids, documents, distances, self._normalize_distances(distances)
+    
     def get_index_stats(self) -> Dict[str, Any]:
         """
         Get statistics about indexed documents.
@@ -0,0 +1,265 @@
+"""
+Sparse (BM25) Retriever for Bloomberg RAG System.
+
+Keyword retrieval over email subject + body, complementing the dense
+FAISS search: exact tickers, names and rare terms rank well here even
+when the embedding model smooths them out.
+
+The corpus is tokenized once into an inverted index of numpy arrays
+(CSR layout: one slice of postings per term), persisted next to the
+FAISS index and reloaded while it is up to date; each query then only
+touches the postings of its own terms.
+"""
+
+import re
+import logging
+import numpy as np
+from pathlib import Path
+from itertools import count
+from collections import defaultdict
+from typing import List, Dict, Tuple, Any, Optional
+
+from src.vectorstore import MetadataMapper
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _get_document_text(doc: Any) -> str:
+    """Extract subject + body from document (handles both dict and EmailDocument)."""
+    if isinstance(doc, dict):
+        return f"{doc.get('subject') or ''}\n{doc.get('body') or ''}"
+    return f"{getattr(doc, 'subject', '') or ''}\n{getattr(doc, 'body', '') or ''}"
+
+
+class BM25Retriever:
+    """
+    Okapi BM25 keyword search over the documents of a MetadataMapper.
+    
+    Attributes:
+        metadata_mapper: MetadataMapper holding the indexed documents
+        k1: Term frequency saturation
+        b: Document length normalization
+        index_path: Persisted index (.npz), or None to keep it in memory only
+        source_path: Metadata mapper file the index is built from
+    """
+    
+    def __init__(
+        self,
+        metadata_mapper: MetadataMapper,
+        k1: float = 1.5,
+        b: float = 0.75,
+        index_path: Optional[str] = None,
+        source_path: Optional[str] = None
+    ):
+        """
+        Initialize BM25 retriever (the index is loaded or built on first search).
+        
+        Args:
+            metadata_mapper: Initialized MetadataMapper with documents
+            k1: Term frequency saturation (default: 1.5)
+            b: Document length normalization (default: 0.75)
+            index_path: Persisted index file; loaded when up to date,
+                        otherwise rebuilt and saved there (default: none)
+            source_path: Metadata mapper file; the persisted index is stale
+                         when it is older than this file (default: none)
+            
+        Raises:
+            TypeError: If metadata_mapper has wrong type
+        """
+        if not isinstance(metadata_mapper, MetadataMapper):
+            raise TypeError("metadata_mapper must be MetadataMapper instance")
+        
+        self.metadata_mapper = metadata_mapper
+        self.k1 = k1
+        self.b = b
+        self.index_path = Path(index_path) if index_path else None
+        self.source_path = Path(source_path) if source_path else None
+        
+        # Set by build_index(): postings of term _term_ids[t] are
+        # _positions/_tfs[_offsets[t]:_offsets[t + 1]]
+        self._vector_ids = None
+        self._term_ids: Dict[str, int] = {}
+        self._offsets = None
+        self._positions = None
+        self._tfs = None
+        self._idf = None
+        self._length_norm = None
+    
+    def build_index(self):
+        """
+        Load the persisted index if up to date, otherwise build and save it.
+        
+        Called on first search; sync calls it right after saving the
+        metadata mapper so that searches only load the file.
+        """
+        vector_ids = np.fromiter(
+            self.metadata_mapper.id_to_document.keys(),
+            dtype=np.int64,
+            count=self.metadata_mapper.size()
+        )
+        
+        if self.index_path is not None and self._is_fresh():
+            try:
+                if self._load_index(vector_ids):
+                    return
+            except Exception as e:
+                logger.warning(f"Could not load BM25 index from {self.index_path}: {e}")
+        
+        self._build_index(vector_ids)
+        
+        if self.index_path is not None:
+            try:
+                self._save_index()
+            except Exception as e:
+                logger.warning(f"Could not save BM25 index to {self.index_path}: {e}")
+    
+    def _is_fresh(self) -> bool:
+        """Check that the persisted index exists and is not older than source_path."""
+        if not self.index_path.exists():
+            return False
+        if self.source_path is None or not self.source_path.exists():
+            return True
+        return self.index_path.stat().st_mtime >= self.source_path.stat().st_mtime
+    
+    def _build_index(self, vector_ids: np.ndarray):
+        """
+        Tokenize the corpus into per-term postings.
+        
+        Tokens are mapped to term ids and (term, document) pairs are
+        counted with numpy, which yields the postings already grouped by
+        term. The per-document length normalization
+        k1 * (1 - b + b * len/avg_len) is precomputed as well.
+        
+        Args:
+            vector_ids: Vector ID of each document, in mapper order
+        """
+        # New terms get the next id on first lookup
+        vocabulary: Dict[str, int] = defaultdict(count().__next__)
+        get_term_id = vocabulary.__getitem__
+        term_ids = []
+        lengths = []
+        
+        for doc in self.metadata_mapper.id_to_document.values():
+            tokens = tokenize(_get_document_text(doc))
+            lengths.append(len(tokens))
+            term_ids.extend(map(get_term_id, tokens))
+        
+        n_docs = len(lengths)
+        n_terms = len(vocabulary)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        doc_positions = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        
+        # Sorted unique (term, document) keys: postings grouped by term
+        keys, tfs = np.unique(term_ids * max(n_docs, 1) + doc_positions, return_counts=True)
+        document_frequency = np.bincount(keys // max(n_docs, 1), minlength=n_terms)
+        
+        avg_length = lengths.mean() if n_docs and lengths.any() else 1.0
+        
+        self._vector_ids = vector_ids
+        self._term_ids = dict(vocabulary)
+        self._offsets = np.concatenate(([0], np.cumsum(document_frequency)))
+        self._positions = (keys % max(n_docs, 1)).astype(np.int32)
+        self._tfs = tfs.astype(np.int32)
+        self._idf = np.log(1.0 + (n_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+        self._length_norm = self.k1 * (1.0 - self.b + self.b * lengths / avg_length)
+        
+        logger.info(f"BM25 index built: {n_docs} documents, {n_terms} terms")
+    
+    def _save_index(self):
+        """Write the index arrays to index_path (terms as one newline-joined UTF-8 blob)."""
+        terms = '\n'.join(self._term_ids).encode('utf-8')
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'wb') as f:
+            np.savez(
+                f,
+                params=np.array([self.k1, self.b]),
+                vector_ids=self._vector_ids,
+                terms=np.frombuffer(terms, dtype=np.uint8),
+                offsets=self._offsets,
+                positions=self._positions,
+                tfs=self._tfs,
+                idf=self._idf,
+                length_norm=self._length_norm
+            )
+        
+        logger.info(f"Saved BM25 index to {self.index_path}")
+    
+    def _load_index(self, vector_ids: np.ndarray) -> bool:
+        """
+        Load the index arrays from index_path.
+        
+        Args:
+            vector_ids: Current vector IDs of the mapper, in mapper order
+            
+        Returns:
+            True if loaded; False if built for other documents or parameters
+        """
+        with np.load(self.index_path, allow_pickle=False) as data:
+            if not np.array_equal(data['params'], [self.k1, self.b]):
+                return False
+            if not np.array_equal(data['vector_ids'], vector_ids):
+                return False
+            
+            terms = data['terms'].tobytes().decode('utf-8')
+            self._term_ids = {term: i for i, term in enumerate(terms.split('\n'))} if terms else {}
+            self._vector_ids = vector_ids
+            self._offsets = data['offsets']
+            self._positions = data['positions']
+            self._tfs = data['tfs']
+            self._idf = data['idf']
+            self._length_norm = data['length_norm']
+        
+        logger.info(f"Loaded BM25 index from {self.index_path} ({len(self._term_ids)} terms)")
+        return True
+    
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[int, float]]:
+        """
+        Perform BM25 keyword search.
+        
+        Args:
+            query: Search query string
+            top_k: Number of results to return (default: 5)
+            
+        Returns:
+            List of (vector_id, bm25_score) tuples, best first; documents
+            sharing no term with the query are never returned
+        """
+        if self._vector_ids is None:
+            self.build_index()
+        
+        scores = np.zeros(len(self._vector_ids), dtype=np.float64)
+        
+        for term in set(tokenize(query)):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            positions = self._positions[start:end]
+            tfs = self._tfs[start:end]
+            scores[positions] += self._idf[term_id] * tfs * (self.k1 + 1.0) / (
+                tfs + self._length_norm[positions]
+            )
+        
+        matched = np.flatnonzero(scores)
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+        matched = matched[np.argsort(-scores[matched], kind='stable')]
+        
+        return list(zip(self._vector_ids[matched].tolist(), scores[matched].tolist()))
@@ -6,6 +6,7 @@ Implements exponential decay scoring based on article date to boost recent docum
 
 import logging
 import math
+import numpy as np
 from typing import List, Optional, Any, Union
 from datetime import datetime, timedelta
 
@@ -157,40 +158,79 @@ class TemporalScorer:
         
         return score
     
-    def calculate_scores(
+    def calculate_scores_array(
         self,
         documents: List[Any],
         reference_date: Optional[datetime] = None
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
-        Calculate recency scores for multiple documents.
+        Calculate recency scores for multiple documents in one vector op.
+        
+        Same formula as calculate_recency_score(), applied with NumPy over
+        the ages of all documents at once.
         
         Args:
             documents: List of documents (dict or EmailDocument)
             reference_date: Reference date for calculation (default: now)
             
         Returns:
-            List of recency scores (same order as input documents)
+            float64 array of recency scores (same order as input documents)
         """
         if not documents:
-            return []
+            return np.empty(0, dtype=np.float64)
         
-        scores = []
+        # Use current time as reference if not provided
+        if reference_date is None:
+            reference_date = datetime.now()
+        if reference_date.tzinfo is not None:
+            reference_date = reference_date.replace(tzinfo=None)
         
-        for doc in documents:
+        # Age in days (NaN = unknown date)
+        days_ago = np.full(len(documents), np.nan)
+        for i, doc in enumerate(documents):
             article_date = _get_document_date(doc)
-            score = self.calculate_recency_score(article_date, reference_date)
-            scores.append(score)
+            if article_date is not None:
+                if article_date.tzinfo is not None:
+                    article_date = article_date.replace(tzinfo=None)
+                days_ago[i] = (reference_date - article_date).total_seconds() / 86400.0
+        
+        unknown = np.isnan(days_ago)
+        future = days_ago < 0
+        
+        # Exponential decay: score = exp(-ln(2) * days_ago / halflife)
+        scores = np.exp(-self._decay_constant * days_ago)
+        np.clip(scores, 0.0, 1.0, out=scores)
+        scores[future] = 1.0
+        scores[unknown] = self.default_score
         
-        if scores:
-            logger.debug(
-                f"Calculated recency scores for {len(documents)} documents: "
-                f"mean={sum(scores)/len(scores):.3f}, "
-                f"min={min(scores):.3f}, max={max(scores):.3f}"
-            )
+        if future.any():
+            logger.warning(f"{int(future.sum())} article dates are in the future")
+        
+        logger.debug(
+            f"Calculated recency scores for {len(documents)} documents: "
+            f"mean={scores.mean():.3f}, "
+            f"min={scores.min():.3f}, max={scores.max():.3f}"
+        )
         
         return scores
     
+    def calculate_scores(
+        self,
+        documents: List[Any],
+        reference_date: Optional[datetime] = None
+    ) -> List[float]:
+        """
+        Calculate recency scores for multiple documents.
+        
+        Args:
+            documents: List of documents (dict or EmailDocument)
+            reference_date: Reference date for calculation (default: now)
+            
+        Returns:
+            List of recency scores (same order as input documents)
+        """
+        return self.calculate_scores_array(documents, reference_date).tolist()
+    
     def get_score_at_age(self, days_ago: float) -> float:
         """
         Get theoretical score for document of given age.
@@ -3,7 +3,7 @@ Stub matcher module for matching complete emails with pending stubs.
 Handles stub completion and cleanup via Story ID or fingerprint matching.
 """
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List, Dict
 from datetime import datetime
 import logging
 
@@ -147,6 +147,61 @@ class StubMatcher:
             self.logger.error(f"Error completing stub: {e}", exc_info=True)
             return False
     
+    def complete_stubs(self, stub_entries: List[StubEntry], outlook_extractor) -> Dict[str, bool]:
+        """
+        Complete several stubs: move them to /processed/ and update registry.
+        
+        Same workflow as complete_stub(), batched: /processed/ is resolved
+        once for all moves and the registry is saved once at the end.
+        
+        Args:
+            stub_entries: StubEntry objects to complete
+            outlook_extractor: OutlookExtractor instance for moving emails
+            
+        Returns:
+            Dict mapping each stub's original EntryID to True if completed
+        """
+        results = {}
+        
+        try:
+            moves = outlook_extractor.move_emails_batch(
+                [stub.outlook_entry_id for stub in stub_entries],
+                outlook_extractor.processed_folder_path
+            )
+        except Exception as e:
+            self.logger.error(f"Error moving stubs to /processed/: {e}", exc_info=True)
+            return {stub.outlook_entry_id: False for stub in stub_entries}
+        
+        for stub_entry in stub_entries:
+            entry_id = stub_entry.outlook_entry_id
+            success, new_entry_id = moves.get(entry_id, (False, None))
+            
+            if not success:
+                self.logger.error(f"Failed to move stub to /processed/: {stub_entry.subject[:50]}...")
+                results[entry_id] = False
+                continue
+            
+            if new_entry_id:
+                self.logger.debug(f"Stub moved, new EntryID: {new_entry_id}")
+            
+            # Update registry status in memory (saved once below)
+            results[entry_id] = self.registry.update_status(
+                outlook_entry_id=entry_id,
+                new_status="completed",
+                completed_at=datetime.now(),
+                persist=False
+            )
+            
+            if results[entry_id]:
+                self.logger.info(f"OK Completed stub: {stub_entry.subject[:50]}...")
+            else:
+                self.logger.error(f"Failed to update registry: {stub_entry.subject[:50]}...")
+        
+        if any(results.values()):
+            self.registry.save()
+        
+        return results
+    
     def move_stub_to_processed(self, outlook_entry_id: str, outlook_extractor) -> Tuple[bool, Optional[str]]:
         """
         Move stub email from /stubs/ to /processed/ folder.
@@ -5,15 +5,28 @@ Manages stub_registry.json for matching stubs with complete emails.
 
 import json
 import re
+import sys
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime
 import logging
 
+import numpy as np
+
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import models
 from src.models import EmailDocument, StubEntry, BloombergMetadata
 
 
+# Bloomberg subject prefix, e.g. "(BN) ", "(BI) " (see normalize_subject)
+_BLOOMBERG_PREFIX_PATTERN = re.compile(r'^\([A-Z]+\)\s*')
+
+
 class StubRegistry:
     """
     Registry for tracking stub emails.
@@ -53,6 +66,10 @@ class StubRegistry:
         self.stubs: List[StubEntry] = []
         self.logger = logging.getLogger(__name__)
         
+        # received_time column (datetime64[s], parallel to self.stubs),
+        # built lazily and reset whenever stubs are added or removed
+        self._received_ts_arr: Optional[np.ndarray] = None
+        
         # Load existing registry if available
         if self.registry_path.exists():
             self.load()
@@ -80,6 +97,7 @@ class StubRegistry:
         
         # Add to registry
         self.stubs.append(stub_entry)
+        self._received_ts_arr = None
         
         self.logger.info(f"Added stub to registry: {stub_entry.subject[:50]}...")
         
@@ -88,6 +106,39 @@ class StubRegistry:
         
         return True
     
+    def bulk_register(self, stub_entries: Iterable[StubEntry]) -> int:
+        """
+        Add many stubs to registry, keeping their status, and save once.
+        
+        Entries whose outlook_entry_id is already registered are skipped.
+        
+        Args:
+            stub_entries: StubEntry objects to add
+            
+        Returns:
+            Number of stubs added
+        """
+        known_ids = {stub.outlook_entry_id for stub in self.stubs}
+        added = 0
+        
+        for stub_entry in stub_entries:
+            if stub_entry.outlook_entry_id in known_ids:
+                self.logger.warning(f"Stub already exists: {stub_entry.outlook_entry_id}")
+                continue
+            
+            known_ids.add(stub_entry.outlook_entry_id)
+            self.stubs.append(stub_entry)
+            added += 1
+        
+        self._received_ts_arr = None
+        
+        self.logger.info(f"Registered {added} stubs")
+        
+        # Save to disk
+        self.save()
+        
+        return added
+    
     def get_stub_by_id(self, outlook_entry_id: str) -> Optional[StubEntry]:
         """
         Get stub by Outlook EntryID.
@@ -149,7 +200,8 @@ class StubRegistry:
         return None
     
     def update_status(self, outlook_entry_id: str, new_status: str, 
-                     completed_at: Optional[datetime] = None) -> bool:
+                     completed_at: Optional[datetime] = None,
+                     persist: bool = True) -> bool:
         """
         Update stub status (pending to completed).
         
@@ -157,6 +209,7 @@ class StubRegistry:
             outlook_entry_id: Unique Outlook identifier
             new_status: New status ("completed")
             completed_at: Completion timestamp (default: now)
+            persist: If False, only update in memory (caller saves once)
             
         Returns:
             True if updated, False if stub not found
@@ -173,7 +226,8 @@ class StubRegistry:
         self.logger.info(f"Updated stub status to '{new_status}': {stub.subject[:50]}...")
         
         # Save to disk
-        self.save()
+        if persist:
+            self.save()
         
         return True
     
@@ -210,6 +264,34 @@ class StubRegistry:
         
         return True
     
+    def remove_stubs(self, outlook_entry_ids: Iterable[str], persist: bool = False) -> int:
+        """
+        Remove several stubs from registry in memory.
+        
+        Callers removing stubs in bulk should call save() once when done
+        (or pass persist=True) instead of writing the registry per stub.
+        
+        Args:
+            outlook_entry_ids: Outlook EntryIDs of the stubs to remove
+            persist: If True, save registry to disk after removal
+            
+        Returns:
+            Number of stubs removed
+        """
+        ids_to_remove = set(outlook_entry_ids)
+        
+        before = len(self.stubs)
+        self.stubs = [stub for stub in self.stubs if stub.outlook_entry_id not in ids_to_remove]
+        self._received_ts_arr = None
+        removed = before - len(self.stubs)
+        
+        self.logger.info(f"Removed {removed} stubs from registry")
+        
+        if persist:
+            self.save()
+        
+        return removed
+    
     def get_all_pending(self) -> List[StubEntry]:
         """
         Get all stubs with "pending" status.
@@ -219,6 +301,47 @@ class StubRegistry:
         """
         return [stub for stub in self.stubs if stub.status == "pending"]
     
+    def _received_ts_column(self) -> np.ndarray:
+        """
+        Get received times of all stubs as a datetime64[s] array.
+        
+        Built from StubEntry.received_ts (epoch seconds); stubs without a
+        received time are NaT, which never compares as older.
+        
+        Returns:
+            Array parallel to self.stubs
+        """
+        if self._received_ts_arr is None or len(self._received_ts_arr) != len(self.stubs):
+            nat = np.iinfo(np.int64).min
+            self._received_ts_arr = np.fromiter(
+                (nat if stub.received_ts is None else stub.received_ts for stub in self.stubs),
+                dtype=np.int64,
+                count=len(self.stubs)
+            ).view('datetime64[s]')
+        
+        return self._received_ts_arr
+    
+    def get_pending_older_than(self, cutoff: datetime) -> List[StubEntry]:
+        """
+        Get pending stubs received before a cutoff date.
+        
+        The date filter is a single vectorized comparison on the
+        received time column; status is only checked on the old ones.
+        
+        Args:
+            cutoff: Cutoff date (stubs received strictly before it match)
+            
+        Returns:
+            List of pending StubEntry objects older than cutoff
+        """
+        cutoff_ts = np.datetime64(int(cutoff.timestamp()), 's')
+        old_indices = np.nonzero(self._received_ts_column() < cutoff_ts)[0]
+        
+        return [
+            stub for stub in (self.stubs[i] for i in old_indices.tolist())
+            if stub.status == "pending"
+        ]
+    
     def get_all_completed(self) -> List[StubEntry]:
         """
         Get all stubs with "completed" status.
@@ -249,6 +372,7 @@ class StubRegistry:
     def clear(self) -> None:
         """Clear all stubs from registry."""
         self.stubs.clear()
+        self._received_ts_arr = None
         self.save()
         self.logger.info("Cleared registry")
     
@@ -267,8 +391,11 @@ class StubRegistry:
             data = [stub.to_dict() for stub in self.stubs]
             
             # Write to file
-            with open(self.registry_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                self.registry_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.registry_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
             self.logger.debug(f"Saved registry: {len(self.stubs)} stubs")
             return True
@@ -289,12 +416,23 @@ class StubRegistry:
                 self.logger.info("No existing registry found, starting fresh")
                 return False
             
-            with open(self.registry_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(self.registry_path.read_bytes())
+            else:
+                with open(self.registry_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Convert from dict to StubEntry objects
             self.stubs = [StubEntry.from_dict(entry) for entry in data]
             
+            # Intern matching keys: duplicates share one string object
+            for stub in self.stubs:
+                if stub.story_id:
+                    stub.story_id = sys.intern(stub.story_id)
+                if stub.fingerprint:
+                    stub.fingerprint = sys.intern(stub.fingerprint)
+            self._received_ts_arr = None
+            
             self.logger.info(f"Loaded registry: {len(self.stubs)} stubs")
             return True
             
@@ -329,8 +467,13 @@ class StubRegistry:
         Returns:
             Normalized subject without Bloomberg prefix
         """
-        normalized = re.sub(r'^\([A-Z]+\)\s*', '', subject)
-        return normalized.strip()
+        # Prefixes always start with "(": skip the regex for other subjects
+        if subject.startswith('('):
+            match = _BLOOMBERG_PREFIX_PATTERN.match(subject)
+            if match:
+                subject = subject[match.end():]
+        
+        return subject.strip()
     
     @staticmethod
     def create_fingerprint(subject: str, received_date: datetime) -> str:
@@ -360,11 +503,11 @@ class StubRegistry:
         Returns:
             Fingerprint string
         """
-        # Normalize subject (remove Bloomberg prefix)
-        normalized_subject = StubRegistry.normalize_subject(subject)
-        
-        # Create fingerprint
-        subject_clean = normalized_subject.lower().strip()
-        date_str = received_date.strftime("%Y%m%d")
-        
-        return f"{subject_clean}_{date_str}"
\ No newline at end of file
+        # Normalize subject (remove Bloomberg prefix; already stripped)
+        subject_clean = StubRegistry.normalize_subject(subject).lower()
+        
+        # Create fingerprint (YYYYMMDD formatted directly, no strftime parsing)
+        return (
+            f"{subject_clean}_"
+            f"{received_date.year:04d}{received_date.month:02d}{received_date.day:02d}"
+        )
\ No newline at end of file
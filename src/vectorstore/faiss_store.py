@@ -2,13 +2,15 @@
 FAISS Vector Store for Bloomberg RAG System.
 
 Wrapper around FAISS IndexFlatL2 for efficient semantic search.
-Handles vector addition, search, and persistence.
+Handles vector addition, search, and persistence, with an optional
+HNSW graph for sub-linear search on large indices.
 """
 
+import json
 import logging
 import numpy as np
 import faiss
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,11 @@ class FAISSVectorStore:
         self.dimension = dimension
         self.index: Optional[faiss.IndexFlatL2] = None
         
+        # Optional HNSW graph over the same vectors (see enable_hnsw)
+        self.hnsw_index: Optional[faiss.IndexHNSWFlat] = None
+        self.hnsw_candidates: Optional[int] = None
+        self._source_path: Optional[Path] = None
+        
         # Initialize empty index
         self._initialize_index()
         
@@ -105,6 +112,9 @@ class FAISSVectorStore:
             old_size = self.get_index_size()
             
             self.index.add(embeddings)
+            if self.hnsw_index is not None:
+                # Keep the graph in sync with the flat index
+                self.hnsw_index.add(embeddings)
             
             new_size = self.get_index_size()
             logger.info(f"Added {n_vectors} vectors to index (size: {old_size} to {new_size})")
@@ -140,6 +150,43 @@ class FAISSVectorStore:
             >>> distances, indices = store.search(query_vector, k=5)
             >>> print(f"Top result ID: {indices[0]}, distance: {distances[0]}")
         """
+        # Handle single vector (1D array)
+        if query_vector.ndim == 1:
+            query_vector = query_vector.reshape(1, -1)
+        
+        # Validate shape
+        if query_vector.shape != (1, self.dimension):
+            raise ValueError(
+                f"Query vector must have shape (1, {self.dimension}), "
+                f"got {query_vector.shape}"
+            )
+        
+        # Return flattened arrays (we only have 1 query)
+        return self.search_batch(query_vector, k)[0]
+    
+    def search_batch(
+        self,
+        query_vectors: np.ndarray,
+        k: int = 5
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Search k nearest neighbors for several queries in one FAISS call.
+        
+        One call over a (n_queries, dimension) matrix lets FAISS compute
+        all distances with a single matrix product instead of one scan per
+        query.
+        
+        Args:
+            query_vectors: Query embeddings of shape (n_queries, dimension)
+            k: Number of nearest neighbors to return per query
+            
+        Returns:
+            List with one (distances, indices) tuple per query, as search()
+            
+        Raises:
+            ValueError: If query_vectors shape is invalid or k is invalid
+            RuntimeError: If index is empty or search fails
+        """
         # Validate k
         if k <= 0:
             raise ValueError(f"k must be positive, got {k}")
@@ -151,38 +198,151 @@ class FAISSVectorStore:
         # Limit k to index size
         k = min(k, index_size)
         
-        # Handle single vector (1D array)
-        if query_vector.ndim == 1:
-            query_vector = query_vector.reshape(1, -1)
-        
         # Validate shape
-        if query_vector.shape != (1, self.dimension):
+        if query_vectors.ndim != 2 or query_vectors.shape[1] != self.dimension:
             raise ValueError(
-                f"Query vector must have shape (1, {self.dimension}), "
-                f"got {query_vector.shape}"
+                f"Query vectors must have shape (n, {self.dimension}), "
+                f"got {query_vectors.shape}"
             )
         
         # Validate dtype
-        if query_vector.dtype != np.float32:
-            logger.debug("Converting query vector to float32")
-            query_vector = query_vector.astype(np.float32)
+        if query_vectors.dtype != np.float32:
+            logger.debug("Converting query vectors to float32")
+            query_vectors = query_vectors.astype(np.float32)
         
         try:
-            # Search returns (distances, indices) each of shape (n_queries, k)
-            distances, indices = self.index.search(query_vector, k)
+            if self.hnsw_index is not None:
+                return self._search_hnsw(query_vectors, k)
             
-            # Return flattened arrays (we only have 1 query)
-            distances = distances[0]  # Shape: (k,)
-            indices = indices[0]      # Shape: (k,)
+            # Search returns (distances, indices) each of shape (n_queries, k)
+            distances, indices = self.index.search(query_vectors, k)
             
-            logger.debug(f"Search returned {len(indices)} results (k={k})")
+            logger.debug(f"Search returned {indices.shape[0]} x {indices.shape[1]} results (k={k})")
             
-            return distances, indices
+            return list(zip(distances, indices))
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise RuntimeError(f"FAISS search failed: {e}")
     
+    def _search_hnsw(
+        self,
+        query_vectors: np.ndarray,
+        k: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Approximate search through the HNSW graph.
+        
+        Fetches a wider shortlist (hnsw_candidates, default 4*k) and keeps
+        the k closest: IndexHNSWFlat stores the full vectors, so shortlist
+        distances are already exact L2 and the cut is an exact re-rank.
+        
+        Args:
+            query_vectors: Query embeddings of shape (n_queries, dimension), float32
+            k: Number of nearest neighbors to return
+            
+        Returns:
+            List of (distances, indices) tuples, same as search_batch()
+        """
+        candidates = min(max(k, self.hnsw_candidates or 4 * k), self.get_index_size())
+        
+        hnsw = self.hnsw_index.hnsw
+        if hnsw.efSearch < candidates:
+            hnsw.efSearch = candidates
+        
+        distances, indices = self.hnsw_index.search(query_vectors, candidates)
+        
+        # Results are sorted by distance; -1 marks unfilled slots
+        results = []
+        for row_distances, row_indices in zip(distances, indices):
+            found = row_indices >= 0
+            results.append((row_distances[found][:k], row_indices[found][:k]))
+        
+        logger.debug(f"HNSW search returned {len(results)} result lists (k={k}, candidates={candidates})")
+        
+        return results
+    
+    def enable_hnsw(
+        self,
+        path: str,
+        m: int = 32,
+        candidates: Optional[int] = None,
+        build: bool = True
+    ):
+        """
+        Route searches through an HNSW graph built over the flat index.
+        
+        The graph is loaded from path when it is up to date (same vector
+        count, not older than the flat index file); otherwise it is built
+        from the flat vectors and saved to path, unless build is False.
+        
+        Args:
+            path: File path of the persisted HNSW index
+            m: HNSW graph degree (neighbors per node)
+            candidates: Shortlist size re-ranked per query (default: 4*k)
+            build: Build the graph when path holds no up-to-date one
+                (False: raise instead, e.g. for read-only searches)
+            
+        Raises:
+            RuntimeError: If the index is empty or the graph cannot be
+                loaded (build=False) or built
+        """
+        if self.is_empty():
+            raise RuntimeError("Cannot build HNSW graph over an empty index")
+        
+        path_obj = Path(path)
+        size = self.get_index_size()
+        hnsw_index = None
+        
+        is_fresh = path_obj.exists() and (
+            self._source_path is None
+            or not self._source_path.exists()
+            or path_obj.stat().st_mtime >= self._source_path.stat().st_mtime
+        )
+        if is_fresh:
+            try:
+                hnsw_index = faiss.read_index(str(path_obj))
+                if hnsw_index.ntotal != size or hnsw_index.d != self.dimension:
+                    hnsw_index = None
+            except Exception as e:
+                logger.warning(f"Could not load HNSW index from {path}: {e}")
+                hnsw_index = None
+        
+        if hnsw_index is None and not build:
+            raise RuntimeError(f"No up-to-date HNSW index at {path}")
+        
+        if hnsw_index is None:
+            try:
+                logger.info(f"Building HNSW index over {size} vectors (M={m})...")
+                hnsw_index = faiss.IndexHNSWFlat(self.dimension, m)
+                hnsw_index.add(self.index.reconstruct_n(0, size))
+                
+                path_obj.parent.mkdir(parents=True, exist_ok=True)
+                faiss.write_index(hnsw_index, str(path_obj))
+                logger.info(f"Saved HNSW index to {path}")
+                
+            except Exception as e:
+                logger.error(f"Failed to build HNSW index: {e}")
+                raise RuntimeError(f"Could not build HNSW index: {e}")
+        
+        self.hnsw_index = hnsw_index
+        self.hnsw_candidates = candidates
+    
+    def reconstruct(self, vector_ids: List[int]) -> np.ndarray:
+        """
+        Fetch stored vectors by ID.
+        
+        Args:
+            vector_ids: Vector IDs to fetch
+            
+        Returns:
+            Array of shape (len(vector_ids), dimension), float32
+        """
+        if not vector_ids:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        
+        return np.vstack([self.index.reconstruct(int(i)) for i in vector_ids])
+    
     def get_index_size(self) -> int:
         """
         Get the number of vectors currently in the index.
@@ -201,10 +361,53 @@ class FAISSVectorStore:
         """
         return self.get_index_size() == 0
     
+    @staticmethod
+    def meta_path(path: str) -> Path:
+        """
+        Path of the sidecar file holding the index size and dimension.
+        
+        Args:
+            path: Index file path
+            
+        Returns:
+            Path next to the index (e.g. data/faiss_index.meta.json)
+        """
+        return Path(path).with_suffix('.meta.json')
+    
+    @staticmethod
+    def read_meta(path: str) -> Optional[dict]:
+        """
+        Read index size and dimension without loading the index.
+        
+        The sidecar is written by save(); it is ignored when it is older
+        than the index file (e.g. the index was written by another tool).
+        
+        Args:
+            path: Index file path
+            
+        Returns:
+            Dictionary with 'size' and 'dimension', or None if unavailable
+        """
+        meta_path = FAISSVectorStore.meta_path(path)
+        
+        try:
+            if meta_path.stat().st_mtime < Path(path).stat().st_mtime:
+                return None
+            
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            
+            return {'size': int(meta['size']), 'dimension': int(meta['dimension'])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
     def save(self, path: str):
         """
         Save index to disk.
         
+        A sidecar <name>.meta.json with the index size and dimension is
+        written next to it (see read_meta).
+        
         Args:
             path: File path to save index (will create parent dirs if needed)
             
@@ -222,6 +425,10 @@ class FAISSVectorStore:
             # Save index
             faiss.write_index(self.index, str(path))
             
+            # Sidecar written after the index, so its mtime is never older
+            with open(self.meta_path(path), 'w', encoding='utf-8') as f:
+                json.dump({'size': self.get_index_size(), 'dimension': self.dimension}, f)
+            
             logger.info(f"Saved FAISS index to {path} ({self.get_index_size()} vectors)")
             
         except Exception as e:
@@ -229,13 +436,16 @@ class FAISSVectorStore:
             raise RuntimeError(f"Could not save FAISS index: {e}")
     
     @classmethod
-    def load(cls, path: str, dimension: int) -> 'FAISSVectorStore':
+    def load(cls, path: str, dimension: int, mmap: bool = False) -> 'FAISSVectorStore':
         """
         Load index from disk.
         
         Args:
             path: File path to load index from
             dimension: Expected dimension of vectors (for validation)
+            mmap: Memory-map the index read-only instead of reading it into RAM
+                  (pages are shared through the OS cache across processes;
+                  the loaded store cannot be modified)
             
         Returns:
             Loaded FAISSVectorStore instance
@@ -255,7 +465,10 @@ class FAISSVectorStore:
         
         try:
             # Load index
-            index = faiss.read_index(str(path))
+            if mmap:
+                index = faiss.read_index(str(path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            else:
+                index = faiss.read_index(str(path))
             
             # Validate dimension
             if index.d != dimension:
@@ -267,6 +480,7 @@ class FAISSVectorStore:
             # Create instance and assign loaded index
             store = cls(dimension)
             store.index = index
+            store._source_path = path_obj
             
             logger.info(f"Loaded FAISS index from {path} ({store.get_index_size()} vectors)")
             
@@ -284,6 +498,7 @@ class FAISSVectorStore:
         """
         old_size = self.get_index_size()
         self._initialize_index()
+        self.hnsw_index = None
         logger.warning(f"Reset index (deleted {old_size} vectors)")
     
     def __repr__(self) -> str:
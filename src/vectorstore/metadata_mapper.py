@@ -7,10 +7,16 @@ Uses JSON serialization instead of pickle to avoid pywintypes.datetime issues.
 
 import json
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Iterator, Tuple
 from datetime import datetime
 import logging
 
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.models import EmailDocument
 
 
@@ -208,6 +214,43 @@ class MetadataMapper:
             mapper.logger.error(f"Failed to load mapper from {path}: {e}")
             raise RuntimeError(f"Could not load metadata mapper: {e}")
     
+    @staticmethod
+    def iter_bloomberg_metadata(
+        path: str,
+        fields: Tuple[str, ...] = ('topics', 'author')
+    ) -> Iterator[tuple]:
+        """
+        Stream selected Bloomberg metadata fields from a saved mapper file.
+        
+        For aggregations (e.g. status top topics/authors) that only need a
+        few fields: no MetadataMapper is built, so no vector_id conversion
+        and no document index kept alive after the scan.
+        
+        Args:
+            path: Path to JSON file written by save()
+            fields: bloomberg_metadata keys to project
+            
+        Yields:
+            Tuple of the field values per document (None where missing)
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        path_obj = Path(path)
+        if not path_obj.exists():
+            raise FileNotFoundError(f"Metadata mapper file not found: {path}")
+        
+        if orjson is not None:
+            json_mapping = orjson.loads(path_obj.read_bytes())
+        else:
+            with open(path_obj, 'r', encoding='utf-8') as f:
+                json_mapping = json.load(f)
+        
+        for doc_dict in json_mapping.values():
+            bloomberg_metadata = doc_dict.get('bloomberg_metadata') or {}
+            get = bloomberg_metadata.get
+            yield tuple(get(field) for field in fields)
+    
     def clear(self) -> None:
         """Clear all document mappings."""
         self.id_to_document.clear()
@@ -183,11 +183,15 @@ class RetrievalToolkit:
             logger.info("Loading hybrid retriever...")
             if HybridRetriever is not None:
                 recency_weight = self.retrieval_config.recency_weight if self.retrieval_config else 0.3
+                fusion = self.retrieval_config.score_fusion if self.retrieval_config else 'weighted'
+                rrf_k = self.retrieval_config.rrf_k if self.retrieval_config else 60
                 self._retriever = HybridRetriever(
                     semantic_retriever=self.semantic_retriever,
                     temporal_scorer=self.temporal_scorer,
                     metadata_filter=self.metadata_filter,
-                    default_recency_weight=recency_weight
+                    default_recency_weight=recency_weight,
+                    fusion=fusion,
+                    rrf_k=rrf_k
                 )
             else:
                 raise RuntimeError("HybridRetriever not available")